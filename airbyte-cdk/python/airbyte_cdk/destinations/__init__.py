@@ -1,3 +1,4 @@
+from .buffered import BufferedDestination
 from .destination import Destination
 
-__all__ = ["Destination"]
+__all__ = ["BufferedDestination", "Destination"]
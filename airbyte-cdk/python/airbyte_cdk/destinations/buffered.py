@@ -0,0 +1,205 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from airbyte_cdk.destinations.destination import Destination
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
+
+
+class _StreamBuffer:
+    """Records of one stream waiting to be flushed, with their estimated size and the time the first one was buffered"""
+
+    def __init__(self):
+        self.records: List[AirbyteRecordMessage] = []
+        self.size_bytes = 0
+        self.started_at = 0.0
+
+    def append(self, record: AirbyteRecordMessage, size_bytes: int):
+        if not self.records:
+            self.started_at = time.monotonic()
+        self.records.append(record)
+        self.size_bytes += size_bytes
+
+    def take(self) -> List[AirbyteRecordMessage]:
+        records, self.records, self.size_bytes = self.records, [], 0
+        return records
+
+
+class _FlushPipeline:
+    """
+    Runs flushes on a thread pool and releases state messages once every flush submitted before them succeeded.
+
+    Submitting blocks while max_pending flushes are not finished. The first exception raised by a flush is re-raised to the caller
+    by the next submit, state or drain call, and flushes which did not start yet are cancelled on close.
+    """
+
+    def __init__(self, flush: Callable[[str, List[AirbyteRecordMessage]], None], max_workers: int, max_pending: int):
+        self.flush = flush
+        self.max_pending = max(max_pending, 1)
+        self._executor = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+        # flushes in submission order, until they and all earlier flushes succeeded
+        self._flushes: Deque[Future] = deque()
+        self._submitted = 0
+        self._completed = 0
+        # state messages with the number of flushes submitted before them
+        self._states: Deque[Tuple[int, AirbyteMessage]] = deque()
+
+    def submit(self, stream: str, records: List[AirbyteRecordMessage]):
+        while True:
+            self._raise_failed()
+            running = [flush for flush in self._flushes if not flush.done()]
+            if len(running) < self.max_pending:
+                break
+            wait(running, return_when=FIRST_COMPLETED)
+        self._flushes.append(self._executor.submit(self.flush, stream, records))
+        self._submitted += 1
+
+    def add_state(self, message: AirbyteMessage):
+        self._states.append((self._submitted, message))
+
+    def ready_states(self) -> Iterator[AirbyteMessage]:
+        """Yields the state messages whose earlier flushes all succeeded, without waiting for running flushes"""
+        self._raise_failed()
+        while self._flushes and self._flushes[0].done():
+            self._flushes.popleft().result()
+            self._completed += 1
+        while self._states and self._states[0][0] <= self._completed:
+            yield self._states.popleft()[1]
+
+    def drain(self) -> Iterator[AirbyteMessage]:
+        """Waits for every flush to finish and yields the remaining state messages"""
+        while self._flushes:
+            self._flushes.popleft().result()
+            self._completed += 1
+        yield from self.ready_states()
+
+    def close(self):
+        for flush in self._flushes:
+            flush.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _raise_failed(self):
+        for flush in self._flushes:
+            if flush.done() and flush.exception():
+                raise flush.exception()
+
+
+class BufferedDestination(Destination, ABC):
+    """
+    Base class for destinations writing records in batches.
+
+    Records are buffered per stream and a stream's buffer is flushed with flush_batch once it holds max_batch_records records,
+    max_batch_bytes bytes, or its first record was buffered max_batch_seconds ago. The age of the buffers is also checked by a
+    background thread, so buffered records are flushed while the source is slow to send the next message. Flushes run on a pool of
+    max_concurrent_flushes threads, and reading the input blocks while max_pending_flushes flushes are running, so the memory held
+    by buffers stays bounded when the destination is slower than the source.
+
+    On a state message, the buffers of all streams are flushed and the state is output once every flush submitted before it
+    succeeded, so a state message always means all records received before it are persisted. State messages keep their order.
+    A flush raising an exception fails the write, without outputting the state messages received after the failed batch.
+    """
+
+    max_batch_records: int = 1000
+    # batches are not bounded by size by default, since estimating the size of every record has a cost
+    max_batch_bytes: Optional[int] = None
+    max_batch_seconds: float = 60
+    # set to 1 if flush_batch is not thread safe, or batches must be written in the order they were received
+    max_concurrent_flushes: int = 4
+    max_pending_flushes: int = 8
+
+    def prepare(self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog):
+        """
+        Override to set up the destination before any record is flushed, e.g: to create the client or delete the data of the
+        streams configured with the overwrite sync mode
+        """
+
+    @abstractmethod
+    def flush_batch(self, stream: str, records: List[AirbyteRecordMessage]):
+        """
+        Implement to write a batch of records of a stream to the destination. Called inside a worker thread: the records are
+        persisted when it returns, and an exception fails the write.
+        """
+
+    def record_size(self, record: AirbyteRecordMessage) -> int:
+        """Override to estimate the size in bytes of a record differently, only used when max_batch_bytes is set"""
+        return len(json.dumps(record.data))
+
+    def write(
+        self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
+    ) -> Iterable[AirbyteMessage]:
+        self.prepare(config, configured_catalog)
+        buffers: Dict[str, _StreamBuffer] = {}
+        pipeline = _FlushPipeline(self.flush_batch, max_workers=self.max_concurrent_flushes, max_pending=self.max_pending_flushes)
+        # the buffers and the pipeline are shared with the thread submitting expired buffers
+        lock = threading.Lock()
+        stop = threading.Event()
+        expiry_checker = threading.Thread(
+            target=self._submit_expired_periodically, args=(buffers, pipeline, lock, stop), name="buffered-destination-expiry", daemon=True
+        )
+        expiry_checker.start()
+        try:
+            for message in input_messages:
+                with lock:
+                    if message.type == Type.RECORD and message.record is not None:
+                        record = message.record
+                        buffer = buffers.setdefault(record.stream, _StreamBuffer())
+                        buffer.append(record, self.record_size(record) if self.max_batch_bytes else 0)
+                        if len(buffer.records) >= self.max_batch_records or (
+                            self.max_batch_bytes and buffer.size_bytes >= self.max_batch_bytes
+                        ):
+                            pipeline.submit(record.stream, buffer.take())
+                        self._submit_expired(buffers, pipeline)
+                    elif message.type == Type.STATE:
+                        self._submit_all(buffers, pipeline)
+                        pipeline.add_state(message)
+                    else:
+                        # ignore other message types
+                        continue
+                    states = list(pipeline.ready_states())
+                yield from states
+
+            stop.set()
+            expiry_checker.join()
+            self._submit_all(buffers, pipeline)
+            yield from pipeline.drain()
+        finally:
+            stop.set()
+            expiry_checker.join()
+            pipeline.close()
+
+    def _submit_expired_periodically(
+        self, buffers: Mapping[str, _StreamBuffer], pipeline: _FlushPipeline, lock: threading.Lock, stop: threading.Event
+    ):
+        """Submits the buffers once they expire, until stop is set or a flush failed"""
+        wait_seconds = self.max_batch_seconds
+        while not stop.wait(wait_seconds):
+            with lock:
+                try:
+                    self._submit_expired(buffers, pipeline)
+                except Exception:
+                    # the failure is raised to the writer by its next call to the pipeline
+                    return
+                now = time.monotonic()
+                started_at = [buffer.started_at for buffer in buffers.values() if buffer.records]
+                wait_seconds = max(0.0, min(started_at) + self.max_batch_seconds - now) if started_at else self.max_batch_seconds
+
+    def _submit_expired(self, buffers: Mapping[str, _StreamBuffer], pipeline: _FlushPipeline):
+        now = time.monotonic()
+        for stream, buffer in buffers.items():
+            if buffer.records and now - buffer.started_at >= self.max_batch_seconds:
+                pipeline.submit(stream, buffer.take())
+
+    @staticmethod
+    def _submit_all(buffers: Mapping[str, _StreamBuffer], pipeline: _FlushPipeline):
+        for stream, buffer in buffers.items():
+            if buffer.records:
+                pipeline.submit(stream, buffer.take())
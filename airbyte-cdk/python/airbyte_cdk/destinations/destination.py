@@ -12,6 +12,7 @@ from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
+from airbyte_cdk.utils.output_buffer import stdout_buffer
 from pydantic import ValidationError
 
 
@@ -104,5 +105,8 @@ class Destination(Connector, ABC):
     def run(self, args: List[str]):
         parsed_args = self.parse_args(args)
         output_messages = self.run_cmd(parsed_args)
-        for message in output_messages:
-            print(message.json(exclude_unset=True))
+        try:
+            for message in output_messages:
+                stdout_buffer.write_message(message.json(exclude_unset=True))
+        finally:
+            stdout_buffer.flush()
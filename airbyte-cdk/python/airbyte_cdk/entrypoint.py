@@ -15,6 +15,8 @@ from airbyte_cdk.logger import init_logger
 from airbyte_cdk.models import AirbyteMessage, Status, Type
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
+from airbyte_cdk.utils.output_buffer import stdout_buffer
+from airbyte_cdk.utils.serialization import airbyte_message_to_json
 
 logger = init_logger("airbyte")
 
@@ -97,7 +99,7 @@ class AirbyteEntrypoint(object):
                     state = self.source.read_state(parsed_args.state)
                     generator = self.source.read(self.logger, config, config_catalog, state)
                     for message in generator:
-                        yield message.json(exclude_unset=True)
+                        yield airbyte_message_to_json(message)
                 else:
                     raise Exception("Unexpected command " + cmd)
 
@@ -105,8 +107,11 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    try:
+        for message in source_entrypoint.run(parsed_args):
+            stdout_buffer.write_message(message)
+    finally:
+        stdout_buffer.flush()
 
 
 def main():
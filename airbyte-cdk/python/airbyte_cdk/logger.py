@@ -7,6 +7,7 @@ import logging.config
 import traceback
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage
+from airbyte_cdk.utils.output_buffer import stdout_buffer
 
 TRACE_LEVEL_NUM = 5
 
@@ -103,7 +104,7 @@ class AirbyteLogger:
     def log(self, level, message):
         log_record = AirbyteLogMessage(level=level, message=message)
         log_message = AirbyteMessage(type="LOG", log=log_record)
-        print(log_message.json(exclude_unset=True))
+        stdout_buffer.write(log_message.json(exclude_unset=True), flush=True)
 
     def fatal(self, message):
         self.log("FATAL", message)
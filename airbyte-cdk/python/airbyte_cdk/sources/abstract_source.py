@@ -4,10 +4,11 @@
 
 
 import copy
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import (
@@ -24,10 +25,11 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.source import Source
-from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams import AsyncJobStream, Stream
 from airbyte_cdk.sources.streams.http.http import HttpStream
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.transform import TypeTransformer
+from airbyte_cdk.utils.concurrency import interleave, map_in_order, read_ahead
 from airbyte_cdk.utils.event_timing import create_timer
 
 
@@ -58,12 +60,27 @@ class AbstractSource(Source, ABC):
 
     # Stream name to instance map for applying output object transformation
     _stream_to_instance_map: Dict[str, AirbyteStream] = {}
+    # Guards connector state updates when several streams are read at the same time
+    _state_lock = threading.Lock()
 
     @property
     def name(self) -> str:
         """Source name"""
         return self.__class__.__name__
 
+    @property
+    def max_concurrent_streams(self) -> Optional[int]:
+        """
+        Override to read up to this many streams at the same time, each on its own worker thread.
+
+        Messages of all streams are emitted through a single output queue. Records and STATE messages of a stream keep their
+        relative order, so a stream's STATE message is always emitted after the records it covers. Only enable this if the
+        streams of the source are independent of each other, e.g: they don't share a non thread-safe client.
+
+        Return None (default) to read streams one after another.
+        """
+        return None
+
     def discover(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteCatalog:
         """Implements the Discover operation from the Airbyte Specification. See https://docs.airbyte.io/architecture/airbyte-specification."""
         streams = [stream.as_airbyte_stream() for stream in self.streams(config=config)]
@@ -91,6 +108,14 @@ class AbstractSource(Source, ABC):
         # get the streams once in case the connector needs to make any queries to generate them
         stream_instances = {s.name: s for s in self.streams(config)}
         self._stream_to_instance_map = stream_instances
+        max_concurrent_streams = self.max_concurrent_streams
+        if max_concurrent_streams and max_concurrent_streams > 1:
+            yield from self._read_streams_concurrently(
+                logger, stream_instances, catalog, connector_state, internal_config, max_workers=max_concurrent_streams
+            )
+            logger.info(f"Finished syncing {self.name}")
+            return
+
         with create_timer(self.name) as timer:
             for configured_stream in catalog.streams:
                 stream_instance = stream_instances.get(configured_stream.stream.name)
@@ -116,6 +141,51 @@ class AbstractSource(Source, ABC):
 
         logger.info(f"Finished syncing {self.name}")
 
+    def _read_streams_concurrently(
+        self,
+        logger: AirbyteLogger,
+        stream_instances: Mapping[str, Stream],
+        catalog: ConfiguredAirbyteCatalog,
+        connector_state: MutableMapping[str, Any],
+        internal_config: InternalConfig,
+        max_workers: int,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads all configured streams on a pool of max_workers threads, see max_concurrent_streams for details.
+        Each stream is timed by its own timer, since the streams overlap.
+        """
+        for configured_stream in catalog.streams:
+            if configured_stream.stream.name not in stream_instances:
+                raise KeyError(
+                    f"The requested stream {configured_stream.stream.name} was not found in the source. Available streams: {stream_instances.keys()}"
+                )
+
+        def read_timed_stream(configured_stream: ConfiguredAirbyteStream) -> Iterator[AirbyteMessage]:
+            stream_name = configured_stream.stream.name
+            with create_timer(self.name) as timer:
+                timer.start_event(stream_name)
+                try:
+                    yield from self._read_stream(
+                        logger=logger,
+                        stream_instance=stream_instances[stream_name],
+                        configured_stream=configured_stream,
+                        connector_state=connector_state,
+                        internal_config=internal_config,
+                    )
+                finally:
+                    timer.finish_event()
+                    logger.info(timer.report())
+
+        def stream_reader(configured_stream: ConfiguredAirbyteStream) -> Callable[[], Iterable[AirbyteMessage]]:
+            return lambda: read_timed_stream(configured_stream)
+
+        logger.info(f"Reading up to {max_workers} streams concurrently")
+        try:
+            yield from interleave([stream_reader(configured_stream) for configured_stream in catalog.streams], max_workers=max_workers)
+        except Exception as e:
+            logger.exception(f"Encountered an exception while reading stream {self.name}")
+            raise e
+
     def _read_stream(
         self,
         logger: AirbyteLogger,
@@ -176,13 +246,16 @@ class AbstractSource(Source, ABC):
             cursor_field=configured_stream.cursor_field, sync_mode=SyncMode.incremental, stream_state=stream_state
         )
         total_records_counter = 0
-        for slice in slices:
-            records = stream_instance.read_records(
+
+        def read_slice(slice: Optional[Mapping[str, Any]]) -> Iterable[Mapping[str, Any]]:
+            return stream_instance.read_records(
                 sync_mode=SyncMode.incremental,
                 stream_slice=slice,
                 stream_state=stream_state,
                 cursor_field=configured_stream.cursor_field or None,
             )
+
+        for records in self._read_slices(stream_instance, slices, read_slice):
             for record_counter, record_data in enumerate(records, start=1):
                 yield self._as_airbyte_record(stream_name, record_data)
                 stream_state = stream_instance.get_updated_state(stream_state, record_data)
@@ -206,20 +279,60 @@ class AbstractSource(Source, ABC):
     ) -> Iterator[AirbyteMessage]:
         slices = stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field)
         total_records_counter = 0
-        for slice in slices:
-            records = stream_instance.read_records(
+
+        def read_slice(slice: Optional[Mapping[str, Any]]) -> Iterable[Mapping[str, Any]]:
+            return stream_instance.read_records(
                 stream_slice=slice, sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field
             )
+
+        for records in self._read_slices(stream_instance, slices, read_slice):
             for record in records:
                 yield self._as_airbyte_record(configured_stream.stream.name, record)
                 total_records_counter += 1
                 if self._limit_reached(internal_config, total_records_counter):
                     return
 
+    @staticmethod
+    def _read_slices(
+        stream_instance: Stream,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        read_slice: Callable[[Optional[Mapping[str, Any]]], Iterable[Mapping[str, Any]]],
+    ) -> Iterator[Iterable[Mapping[str, Any]]]:
+        """
+        Yields the records of each slice in slice order. Slices are read lazily one after another unless the stream
+        sets max_concurrent_slices, in which case up to that many slices are read ahead on worker threads.
+        For an AsyncJobStream, read_slice is called for up to max_concurrent_jobs slices ahead, which submits their jobs,
+        and the jobs whose records were not read are cancelled once the read stops.
+        :param stream_instance - stream the slices belong to
+        :param slices - slices to read
+        :param read_slice - reads the records of a single slice
+        """
+        if isinstance(stream_instance, AsyncJobStream):
+            try:
+                yield from read_ahead((read_slice(slice) for slice in slices), stream_instance.max_concurrent_jobs)
+            finally:
+                # Runs as well when the consumer stops early, e.g: on the record limit, leaving the jobs submitted ahead unread
+                stream_instance.scheduler.cancel_unread()
+            return
+
+        max_concurrent_slices = stream_instance.max_concurrent_slices
+        if not max_concurrent_slices or max_concurrent_slices <= 1:
+            for slice in slices:
+                yield read_slice(slice)
+            return
+
+        def collect(records: Iterable[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+            return list(records)
+
+        # read_slice is called in this thread so every slice is bound to the stream state as of the last emitted slice,
+        # the records are then pulled from the returned iterable on the worker threads
+        yield from map_in_order(collect, (read_slice(slice) for slice in slices), max_workers=max_concurrent_slices)
+
     def _checkpoint_state(self, stream_name, stream_state, connector_state, logger):
         logger.info(f"Setting state of {stream_name} stream to {stream_state}")
-        connector_state[stream_name] = stream_state
-        return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=connector_state))
+        with self._state_lock:
+            connector_state[stream_name] = stream_state
+            return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=connector_state))
 
     @lru_cache(maxsize=None)
     def _get_stream_transformer_and_schema(self, stream_name: str) -> Tuple[TypeTransformer, dict]:
@@ -241,5 +354,9 @@ class AbstractSource(Source, ABC):
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
         transformer.transform(data, schema)
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        # Records are built with construct() to skip pydantic validation, which is costly at this volume
+        # and redundant since all the fields are already of the expected types.
+        message = AirbyteRecordMessage.construct(
+            stream=stream_name, data=data if isinstance(data, dict) else dict(data), emitted_at=now_millis
+        )
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
@@ -1,4 +1,7 @@
 # Initialize Streams Package
+from .adaptive_slicer import AdaptiveDateSlicer
+from .async_job import AsyncJobStatus, AsyncJobStream
 from .core import Stream
+from .materialized import MaterializedStream
 
-__all__ = ["Stream"]
+__all__ = ["AdaptiveDateSlicer", "AsyncJobStatus", "AsyncJobStream", "MaterializedStream", "Stream"]
@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import math
+import time
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Tuple, Type, TypeVar
+
+import pendulum
+from airbyte_cdk.logger import AirbyteLogger
+from pendulum import DateTime, Duration
+
+logger = AirbyteLogger()
+
+T = TypeVar("T")
+
+
+class AdaptiveDateSlicer:
+    """
+    Splits the dates from start to end into consecutive windows, sizing every window from how the previous one went.
+
+    After a window was read, the stream reports how many records it returned and how long it took with update, or lets read_slice
+    measure it. The next window is scaled so it returns about target_records records and takes about target_seconds seconds (the
+    smaller of both when both are set), growing at most max_growth_factor times at once. Windows are a multiple of min_window, at most
+    max_window. When a window fails, shrink returns the same window start with a window shrink_factor times smaller to try again.
+
+    Windows are generated lazily from the stream_slices of the stream, so each window is sized after the previous one was read and
+    the state is checkpointed after every window as usual. Don't read the slices of a stream using this slicer concurrently.
+    """
+
+    def __init__(
+        self,
+        start: DateTime,
+        end: Optional[DateTime] = None,
+        initial_window: Duration = pendulum.duration(days=30),
+        min_window: Duration = pendulum.duration(days=1),
+        max_window: Duration = pendulum.duration(days=365),
+        target_records: Optional[int] = None,
+        target_seconds: Optional[float] = None,
+        max_growth_factor: float = 4.0,
+        shrink_factor: float = 2.0,
+    ):
+        """
+        :param start: start of the first window
+        :param end: end of the last window, defaults to now
+        :param initial_window: length of the first window
+        :param min_window: shortest window, windows are a multiple of it
+        :param max_window: longest window
+        :param target_records: number of records a window should return
+        :param target_seconds: number of seconds reading a window should take
+        :param max_growth_factor: maximum ratio between a window and the previous one
+        :param shrink_factor: ratio between a failed window and the window tried next
+        """
+        self.end = end or pendulum.now("UTC")
+        self.min_window = min_window
+        self.max_window = max_window
+        self.target_records = target_records
+        self.target_seconds = target_seconds
+        self.max_growth_factor = max_growth_factor
+        self.shrink_factor = shrink_factor
+
+        self._cursor = start
+        self._window = self._clamp(initial_window.total_seconds())
+        # bounds of the window generated last, which is the one being read
+        self._last_window: Optional[Tuple[DateTime, DateTime]] = None
+
+    @property
+    def window(self) -> Duration:
+        """Length of the next window"""
+        return pendulum.duration(seconds=self._window)
+
+    def make_slice(self, start: DateTime, end: DateTime) -> Mapping[str, Any]:
+        """Override to build the slices from the window bounds differently"""
+        return {"start_date": start, "end_date": end}
+
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        while self._cursor < self.end:
+            yield self._next_slice(self._cursor)
+
+    def update(self, records: int, seconds: float):
+        """
+        Sizes the next window from the results of the window generated last
+        :param records: number of records returned by the window
+        :param seconds: how long reading the window took
+        """
+        if not self._last_window:
+            return
+        start, end = self._last_window
+        factor = self.max_growth_factor
+        if self.target_records:
+            factor = min(factor, self.target_records / records if records else self.max_growth_factor)
+        if self.target_seconds:
+            factor = min(factor, self.target_seconds / seconds if seconds > 0 else self.max_growth_factor)
+        if not self.target_records and not self.target_seconds:
+            factor = 1.0
+        self._window = self._clamp((end - start).total_seconds() * factor)
+
+    def shrink(self) -> Mapping[str, Any]:
+        """
+        Shrinks the window after the window generated last failed, raises if no window was generated yet
+        :return: the slice to read instead, which starts where the failed one started
+        """
+        if not self._last_window:
+            raise Exception("Cannot shrink the window before a window was generated, iterate the slicer first")
+        start, end = self._last_window
+        self._window = self._clamp((end - start).total_seconds() / self.shrink_factor)
+        return self._next_slice(start)
+
+    def read_slice(
+        self,
+        stream_slice: Mapping[str, Any],
+        read: Callable[[Mapping[str, Any]], Iterable[T]],
+        retry_on: Tuple[Type[Exception], ...] = (),
+        max_attempts: int = 1,
+    ) -> Iterator[T]:
+        """
+        Reads the slice generated last and sizes the next window from the number of records read and the time it took.
+        If read raises one of the retry_on exceptions, the window is shrunk and read again from its start, up to max_attempts times
+        in total: the records read before the error are read again.
+        :param stream_slice: slice generated last
+        :param read: reads the records of a slice, e.g: the read_records of the parent class of the stream
+        :param retry_on: exceptions after which a smaller window is read
+        :param max_attempts: maximum number of times the window is read
+        """
+        for attempt in range(1, max_attempts + 1):
+            records, started_at = 0, time.monotonic()
+            try:
+                for record in read(stream_slice):
+                    records += 1
+                    yield record
+            except retry_on as e:
+                if attempt == max_attempts:
+                    raise
+                stream_slice = self.shrink()
+                logger.warn(f"Reading a window failed with {e!r}, reading a window of {self.window.in_words()} instead")
+                continue
+            self.update(records, time.monotonic() - started_at)
+            return
+
+    def _next_slice(self, start: DateTime) -> Mapping[str, Any]:
+        end = min(start + pendulum.duration(seconds=self._window), self.end)
+        self._last_window = (start, end)
+        self._cursor = end
+        return self.make_slice(start, end)
+
+    def _clamp(self, window_seconds: float) -> float:
+        unit: float = self.min_window.total_seconds()
+        window_seconds = min(window_seconds, self.max_window.total_seconds())
+        # the epsilon keeps float rounding from dropping a whole unit
+        return max(math.floor(window_seconds / unit + 1e-9) * unit, unit)
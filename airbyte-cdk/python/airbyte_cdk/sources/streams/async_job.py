@@ -0,0 +1,229 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Iterable, Iterator, List, Mapping, Optional
+
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import SyncMode
+
+from .core import Stream
+
+logger = AirbyteLogger()
+
+
+class AsyncJobStatus(Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AsyncJobFailed(Exception):
+    """Raised when the job of a slice failed max_job_attempts times"""
+
+
+class AsyncJob:
+    """
+    A job of an AsyncJobStream tracked by the AsyncJobScheduler, from its submission until it completes.
+    """
+
+    def __init__(self, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any], poll_interval: float):
+        self.stream_slice = stream_slice
+        self.stream_state = stream_state
+        # Value returned by AsyncJobStream.create_job, None until the job is created
+        self.job: Any = None
+        self.status: Optional[AsyncJobStatus] = None
+        self.attempts = 0
+        self.poll_interval = poll_interval
+        self.next_poll_at = 0.0
+        self.started_at = 0.0
+
+
+class AsyncJobScheduler:
+    """
+    Keeps up to max_concurrent_jobs jobs of a stream running and polls all of them in one loop.
+
+    Each job is polled with its own interval, starting at min_poll_interval_seconds and growing by poll_backoff_factor after every
+    poll which finds the job still running, up to max_poll_interval_seconds. Jobs submitted while max_concurrent_jobs jobs are running
+    are created once a running job completes.
+    """
+
+    def __init__(self, stream: "AsyncJobStream"):
+        self.stream = stream
+        self._pending: Deque[AsyncJob] = deque()
+        self._running: List[AsyncJob] = []
+        # Submitted jobs whose records were not read entirely yet
+        self._unread: List[AsyncJob] = []
+
+    def submit(self, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]) -> AsyncJob:
+        job = AsyncJob(stream_slice, stream_state, poll_interval=self.stream.min_poll_interval_seconds)
+        self._pending.append(job)
+        self._unread.append(job)
+        self._start_pending_jobs()
+        return job
+
+    def mark_read(self, job: AsyncJob):
+        self._unread.remove(job)
+
+    def cancel_unread(self):
+        """
+        Cancels the jobs whose records were not read entirely, e.g: the jobs submitted ahead of a read which stopped at the record limit.
+        Jobs which were not created yet are dropped, the others are passed to AsyncJobStream.cancel_job.
+        """
+        jobs, self._unread = self._unread, []
+        self._pending.clear()
+        self._running.clear()
+        for job in jobs:
+            if job.status not in (AsyncJobStatus.RUNNING, AsyncJobStatus.COMPLETED):
+                continue
+            try:
+                self.stream.cancel_job(job.job)
+            except Exception as e:
+                # the read already stopped, possibly on an error which must not be hidden by this one
+                logger.warn(f"Could not cancel job {job.job} of stream {self.stream.name}: {e}")
+
+    def wait(self, job: AsyncJob):
+        """
+        Blocks until the job completes, polling and starting the other jobs of the stream in the meantime.
+        :raises AsyncJobFailed: if a job failed max_job_attempts times
+        """
+        while job.status != AsyncJobStatus.COMPLETED:
+            self._start_pending_jobs()
+            now = time.monotonic()
+            due = [running_job for running_job in self._running if running_job.next_poll_at <= now]
+            if due:
+                self._poll(due)
+                continue
+            if self._running:
+                time.sleep(max(0.0, min(running_job.next_poll_at for running_job in self._running) - now))
+
+    def _start_pending_jobs(self):
+        while self._pending and len(self._running) < self.stream.max_concurrent_jobs:
+            self._start(self._pending.popleft())
+
+    def _start(self, job: AsyncJob):
+        job.attempts += 1
+        job.job = self.stream.create_job(stream_slice=job.stream_slice, stream_state=job.stream_state)
+        job.status = AsyncJobStatus.RUNNING
+        job.started_at = time.monotonic()
+        job.poll_interval = self.stream.min_poll_interval_seconds
+        job.next_poll_at = job.started_at + job.poll_interval
+        self._running.append(job)
+
+    def _poll(self, jobs: List[AsyncJob]):
+        statuses = self.stream.check_jobs_status([job.job for job in jobs])
+        now = time.monotonic()
+        for job, status in zip(jobs, statuses):
+            timeout = self.stream.job_timeout_seconds
+            if status == AsyncJobStatus.RUNNING and timeout is not None and now - job.started_at > timeout:
+                logger.warn(f"Job {job.job} of stream {self.stream.name} did not complete within {timeout} seconds")
+                status = AsyncJobStatus.FAILED
+
+            if status == AsyncJobStatus.RUNNING:
+                job.poll_interval = min(job.poll_interval * self.stream.poll_backoff_factor, self.stream.max_poll_interval_seconds)
+                job.next_poll_at = now + job.poll_interval
+                continue
+
+            self._running.remove(job)
+            job.status = status
+            if status == AsyncJobStatus.FAILED:
+                self._retry(job)
+
+    def _retry(self, job: AsyncJob):
+        """Failed jobs are created again, until they failed max_job_attempts times"""
+        if job.attempts >= self.stream.max_job_attempts:
+            raise AsyncJobFailed(
+                f"Job {job.job} of stream {self.stream.name} failed after {job.attempts} attempts, slice: {job.stream_slice}"
+            )
+        logger.info(f"Job {job.job} of stream {self.stream.name} failed, retrying it. Slice: {job.stream_slice}")
+        # Retried jobs go first so slices complete in order as much as possible
+        self._pending.appendleft(job)
+
+
+class AsyncJobStream(Stream, ABC):
+    """
+    Base class for streams whose records are produced by asynchronous jobs, e.g: reports or bulk exports, which are created,
+    polled until they complete and then downloaded.
+
+    Each slice is read by one job. When the stream is read by a source, jobs are created for up to max_concurrent_jobs upcoming
+    slices while the records of the current slice are downloaded, so the sync does not wait on one job while others could be running.
+    Records and state are still emitted in slice order.
+    """
+
+    # Maximum number of jobs of the stream running at the same time
+    max_concurrent_jobs: int = 5
+    # A job is polled after min_poll_interval_seconds, then the interval grows by poll_backoff_factor after every poll
+    min_poll_interval_seconds: float = 5
+    max_poll_interval_seconds: float = 60
+    poll_backoff_factor: float = 1.5
+    # Jobs running for longer than this are considered failed, None for no limit
+    job_timeout_seconds: Optional[float] = None
+    # Number of times a failed job is created before giving up on the sync
+    max_job_attempts: int = 3
+
+    _scheduler: Optional[AsyncJobScheduler] = None
+
+    @property
+    def scheduler(self) -> AsyncJobScheduler:
+        # Created lazily so subclasses don't depend on the constructor of this class being called, e.g: along with HttpStream
+        if self._scheduler is None:
+            self._scheduler = AsyncJobScheduler(self)
+        return self._scheduler
+
+    @abstractmethod
+    def create_job(self, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]) -> Any:
+        """
+        Creates the job reading the slice.
+        :return: any value identifying the job, passed to the other job methods
+        """
+
+    @abstractmethod
+    def check_job_status(self, job: Any) -> AsyncJobStatus:
+        """
+        :return: the current status of the job
+        """
+
+    def check_jobs_status(self, jobs: List[Any]) -> List[AsyncJobStatus]:
+        """
+        Override if needed, e.g: to check the status of all running jobs in one request if the API allows it.
+        :return: the current status of each job, in the order of jobs
+        """
+        return [self.check_job_status(job) for job in jobs]
+
+    def cancel_job(self, job: Any):
+        """
+        Override if needed, e.g: to abort the job or delete its result. Called for every created job whose records were not read
+        entirely once the read of the stream stopped early, e.g: on the record limit or an error. Does nothing by default.
+        """
+
+    @abstractmethod
+    def read_job_records(
+        self, job: Any, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Downloads the result of the completed job.
+        :return: the records of the slice
+        """
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Submits the job of the slice right away, the returned records wait for it to complete once they are iterated over.
+        """
+        job = self.scheduler.submit(stream_slice, stream_state or {})
+        return self._read_job(job)
+
+    def _read_job(self, job: AsyncJob) -> Iterator[Mapping[str, Any]]:
+        self.scheduler.wait(job)
+        yield from self.read_job_records(job.job, stream_slice=job.stream_slice, stream_state=job.stream_state)
+        self.scheduler.mark_read(job)
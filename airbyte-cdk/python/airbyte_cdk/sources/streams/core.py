@@ -120,6 +120,21 @@ class Stream(ABC):
         """
         return [None]
 
+    @property
+    def max_concurrent_slices(self) -> Optional[int]:
+        """
+        Override to read up to this many slices of the stream at the same time, each on its own worker thread.
+
+        Records and STATE messages are still emitted in slice order, so the state can't get ahead of a slice that was not fully read yet.
+        Only enable this if the slices are independent of each other and the records returned by read_records can be pulled from several threads
+        at once. read_records should be a generator, as HttpStream.read_records is, since its records are pulled on the worker threads. Slices which
+        are read ahead receive the stream state as of the last emitted slice, and the records of up to this many slices are held in memory while an
+        earlier slice is being read.
+
+        Return None (default) to read slices one after another.
+        """
+        return None
+
     @property
     def state_checkpoint_interval(self) -> Optional[int]:
         """
@@ -1,5 +1,8 @@
 # Initialize Streams Package
+from .async_http import AsyncHttpStream
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream, HttpSubStream
+from .rate_limiting import RateLimiter
+from .response_cache import ResponseCache
 
-__all__ = ["HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
+__all__ = ["AsyncHttpStream", "HttpStream", "HttpSubStream", "RateLimiter", "ResponseCache", "UserDefinedBackoffException"]
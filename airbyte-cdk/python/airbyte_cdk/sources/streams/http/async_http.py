@@ -0,0 +1,289 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import asyncio
+import atexit
+import threading
+from abc import ABC
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, TypeVar
+
+import requests
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import SyncMode
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .exceptions import DefaultBackoffException, UserDefinedBackoffException
+from .http import HttpStream
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+logger = AirbyteLogger()
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """
+    Runs an asyncio event loop on a daemon thread so synchronous code can submit coroutines to it.
+    All AsyncHttpStreams of a process share one loop, and with it one HTTP connection pool.
+    The loop is stopped at interpreter exit, after awaiting its shutdown hooks on the loop, e.g: to close the client session.
+    """
+
+    _instance: Optional["EventLoopThread"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._shutdown_hooks: List[Callable[[], Awaitable[Any]]] = []
+        self._thread = threading.Thread(target=self.loop.run_forever, name="airbyte-event-loop", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def get(cls) -> "EventLoopThread":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.stop)
+            return cls._instance
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        """
+        Runs the coroutine, or any other awaitable, on the loop and blocks the calling thread until it is done.
+        :return: the result of the awaitable
+        """
+
+        async def wait() -> T:
+            return await awaitable
+
+        return asyncio.run_coroutine_threadsafe(wait(), self.loop).result()
+
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Registers a coroutine function awaited on the loop when the loop is stopped, e.g: the close method of a client session
+        """
+        self._shutdown_hooks.append(hook)
+
+    def stop(self) -> None:
+        """
+        Awaits the shutdown hooks on the loop, then stops the loop and its thread. The next call to get() starts a new loop.
+        """
+        with EventLoopThread._instance_lock:
+            if EventLoopThread._instance is self:
+                EventLoopThread._instance = None
+        if self.loop.is_closed():
+            return
+        if self._thread.is_alive():
+            self.run(self._run_shutdown_hooks())
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()
+
+    async def _run_shutdown_hooks(self) -> None:
+        hooks, self._shutdown_hooks = self._shutdown_hooks, []
+        for hook in reversed(hooks):
+            try:
+                await hook()
+            except Exception as e:
+                logger.warn(f"Shutdown hook of the event loop failed: {e!r}")
+
+
+class AsyncHttpStream(HttpStream, ABC):
+    """
+    HttpStream which sends its requests with an asyncio HTTP client (aiohttp, install airbyte-cdk[async]).
+
+    The override surface is the same as HttpStream: requests are still built with path, request_params, request_headers, etc. and
+    responses are handed to parse_response, next_page_token, should_retry and backoff_time as requests.Response objects.
+    Requests of all async streams of the process are sent from one event loop through a shared connection pool, so many of them
+    can be in flight at the same time: either read slices concurrently by setting max_concurrent_slices, or drive
+    read_records_async from your own coroutines, e.g: to read the substreams of a parent record together.
+    Blocking work, i.e: getting the auth header, parse_response and the response cache, runs on the default executor of the loop
+    so it does not hold up the requests of other streams.
+
+    request_kwargs are not supported, except for the "timeout" request kwarg.
+    """
+
+    # Maximum number of open connections, shared by all async streams of the process with the same connection_pool_size
+    connection_pool_size: int = 100
+
+    # connection pool size -> client session
+    _client_sessions: Dict[int, "aiohttp.ClientSession"] = {}
+
+    def __init__(self, *args, **kwargs):
+        if aiohttp is None:
+            raise ImportError("AsyncHttpStream requires aiohttp, install it with airbyte-cdk[async]")
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    async def _get_client_session(cls) -> "aiohttp.ClientSession":
+        """
+        Lazily creates the client session shared by all async streams with the same connection_pool_size, it must be created from
+        within the event loop. The session is closed on the loop when the loop is stopped.
+        """
+        pool_size = cls.connection_pool_size
+        session = AsyncHttpStream._client_sessions.get(pool_size)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=pool_size))
+            AsyncHttpStream._client_sessions[pool_size] = session
+            EventLoopThread.get().add_shutdown_hook(session.close)
+        return session
+
+    @staticmethod
+    async def _to_requests_response(request: requests.PreparedRequest, client_response: "aiohttp.ClientResponse") -> requests.Response:
+        """
+        Converts a response of the async client so it can be handed to the methods shared with HttpStream.
+        """
+        response = requests.Response()
+        response.status_code = client_response.status
+        response.reason = client_response.reason or ""
+        response.headers = CaseInsensitiveDict(client_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(client_response.url)
+        response.request = request
+        response._content = await client_response.read()
+        return response
+
+    async def _send_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Async counterpart of HttpStream._send, raises the same exceptions for the same responses.
+        """
+        method, url = request.method, request.url
+        if method is None or url is None:
+            raise ValueError(f"The request of stream {self.name} has no method or url")
+        loop = asyncio.get_event_loop()
+        if self.use_cache:
+            cached_response = await loop.run_in_executor(None, lambda: self._get_response_cache().get(request))
+            if cached_response is not None:
+                return cached_response
+
+        session = await self._get_client_session()
+        timeout = aiohttp.ClientTimeout(total=request_kwargs["timeout"]) if request_kwargs.get("timeout") else session.timeout
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(url)
+        response = None
+        try:
+            # The url is already encoded by requests, including the query params
+            async with session.request(
+                method, URL(url, encoded=True), headers=dict(request.headers), data=request.body, timeout=timeout
+            ) as client_response:
+                response = await self._to_requests_response(request, client_response)
+        finally:
+            if self.rate_limiter:
+                self.rate_limiter.release(url, response)
+
+        if self.should_retry(response):
+            custom_backoff_time = self.backoff_time(response)
+            if custom_backoff_time:
+                raise UserDefinedBackoffException(backoff=custom_backoff_time, request=request, response=response)
+            else:
+                raise DefaultBackoffException(request=request, response=response)
+        elif self.raise_on_http_errors:
+            # Raise any HTTP exceptions that happened in case there were unexpected ones
+            response.raise_for_status()
+
+        if self.use_cache and response.ok:
+            await loop.run_in_executor(None, lambda: self._get_response_cache().set(request, response))
+
+        return response
+
+    async def _send_request_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Async counterpart of HttpStream._send_request, retries with the same policy without blocking the event loop:
+        user defined backoff times are waited for plus one second, other transient errors are retried with an exponential backoff.
+        """
+        max_tries = self.max_retries
+        if max_tries is not None:
+            max_tries = max(0, max_tries) + 1
+
+        tries = 0
+        while True:
+            tries += 1
+            try:
+                return await self._send_async(request, request_kwargs)
+            except UserDefinedBackoffException as exc:
+                if max_tries is not None and tries >= max_tries:
+                    logger.error(f"Max retry limit reached. Request: {exc.request}, Response: {exc.response}")
+                    raise
+                logger.info(f"Retrying. Sleeping for {exc.backoff} seconds")
+                await asyncio.sleep(exc.backoff + 1)  # extra second to cover any fractions of second
+            except (DefaultBackoffException, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                response = getattr(exc, "response", None)
+                if response is not None and response.status_code != requests.codes.too_many_requests and 400 <= response.status_code < 500:
+                    logger.info(f"Giving up for returned HTTP status: {response.status_code}")
+                    raise
+                if max_tries is not None and tries >= max_tries:
+                    raise
+                wait = self.retry_factor * 2 ** (tries - 1)
+                logger.info(f"Caught retryable error '{str(exc)}' after {tries} tries. Waiting {wait} seconds then retrying...")
+                await asyncio.sleep(wait)
+
+    async def read_pages_async(
+        self,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncGenerator[List[Mapping[str, Any]], None]:
+        """
+        Reads the slice page by page from within the event loop.
+        :return: async iterator over the parsed records of each page
+        """
+        stream_state = stream_state or {}
+        loop = asyncio.get_event_loop()
+        next_page_token = None
+        while True:
+            request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+            # Getting the header may refresh an OAuth token with a blocking request
+            auth_header = await loop.run_in_executor(None, self.authenticator.get_auth_header)
+            request = self._create_prepared_request(
+                path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                headers=dict(request_headers, **auth_header),
+                params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            )
+            request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+            response = await self._send_request_async(request, request_kwargs)
+
+            yield await loop.run_in_executor(
+                None, lambda: list(self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice))
+            )
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                break
+
+    async def read_records_async(
+        self,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """
+        Async counterpart of read_records, to be used from coroutines running on EventLoopThread.get().loop.
+        """
+        async for page in self.read_pages_async(stream_slice=stream_slice, stream_state=stream_state):
+            for record in page:
+                yield record
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        event_loop = EventLoopThread.get()
+        pages = self.read_pages_async(stream_slice=stream_slice, stream_state=stream_state)
+        try:
+            while True:
+                try:
+                    page = event_loop.run(pages.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield from page
+        finally:
+            event_loop.run(pages.aclose())
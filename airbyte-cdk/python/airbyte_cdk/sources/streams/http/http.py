@@ -4,24 +4,29 @@
 
 
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Set, Union
 from urllib.parse import urljoin
 
 import requests
-import vcr
-import vcr.cassette as Cassette
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.utils.concurrency import interleave
 from requests.auth import AuthBase
 
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
-from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .rate_limiting import RateLimiter, default_backoff_handler, user_defined_backoff_handler
+from .response_cache import ResponseCache
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("POST", "PUT", "PATCH")
 
+# cache files already deleted by this process, so a stream never deletes the file of another stream using the same cache_filename
+_cleared_cache_files: Set[str] = set()
+_cleared_cache_files_lock = threading.Lock()
+
 
 class HttpStream(Stream, ABC):
     """
@@ -30,10 +35,19 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
     page_size = None  # Use this variable to define page size for API http requests with pagination support
+    rate_limiter: Optional[RateLimiter] = None  # Client side rate limit, pass the same instance to all streams of a source to share it
+    response_cache: Optional[ResponseCache] = None  # Cache used when use_cache is True, pass the same instance to all streams to share it
 
     # TODO: remove legacy HttpAuthenticator authenticator references
-    def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None):
+    def __init__(
+        self,
+        authenticator: Union[AuthBase, HttpAuthenticator] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         self._session = requests.Session()
+        if rate_limiter:
+            self.rate_limiter = rate_limiter
 
         self._authenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
@@ -41,17 +55,17 @@ class HttpStream(Stream, ABC):
         elif authenticator:
             self._authenticator = authenticator
 
-        if self.use_cache:
-            self.cache_file = self.request_cache()
-            # we need this attr to get metadata about cassettes, such as record play count, all records played, etc.
-            self.cassete = None
+        if response_cache is not None:
+            self.response_cache = response_cache
+        # the stream's own cache is only built on the first request, see _get_response_cache()
+        self._response_cache_lock = threading.Lock()
 
     @property
     def cache_filename(self):
         """
         Override if needed. Return the name of cache file
         """
-        return f"{self.name}.yml"
+        return f"{self.name}.sqlite"
 
     @property
     def use_cache(self):
@@ -60,19 +74,34 @@ class HttpStream(Stream, ABC):
         """
         return False
 
-    def request_cache(self) -> Cassette:
+    def request_cache(self) -> ResponseCache:
         """
-        Builds VCR instance.
-        It deletes file everytime we create it, normally should be called only once.
-        We can't use NamedTemporaryFile here because yaml serializer doesn't work well with empty files.
+        Builds the response cache of the stream, used when no cache was passed to the constructor.
+        It is called once, before the first request of the stream. The cache file left by a previous sync is deleted by the first
+        stream of the process using it, later streams with the same cache_filename open the file as is.
         """
 
-        try:
-            os.remove(self.cache_filename)
-        except FileNotFoundError:
-            pass
+        with _cleared_cache_files_lock:
+            path = os.path.abspath(self.cache_filename)
+            if path not in _cleared_cache_files:
+                for filename in (path, f"{path}-wal", f"{path}-shm"):
+                    try:
+                        os.remove(filename)
+                    except FileNotFoundError:
+                        pass
+                _cleared_cache_files.add(path)
+
+        return ResponseCache(self.cache_filename)
 
-        return vcr.use_cassette(self.cache_filename, record_mode="new_episodes", serializer="yaml")
+    def _get_response_cache(self) -> ResponseCache:
+        """
+        :return: the response cache passed to the constructor, or else the cache built by request_cache() on the first call,
+        so only reading the stream touches the filesystem, unlike e.g: listing the streams for check or discover
+        """
+        with self._response_cache_lock:
+            if self.response_cache is None:
+                self.response_cache = self.request_cache()
+            return self.response_cache
 
     @property
     @abstractmethod
@@ -109,6 +138,19 @@ class HttpStream(Stream, ABC):
         """
         return 5
 
+    @property
+    def prefetch_pages(self) -> int:
+        """
+        Override if needed. Number of responses waiting to be parsed which a background thread requests ahead while the records of
+        the current page are being parsed and processed, 0 to request the next page only once the current page is done.
+        Once that many responses wait, the thread still requests one more page and holds it until there is room, so up to
+        prefetch_pages + 1 pages are requested ahead of the page being parsed.
+
+        Only enable it if next_page_token computes the token from the response alone: it is called before parse_response
+        has run for that response.
+        """
+        return 0
+
     @property
     def authenticator(self) -> HttpAuthenticator:
         return self._authenticator
@@ -271,8 +313,26 @@ class HttpStream(Stream, ABC):
 
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
-        """
-        response: requests.Response = self._session.send(request, **request_kwargs)
+
+        If the stream has a rate_limiter, the request waits for it before being sent and the response headers are passed back to it.
+        If use_cache is True, successful responses are stored in the response cache and the same requests are answered from it.
+        """
+        response = self._get_response_cache().get(request) if self.use_cache else None
+        if response is not None:
+            return response
+
+        if self.rate_limiter:
+            url = request.url
+            if url is None:
+                raise ValueError(f"The request of stream {self.name} has no url")
+            self.rate_limiter.acquire(url)
+            response = None
+            try:
+                response = self._session.send(request, **request_kwargs)
+            finally:
+                self.rate_limiter.release(url, response)
+        else:
+            response = self._session.send(request, **request_kwargs)
 
         if self.should_retry(response):
             custom_backoff_time = self.backoff_time(response)
@@ -284,6 +344,9 @@ class HttpStream(Stream, ABC):
             # Raise any HTTP exceptions that happened in case there were unexpected ones
             response.raise_for_status()
 
+        if self.use_cache and response.ok:
+            self._get_response_cache().set(request, response)
+
         return response
 
     def _send_request(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
@@ -318,14 +381,12 @@ class HttpStream(Stream, ABC):
         backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
         return backoff_handler(user_backoff_handler)(request, request_kwargs)
 
-    def read_records(
-        self,
-        sync_mode: SyncMode,
-        cursor_field: List[str] = None,
-        stream_slice: Mapping[str, Any] = None,
-        stream_state: Mapping[str, Any] = None,
-    ) -> Iterable[Mapping[str, Any]]:
-        stream_state = stream_state or {}
+    def _read_pages(self, stream_slice: Mapping[str, Any], stream_state: Mapping[str, Any]) -> Iterator[requests.Response]:
+        """
+        Requests the pages of the slice one after another.
+        :return: iterator over the responses, the token of the next page is computed once the consumer asks for the next response,
+        which happens before the current response is parsed when prefetching
+        """
         pagination_complete = False
 
         next_page_token = None
@@ -339,29 +400,47 @@ class HttpStream(Stream, ABC):
                 data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
             )
             request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+            response = self._send_request(request, request_kwargs)
 
-            if self.use_cache:
-                # use context manager to handle and store cassette metadata
-                with self.cache_file as cass:
-                    self.cassete = cass
-                    # vcr tries to find records based on the request, if such records exist, return from cache file
-                    # else make a request and save record in cache file
-                    response = self._send_request(request, request_kwargs)
-
-            else:
-                response = self._send_request(request, request_kwargs)
-
-            yield from self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            yield response
 
             next_page_token = self.next_page_token(response)
             if not next_page_token:
                 pagination_complete = True
 
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        stream_state = stream_state or {}
+        if self.prefetch_pages > 0:
+            # A single producer thread requests the pages, it blocks with the next response once prefetch_pages responses wait to be parsed
+            responses = interleave(
+                [lambda: self._read_pages(stream_slice=stream_slice, stream_state=stream_state)],
+                max_workers=1,
+                buffer_size=self.prefetch_pages,
+            )
+        else:
+            responses = self._read_pages(stream_slice=stream_slice, stream_state=stream_state)
+
+        for response in responses:
+            yield from self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
 
 class HttpSubStream(HttpStream, ABC):
+    """
+    Stream reading the children of each record of a parent stream, one slice per parent record.
+
+    The parent records are read lazily while the slices are consumed. Set max_concurrent_slices to read the children of that many
+    parents at the same time, and pass the same RateLimiter to the parent and the substream so their requests share one budget.
+    """
+
     def __init__(self, parent: HttpStream, **kwargs):
         """
         :param parent: should be the instance of HttpStream class
@@ -3,10 +3,16 @@
 #
 
 
+import asyncio
+import re
 import sys
+import threading
 import time
+from contextlib import contextmanager
+from typing import Iterator, List, Mapping, Optional
 
 import backoff
+import requests
 from airbyte_cdk.logger import AirbyteLogger
 from requests import codes, exceptions
 
@@ -66,3 +72,150 @@ def user_defined_backoff_handler(max_tries: int, **kwargs):
         max_tries=max_tries,
         **kwargs,
     )
+
+
+class RateLimiter:
+    """
+    Client side rate limit shared by the streams of a source, pass the same instance to each HttpStream constructor.
+
+    Requests are limited with a token bucket holding up to `calls` tokens and refilled at `calls` per `period` seconds,
+    and optionally by a maximum number of requests in flight. Endpoint specific limits are applied on top of this one to the
+    requests whose URL matches their regex, e.g: RateLimiter(10, 1, endpoints={"/search": RateLimiter(1, 1)}).
+
+    The limiter also adapts to the rate limit headers of responses: a Retry-After header, or an exhausted remaining quota
+    header, pauses all requests going through this limiter until the server accepts requests again.
+    """
+
+    # How often a request waiting for a free concurrency slot checks again
+    poll_interval_seconds = 0.05
+
+    def __init__(
+        self,
+        calls: int,
+        period: float,
+        max_concurrent_requests: Optional[int] = None,
+        endpoints: Optional[Mapping[str, "RateLimiter"]] = None,
+        remaining_header: str = "X-RateLimit-Remaining",
+        reset_header: str = "X-RateLimit-Reset",
+        retry_after_header: str = "Retry-After",
+    ):
+        """
+        :param calls: number of requests allowed per period, also the maximum burst size
+        :param period: length of the period in seconds, e.g: RateLimiter(calls=120, period=60) for 120 requests per minute
+        :param max_concurrent_requests: maximum number of requests in flight at the same time, None for no limit
+        :param endpoints: regex matched against request URLs -> additional limiter for the matching requests
+        :param remaining_header: response header holding the number of requests left in the current window
+        :param reset_header: response header holding when the window resets, in seconds from now or as epoch seconds
+        :param retry_after_header: response header holding how many seconds to wait before the next request
+        """
+        self.calls = calls
+        self.period = period
+        self.max_concurrent_requests = max_concurrent_requests
+        self.endpoints = {re.compile(pattern): limiter for pattern, limiter in (endpoints or {}).items()}
+        self.remaining_header = remaining_header
+        self.reset_header = reset_header
+        self.retry_after_header = retry_after_header
+
+        self._lock = threading.Lock()
+        self._tokens = float(calls)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._in_flight = 0
+
+    def _limiters(self, url: str) -> List["RateLimiter"]:
+        """:return: the limiters applying to the url, endpoint specific ones first"""
+        limiters = [limiter for pattern, limiter in self.endpoints.items() if pattern.search(url)]
+        return [limiter for endpoint_limiter in limiters for limiter in endpoint_limiter._limiters(url)] + [self]
+
+    def _try_acquire(self) -> float:
+        """
+        Takes a token and a concurrency slot if both are available.
+        :return: 0 if acquired, otherwise the number of seconds to wait before trying again
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.calls), self._tokens + (now - self._last_refill) * self.calls / self.period)
+            self._last_refill = now
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self._tokens < 1:
+                return (1 - self._tokens) * self.period / self.calls
+            if self.max_concurrent_requests and self._in_flight >= self.max_concurrent_requests:
+                return self.poll_interval_seconds
+            self._tokens -= 1
+            self._in_flight += 1
+            return 0
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def acquire(self, url: str):
+        """
+        Blocks until a request to the url is allowed. Every acquire must be followed by a release.
+        """
+        for limiter in self._limiters(url):
+            wait = limiter._try_acquire()
+            while wait:
+                time.sleep(wait)
+                wait = limiter._try_acquire()
+
+    async def acquire_async(self, url: str):
+        """
+        Same as acquire, without blocking the event loop.
+        """
+        for limiter in self._limiters(url):
+            wait = limiter._try_acquire()
+            while wait:
+                await asyncio.sleep(wait)
+                wait = limiter._try_acquire()
+
+    def release(self, url: str, response: Optional[requests.Response] = None):
+        """
+        Frees the concurrency slot taken by acquire and updates the limiters from the rate limit headers of the response.
+        """
+        for limiter in self._limiters(url):
+            limiter._release()
+            if response is not None:
+                limiter._update_from_response(response)
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """
+        Context manager around sending a request, use release directly to pass the response headers back.
+        """
+        self.acquire(url)
+        try:
+            yield
+        finally:
+            self.release(url)
+
+    def _update_from_response(self, response: requests.Response):
+        headers = response.headers
+        pause: Optional[float] = None
+        retry_after = self._parse_seconds(headers.get(self.retry_after_header))
+        if retry_after is not None:
+            pause = retry_after
+        remaining = self._parse_seconds(headers.get(self.remaining_header))
+        if remaining is not None and remaining < 1 and pause is None:
+            reset = self._parse_seconds(headers.get(self.reset_header))
+            if reset is not None and reset > self.period * 1000:
+                # the reset time is an epoch timestamp rather than a number of seconds
+                reset -= time.time()
+            pause = reset if reset is not None else self.period / self.calls
+
+        with self._lock:
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+            if pause is not None and pause > 0:
+                blocked_until = time.monotonic() + pause
+                if blocked_until > self._blocked_until:
+                    logger.info(f"Rate limit reached, pausing requests for {pause:.1f} seconds")
+                    self._blocked_until = blocked_until
+
+    @staticmethod
+    def _parse_seconds(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
@@ -0,0 +1,181 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    reason TEXT,
+    url TEXT,
+    encoding TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class ResponseCache:
+    """
+    On-disk cache of HTTP responses backed by an indexed sqlite database.
+
+    Responses are keyed by a fingerprint of the request method, url and body, headers are ignored so rotating credentials don't
+    invalidate entries. Bodies are stored zlib compressed. Once the bodies stored exceed max_size_bytes, the least recently
+    used responses are evicted, and responses older than ttl_seconds are treated as missing.
+
+    The cache is thread-safe, and as keys only depend on the request, one cache can be shared by all streams of a source.
+    """
+
+    def __init__(self, path: str, max_size_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None, compression_level: int = 1):
+        """
+        :param path: sqlite database file, created if it does not exist
+        :param max_size_bytes: maximum size of the compressed bodies stored, None for no limit
+        :param ttl_seconds: how long responses are served from the cache, None for no expiry
+        :param compression_level: zlib compression level of the bodies, from 0 (no compression) to 9
+        """
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+        self.compression_level = compression_level
+        # Number of requests answered from the cache
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        # The database is opened on first use, so building a cache e.g: while listing the streams for discover creates no file
+        self._connection: Optional[sqlite3.Connection] = None
+        self._size = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        :return: the connection to the database, opened on the first call, which must be made holding the lock
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            # The cache is a scratch file, trade durability for write speed
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(CREATE_TABLE)
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+            self._size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def fingerprint(request: requests.PreparedRequest) -> str:
+        if request.method is None or request.url is None:
+            raise ValueError("Only prepared requests with a method and url can be cached")
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha256()
+        for part in (request.method.encode("utf-8"), request.url.encode("utf-8"), body):
+            digest.update(part)
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """
+        :return: the cached response to the request, None if it is not cached or expired
+        """
+        key = self.fingerprint(request)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT status_code, reason, url, encoding, headers, body, size, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and self.ttl_seconds is not None and now - row[7] > self.ttl_seconds:
+                self._delete(key, row[6])
+                row = None
+            if not row:
+                self.misses += 1
+                return None
+            connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        status_code, reason, url, encoding, headers, body, _, _ = row
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = reason
+        response.url = url
+        response.encoding = encoding
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.request = request
+        response._content = zlib.decompress(body)
+        return response
+
+    def set(self, request: requests.PreparedRequest, response: requests.Response):
+        """
+        Stores the response to the request, then evicts the least recently used responses if the cache is over its size limit.
+        """
+        key = self.fingerprint(request)
+        body = zlib.compress(response.content or b"", self.compression_level)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            previous = connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if previous:
+                self._size -= previous[0]
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    response.reason,
+                    response.url,
+                    response.encoding,
+                    json.dumps(dict(response.headers)),
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._size += len(body)
+            if self.max_size_bytes is not None:
+                self._evict(self.max_size_bytes)
+
+    def _evict(self, max_size_bytes: int):
+        connection = self._connect()
+        rows = connection.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        evicted = []
+        for key, size in rows:
+            if self._size <= max_size_bytes:
+                break
+            evicted.append((key,))
+            self._size -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def _delete(self, key: str, size: int):
+        self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._size -= size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
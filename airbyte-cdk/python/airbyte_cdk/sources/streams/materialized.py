@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import os
+import tempfile
+import weakref
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Union
+
+from airbyte_cdk.models import SyncMode
+
+from .core import Stream
+
+
+class MaterializedStream(Stream):
+    """
+    Wraps the parent stream of several substreams so the parent is read only once per sync.
+
+    The first time its records are read to the end, the parent is read in full refresh mode, slice by slice, and its records are
+    spooled to a temporary file. Following reads, e.g: by the other substreams of the source, iterate over the spooled records
+    instead of reading the parent again. Pass fields to only spool the fields the substreams need, e.g: the key of each parent record.
+    A read stopped before the end is not spooled, the parent is read again by the next consumer.
+
+    A MaterializedStream can be passed as the parent of an HttpSubStream: it has a single slice and returns all the records of the
+    parent whatever the arguments of read_records.
+    """
+
+    def __init__(self, parent: Stream, fields: Optional[List[str]] = None):
+        """
+        :param parent: stream whose records are shared
+        :param fields: fields kept from each parent record, defaults to all fields
+        """
+        self.parent = parent
+        self.fields = fields
+        self._spool_path: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.parent.name
+
+    @property
+    def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
+        return self.parent.primary_key
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return self.parent.get_json_schema()
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the parent records were spooled, i.e: the parent won't be read again"""
+        return self._spool_path is not None
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        :return: the records of all slices of the parent, from the spool once materialized
+        """
+        if self._spool_path is not None:
+            return self._read_spool(self._spool_path)
+        return self._materialize()
+
+    def _project(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
+        if self.fields is None:
+            return record
+        return {field: record[field] for field in self.fields if field in record}
+
+    def _materialize(self) -> Iterator[Mapping[str, Any]]:
+        fd, path = tempfile.mkstemp(prefix=f"{self.name}_", suffix=".jsonl")
+        try:
+            with os.fdopen(fd, "w") as spool:
+                for stream_slice in self.parent.stream_slices(sync_mode=SyncMode.full_refresh):
+                    for record in self.parent.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice):
+                        record = self._project(record)
+                        spool.write(json.dumps(record, default=str))
+                        spool.write("\n")
+                        yield record
+        except BaseException:
+            # includes GeneratorExit, raised when the consumer stops iterating early
+            os.remove(path)
+            raise
+
+        if self._spool_path is None:
+            self._spool_path = path
+            # the spool is removed along with this stream at the end of the sync
+            weakref.finalize(self, os.remove, path)
+        else:
+            # another consumer materialized the parent while this one was reading it
+            os.remove(path)
+
+    @staticmethod
+    def _read_spool(path: str) -> Iterator[Mapping[str, Any]]:
+        # each read opens the spool, so reads of the same stream can be interleaved
+        with open(path) as spool:
+            for line in spool:
+                yield json.loads(line)
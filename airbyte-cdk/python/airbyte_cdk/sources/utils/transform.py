@@ -2,15 +2,30 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import numbers
+import time
+from collections import OrderedDict
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 from airbyte_cdk.logger import AirbyteLogger
-from jsonschema import Draft7Validator, validators
+from jsonschema import Draft7Validator, RefResolver, validators
+from jsonschema.exceptions import RefResolutionError
 
 logger = AirbyteLogger()
 
+# Type checks used by the compiled normalizer, these follow the Draft 7 type checker of jsonschema.
+JSON_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, numbers.Number) and not isinstance(value, bool),
+    "integer": lambda value: (isinstance(value, int) and not isinstance(value, bool)) or (isinstance(value, float) and value.is_integer()),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+}
+
 
 class TransformConfig(Flag):
     """
@@ -29,6 +44,11 @@ class TransformConfig(Flag):
     # with DefaultSchemaNormalization. In this case default type casting would
     # be applied before custom one.
     CustomSchemaNormalization = auto()
+    # Compile each stream schema once into per-field conversion functions
+    # instead of traversing it with a jsonschema validator for every record.
+    # Repeated warnings about the same field are rate limited. Combine with
+    # DefaultSchemaNormalization and/or CustomSchemaNormalization.
+    CompiledSchemaNormalization = auto()
 
 
 class TypeTransformer:
@@ -37,6 +57,10 @@ class TypeTransformer:
     """
 
     _custom_normalizer: Callable[[Any, Dict[str, Any]], Any] = None
+    # Minimum number of seconds between two warnings about the same field with CompiledSchemaNormalization
+    warning_interval_seconds: float = 60
+    # Maximum number of schemas kept compiled with CompiledSchemaNormalization, the least recently used one is dropped first
+    max_compiled_schemas: int = 32
 
     def __init__(self, config: TransformConfig):
         """
@@ -53,6 +77,11 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # id of the schema -> (schema, compiled normalizer) in least recently used order, the schema is kept to make sure its id
+        # is not reused while it is cached
+        self._compiled_normalizers: "OrderedDict[int, Tuple[Dict[str, Any], Callable[[Any], None]]]" = OrderedDict()
+        # (schema path, validator) -> (time of the last warning, number of warnings suppressed since then)
+        self._warnings: Dict[Tuple[str, str], Tuple[float, int]] = {}
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -66,6 +95,8 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        # Schemas compiled so far don't call the new callback
+        self._compiled_normalizers.clear()
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -160,6 +191,186 @@ class TypeTransformer:
 
         return normalizator
 
+    def __compile_converter(self, subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+        """
+        Build the function converting a field value, it applies the same conversions as __normalize but
+        with the target type of default_convert worked out once.
+        :param subschema part of the jsonschema containing field type/format data.
+        """
+        # The callback is stored on the instance, it is not a method bound to it
+        custom_normalizer = cast(Optional[Callable[[Any, Dict[str, Any]], Any]], self._custom_normalizer)
+        if TransformConfig.DefaultSchemaNormalization not in self._config:
+            if custom_normalizer:
+                # bound to a local since the narrowed type does not carry over into the lambda
+                normalizer = custom_normalizer
+                return lambda value: normalizer(value, subschema)
+            return lambda value: value
+
+        target_type = subschema.get("type")
+        nullable = isinstance(target_type, (list, str)) and "null" in target_type
+        if isinstance(target_type, list):
+            target_types = [t for t in target_type if t != "null"]
+            target_type = target_types[0] if len(target_types) == 1 else None
+        casts: Dict[str, Callable[[Any], Any]] = {
+            "string": str,
+            "number": float,
+            "integer": int,
+            "boolean": lambda value: strtobool(value) == 1 if isinstance(value, str) else bool(value),
+        }
+        cast_value = casts.get(target_type) if isinstance(target_type, str) else None
+
+        def convert(value: Any) -> Any:
+            if cast_value and not (value is None and nullable):
+                try:
+                    value = cast_value(value)
+                except (TypeError, ValueError):
+                    pass
+            if custom_normalizer:
+                value = custom_normalizer(value, subschema)
+            return value
+
+        return convert
+
+    def __compile(self, schema: Any, resolver: RefResolver, path: str, compiled: Dict[int, Callable[[Any], None]]) -> Callable[[Any], None]:
+        """
+        Compile the part of the jsonschema into a function which normalizes an instance of it in place and warns about
+        values of unexpected types. Only the keywords used by the jsonschema based normalizer are supported: type,
+        properties, items and $ref.
+        :param schema part of the jsonschema to compile.
+        :param resolver resolver of $ref keywords against the root jsonschema.
+        :param path location of the schema part within the record, used to group warnings.
+        :param compiled functions compiled so far by schema id, needed to support recursive references.
+        """
+        if not isinstance(schema, dict):
+            return lambda instance: None
+        if id(schema) in compiled:
+            return lambda instance: compiled[id(schema)](instance)
+
+        # Placeholder to break cycles of recursive references, replaced once the schema is compiled
+        compiled[id(schema)] = lambda instance: None
+        if "$ref" in schema:
+            try:
+                with resolver.resolving(schema["$ref"]) as resolved:
+                    resolved_normalize = self.__compile(resolved, resolver, path, compiled)
+            except RefResolutionError as error:
+                # Unresolvable references only fail records which actually have the field, as with the jsonschema normalizer
+                resolved_normalize = self.__failing(error)
+            compiled[id(schema)] = resolved_normalize
+            return resolved_normalize
+
+        steps: List[Callable[[Any], None]] = []
+        for key, value in schema.items():
+            if key == "type":
+                steps.append(self.__compile_type_check(value, path))
+            elif key == "properties" and isinstance(value, dict):
+                steps.append(self.__compile_properties(value, resolver, path, compiled))
+            elif key == "items" and isinstance(value, dict):
+                steps.append(self.__compile_items(value, resolver, path, compiled))
+
+        def normalize(instance: Any):
+            for step in steps:
+                step(instance)
+
+        compiled[id(schema)] = normalize
+        return normalize
+
+    def __compile_field_converter(self, subschema: Any, resolver: RefResolver) -> Callable[[Any], Any]:
+        try:
+            while isinstance(subschema, dict) and "$ref" in subschema:
+                _, subschema = resolver.resolve(subschema["$ref"])
+        except RefResolutionError as error:
+            return self.__failing(error)
+        if not isinstance(subschema, dict):
+            return lambda value: value
+        return self.__compile_converter(subschema)
+
+    @staticmethod
+    def __failing(error: Exception) -> Callable[[Any], Any]:
+        def fail(value: Any):
+            raise error
+
+        return fail
+
+    def __compile_type_check(self, types: Any, path: str) -> Callable[[Any], None]:
+        types = types if isinstance(types, list) else [types]
+        checks = [JSON_TYPE_CHECKS[t] for t in types if t in JSON_TYPE_CHECKS]
+        if len(checks) != len(types):
+            # Unknown types can't be checked
+            return lambda instance: None
+        types_repr = ", ".join(repr(t) for t in types)
+
+        def check_type(instance: Any):
+            if not any(check(instance) for check in checks):
+                self.__warn(path, "type", f"{instance!r} is not of type {types_repr}")
+
+        return check_type
+
+    def __compile_properties(
+        self, properties: Dict[str, Any], resolver: RefResolver, path: str, compiled: Dict[int, Callable[[Any], None]]
+    ) -> Callable[[Any], None]:
+        fields = []
+        for name, subschema in properties.items():
+            field_path = f"{path}.{name}" if path else name
+            convert = self.__compile_field_converter(subschema, resolver)
+            fields.append((name, convert, self.__compile(subschema, resolver, field_path, compiled)))
+
+        def normalize_properties(instance: Any):
+            if not isinstance(instance, dict):
+                return
+            for name, convert, normalize in fields:
+                if name in instance:
+                    value = instance[name] = convert(instance[name])
+                    normalize(value)
+
+        return normalize_properties
+
+    def __compile_items(
+        self, items: Dict[str, Any], resolver: RefResolver, path: str, compiled: Dict[int, Callable[[Any], None]]
+    ) -> Callable[[Any], None]:
+        convert = self.__compile_field_converter(items, resolver)
+        normalize = self.__compile(items, resolver, f"{path}[]", compiled)
+
+        def normalize_items(instance: Any):
+            if not isinstance(instance, list):
+                return
+            for index, item in enumerate(instance):
+                value = instance[index] = convert(item)
+                normalize(value)
+
+        return normalize_items
+
+    def __warn(self, path: str, validator: str, message: str):
+        """
+        Log a warning about a field unless one was logged for the same field less than warning_interval_seconds ago.
+        The number of warnings suppressed in between is added to the next logged one.
+        """
+        key = (path, validator)
+        now = time.monotonic()
+        last_warned_at, suppressed = self._warnings.get(key, (None, 0))
+        if last_warned_at is not None and now - last_warned_at < self.warning_interval_seconds:
+            self._warnings[key] = (last_warned_at, suppressed + 1)
+            return
+        self._warnings[key] = (now, 0)
+        if suppressed:
+            message = f"{message} ({suppressed} similar warnings for field '{path}' were suppressed)"
+        logger.warn(message)
+
+    def _get_compiled_normalizer(self, schema: Dict[str, Any]) -> Callable[[Any], None]:
+        """
+        Compile the jsonschema on first use, schemas are expected not to change once passed to transform.
+        Up to max_compiled_schemas schemas are kept compiled, so pass the same schema object to every call to avoid recompiling it.
+        :schema object's jsonschema for normalization.
+        """
+        schema_id = id(schema)
+        if schema_id in self._compiled_normalizers:
+            self._compiled_normalizers.move_to_end(schema_id)
+            return self._compiled_normalizers[schema_id][1]
+        normalize = self.__compile(schema, RefResolver.from_schema(schema), "", {})
+        self._compiled_normalizers[schema_id] = (schema, normalize)
+        while len(self._compiled_normalizers) > self.max_compiled_schemas:
+            self._compiled_normalizers.popitem(last=False)
+        return normalize
+
     def transform(self, record: Dict[str, Any], schema: Dict[str, Any]):
         """
         Normalize and validate according to config.
@@ -168,6 +379,9 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        if TransformConfig.CompiledSchemaNormalization in self._config:
+            self._get_compiled_normalizer(schema)(record)
+            return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Tuple, TypeVar
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+# How long a blocked producer waits before re-checking whether the consumer has gone away
+_PUT_TIMEOUT_SECONDS = 0.1
+
+
+class _Done:
+    """Sentinel put on the output queue by a producer once its iterable is exhausted"""
+
+
+class _Failed:
+    """Wraps an exception raised by a producer so it can be re-raised in the consumer thread"""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def interleave(producers: List[Callable[[], Iterable[T]]], max_workers: int, buffer_size: int = 1000) -> Iterator[T]:
+    """
+    Runs each producer on a thread pool of max_workers threads and yields the items of all of them through one queue
+    as soon as they are produced. Items of a single producer keep their relative order, items of different producers
+    are interleaved in the order they were produced.
+
+    The queue holds at most buffer_size items, so fast producers block until the consumer catches up. The first exception
+    raised by any producer is re-raised to the consumer, after which all remaining producers are stopped.
+
+    :param producers: callables returning the iterables to read, each one is called inside a worker thread
+    :param max_workers: maximum number of producers running at the same time
+    :param buffer_size: maximum number of produced items waiting to be consumed
+    """
+    output: queue.Queue = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=_PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(producer: Callable[[], Iterable[T]]):
+        if stop.is_set():
+            return
+        try:
+            for item in producer():
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failed(e))
+            return
+        put(_Done())
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for producer in producers:
+            executor.submit(run, producer)
+
+        remaining = len(producers)
+        while remaining:
+            item = output.get()
+            if isinstance(item, _Done):
+                remaining -= 1
+            elif isinstance(item, _Failed):
+                raise item.exception
+            else:
+                yield item
+    finally:
+        # Unblock producers waiting on a full queue, then wait for every worker to exit
+        stop.set()
+        executor.shutdown(wait=True)
+
+
+def map_in_order(func: Callable[[S], T], items: Iterable[S], max_workers: int) -> Iterator[T]:
+    """
+    Applies func to every item on a thread pool of max_workers threads and yields the results in the order of items.
+
+    Items are pulled lazily: at most max_workers calls are in flight at any time, so the number of results held in memory
+    while waiting for a slower earlier call is bounded as well. An exception raised by func is re-raised to the consumer
+    when its result is due, and calls which did not start yet are cancelled.
+
+    :param func: function to apply, called inside a worker thread
+    :param items: inputs of func, consumed in the calling thread
+    :param max_workers: maximum number of calls running at the same time
+    """
+    pending: Deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def read_ahead(items: Iterable[T], count: int) -> Iterator[T]:
+    """
+    Yields the items of the iterable in order, pulling up to count items ahead of the one last yielded.
+    No threads are involved: this is for iterables with side effects on which later work depends, e.g: submitting a job.
+    """
+    pending: Deque[T] = deque()
+    for item in items:
+        pending.append(item)
+        if len(pending) > count:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+
+def fan_out(parents: Iterable[S], read_children: Callable[[S], Iterable[T]], max_workers: int) -> Iterator[Tuple[S, List[T]]]:
+    """
+    Reads the children of every parent, e.g: the comments of each ticket, and yields each parent with its children in the order of parents.
+
+    Parents are pulled lazily, so they can be streamed from the parent stream instead of being collected first, and the children of up to
+    max_workers parents are read at the same time on worker threads. Children are held in memory until the children of all earlier
+    parents were yielded. Pass the same RateLimiter to the parent and child streams so the requests of all workers share one budget.
+    With max_workers of 1 or less, the children are read one parent after another in the calling thread.
+
+    :param parents: parents to read the children of, consumed in the calling thread
+    :param read_children: returns the children of a parent, called inside a worker thread
+    :param max_workers: maximum number of parents whose children are read at the same time
+    """
+    if max_workers <= 1:
+        for parent in parents:
+            yield parent, list(read_children(parent))
+        return
+
+    yield from map_in_order(lambda parent: (parent, list(read_children(parent))), parents, max_workers=max_workers)
@@ -0,0 +1,92 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import atexit
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+# Messages are serialized with their type as the first field, see airbyte_cdk.utils.serialization
+RECORD_MESSAGE_PREFIX = '{"type": "RECORD"'
+
+
+class OutputBuffer:
+    """
+    Thread-safe buffered writer of newline delimited messages to stdout.
+
+    Messages are encoded and accumulated in memory, then written to the binary stdout in one call once the buffer holds
+    max_bytes, once max_interval_seconds passed since the last write to stdout, when a message asks for an immediate flush
+    (e.g: STATE messages, so the platform sees checkpoints promptly) and at interpreter exit. The interval is checked by a
+    background thread, started on the first write, so buffered messages are flushed while the source waits on a slow request.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024, max_interval_seconds: float = 1.0, output: Optional[TextIO] = None):
+        """
+        :param max_bytes: buffer size which triggers a flush
+        :param max_interval_seconds: maximum time buffered messages wait for a flush
+        :param output: text stream to write to, defaults to the sys.stdout of the moment of the flush
+        """
+        self.max_bytes = max_bytes
+        self.max_interval_seconds = max_interval_seconds
+        self._output = output
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._flusher: Optional[threading.Thread] = None
+
+    def write(self, message: str, flush: bool = False):
+        """
+        Adds a message to the buffer, a newline is appended to it.
+        :param message: serialized message
+        :param flush: write the buffer to stdout right after adding the message
+        """
+        with self._lock:
+            self._buffer += message.encode("utf-8")
+            self._buffer += b"\n"
+            if flush or len(self._buffer) >= self.max_bytes or time.monotonic() - self._last_flush >= self.max_interval_seconds:
+                self._flush()
+            elif not self._flusher:
+                self._flusher = threading.Thread(target=self._flush_periodically, name="output-buffer-flusher", daemon=True)
+                self._flusher.start()
+
+    def write_message(self, message: str):
+        """
+        Adds a serialized AirbyteMessage to the buffer, flushing right away for anything but RECORD messages
+        so STATE and LOG messages are never held back.
+        """
+        self.write(message, flush=not message.startswith(RECORD_MESSAGE_PREFIX))
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush_periodically(self):
+        while True:
+            with self._lock:
+                wait_seconds = self._last_flush + self.max_interval_seconds - time.monotonic()
+                if wait_seconds <= 0:
+                    self._flush()
+                    wait_seconds = self.max_interval_seconds
+            time.sleep(wait_seconds)
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        output = self._output or sys.stdout
+        # Text written by other writers of the stream (e.g: logging handlers) must reach the stream before our bytes
+        output.flush()
+        binary_output = getattr(output, "buffer", None)
+        if binary_output is not None:
+            binary_output.write(bytes(self._buffer))
+            binary_output.flush()
+        else:
+            output.write(self._buffer.decode("utf-8"))
+            output.flush()
+        self._buffer.clear()
+
+
+stdout_buffer = OutputBuffer()
+atexit.register(stdout_buffer.flush)
@@ -0,0 +1,26 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+from airbyte_cdk.models import AirbyteMessage, Type
+from pydantic.json import pydantic_encoder
+
+
+def airbyte_message_to_json(message: AirbyteMessage) -> str:
+    """
+    Serializes an AirbyteMessage the same way as message.json(exclude_unset=True) does.
+
+    RECORD messages are by far the most frequent ones, so they are written straight from the record's fields instead of
+    going through pydantic's recursive dict conversion. The output is identical for both paths.
+    :param message: message to serialize
+    :return: JSON representation of the message
+    """
+    record = message.record
+    if message.type != Type.RECORD or record is None:
+        return message.json(exclude_unset=True)
+
+    # Keep pydantic's field order and exclude_unset semantics so the output stays byte-identical
+    record_fields = {name: value for name, value in record.__dict__.items() if name in record.__fields_set__}
+    return json.dumps({"type": Type.RECORD.value, "record": record_fields}, default=pydantic_encoder)
@@ -15,7 +15,7 @@ README = (HERE / "README.md").read_text()
 
 setup(
     name="airbyte-cdk",
-    version="0.1.39",
+    version="0.1.55",
     description="A framework for writing Airbyte Connectors.",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -52,12 +52,12 @@ setup(
         "pydantic~=1.6",
         "PyYAML~=5.4",
         "requests",
-        "vcrpy",
         "Deprecated~=1.2",
     ],
     python_requires=">=3.7.0",
     extras_require={
-        "dev": ["MyPy~=0.812", "pytest", "pytest-cov", "pytest-mock", "requests-mock"],
+        "async": ["aiohttp~=3.7"],
+        "dev": ["MyPy~=0.812", "pytest", "pytest-cov", "pytest-mock", "requests-mock", "aiohttp~=3.7"],
         "sphinx-docs": [
             "Sphinx~=4.2",
             "sphinx-rtd-theme~=1.0",
@@ -0,0 +1,175 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import threading
+from typing import Any, List, Mapping
+
+import pytest
+from airbyte_cdk.destinations import BufferedDestination
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, ConfiguredAirbyteCatalog, Type
+
+
+class RecordingDestination(BufferedDestination):
+    max_batch_records = 3
+
+    def __init__(self):
+        self.batches = []
+        self.prepared = False
+
+    def prepare(self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog):
+        self.prepared = True
+
+    def flush_batch(self, stream: str, records: List[AirbyteRecordMessage]):
+        self.batches.append((stream, [record.data["id"] for record in records]))
+
+    def check(self, logger, config):
+        pass
+
+
+def record(stream: str, id: int) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, data={"id": id}, emitted_at=0))
+
+
+def state(value: int) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"value": value}))
+
+
+def write(destination: BufferedDestination, messages: List[AirbyteMessage]) -> List[AirbyteMessage]:
+    return list(destination.write(config={}, configured_catalog=ConfiguredAirbyteCatalog(streams=[]), input_messages=iter(messages)))
+
+
+def test_batches_are_bounded_by_record_count():
+    destination = RecordingDestination()
+
+    output = write(destination, [record("a", i) for i in range(7)] + [record("b", 0)])
+
+    assert destination.prepared
+    assert output == []
+    assert sorted(destination.batches) == [("a", [0, 1, 2]), ("a", [3, 4, 5]), ("a", [6]), ("b", [0])]
+
+
+def test_batches_are_bounded_by_size():
+    destination = RecordingDestination()
+    destination.max_batch_records = 100
+    destination.max_batch_bytes = 20
+    destination.record_size = lambda record: 10
+
+    write(destination, [record("a", i) for i in range(5)])
+
+    assert sorted(destination.batches) == [("a", [0, 1]), ("a", [2, 3]), ("a", [4])]
+
+
+def test_expired_batches_are_flushed(monkeypatch):
+    clock = iter([0, 0, 30, 61, 61])
+    monkeypatch.setattr("airbyte_cdk.destinations.buffered.time.monotonic", lambda: next(clock))
+    destination = RecordingDestination()
+    destination.max_batch_records = 100
+    destination.max_concurrent_flushes = 1
+
+    write(destination, [record("a", 0), record("a", 1), record("a", 2)])
+
+    # the first record was buffered 61 seconds before the last one
+    assert destination.batches == [("a", [0, 1, 2])]
+
+
+def test_expired_batches_are_flushed_while_waiting_for_input():
+    destination = RecordingDestination()
+    destination.max_batch_records = 100
+    destination.max_batch_seconds = 0.05
+    flushed = threading.Event()
+    flush_batch = destination.flush_batch
+
+    def flush_and_notify(stream, records):
+        flush_batch(stream, records)
+        flushed.set()
+
+    destination.flush_batch = flush_and_notify
+
+    def messages():
+        yield record("a", 0)
+        # the source is slow to send the next record
+        assert flushed.wait(timeout=5)
+        yield record("a", 1)
+
+    list(destination.write(config={}, configured_catalog=ConfiguredAirbyteCatalog(streams=[]), input_messages=messages()))
+
+    assert destination.batches == [("a", [0]), ("a", [1])]
+
+
+def test_states_are_output_after_earlier_records_are_flushed():
+    destination = RecordingDestination()
+    b_flushed = threading.Event()
+    flush_batch = destination.flush_batch
+
+    def slow_flush_batch(stream, records):
+        # the batch of stream a finishes after the batch of stream b received later
+        if stream == "a":
+            assert b_flushed.wait(5)
+        flush_batch(stream, records)
+        if stream == "b":
+            b_flushed.set()
+
+    destination.flush_batch = slow_flush_batch
+    messages = [record("a", 0), state(1), record("b", 1), state(2), record("b", 2)]
+
+    output = []
+    for message in destination.write(config={}, configured_catalog=ConfiguredAirbyteCatalog(streams=[]), input_messages=iter(messages)):
+        # every batch received before a state was flushed when the state is output
+        assert message != state(1) or ("a", [0]) in destination.batches
+        assert message != state(2) or ("b", [1]) in destination.batches
+        output.append(message)
+
+    assert output == [state(1), state(2)]
+    assert destination.batches[0] == ("b", [1])
+    assert sorted(destination.batches) == [("a", [0]), ("b", [1]), ("b", [2])]
+
+
+def test_flushing_blocks_at_max_pending_flushes():
+    destination = RecordingDestination()
+    destination.max_batch_records = 1
+    destination.max_concurrent_flushes = 4
+    destination.max_pending_flushes = 2
+    running, max_running = [0], [0]
+    lock = threading.Lock()
+    flush_batch = destination.flush_batch
+
+    def counting_flush_batch(stream, records):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        threading.Event().wait(0.01)
+        with lock:
+            running[0] -= 1
+        flush_batch(stream, records)
+
+    destination.flush_batch = counting_flush_batch
+    output = write(destination, [record("a", i) for i in range(10)] + [state(1)])
+
+    assert output == [state(1)]
+    assert len(destination.batches) == 10
+    # workers are left idle rather than buffering more batches than max_pending_flushes
+    assert max_running[0] <= 2
+
+
+def test_failed_flush_fails_write_without_later_states():
+    destination = RecordingDestination()
+    destination.max_batch_records = 1
+
+    def failing_flush_batch(stream, records):
+        if records[0].data["id"] == 1:
+            raise ConnectionError("closed")
+
+    destination.flush_batch = failing_flush_batch
+    output = []
+    with pytest.raises(ConnectionError):
+        for message in destination.write(
+            config={},
+            configured_catalog=ConfiguredAirbyteCatalog(streams=[]),
+            input_messages=iter([record("a", 0), state(1), record("a", 1), state(2), record("a", 2), state(3)]),
+        ):
+            output.append(message)
+
+    assert state(2) not in output
+    assert state(3) not in output
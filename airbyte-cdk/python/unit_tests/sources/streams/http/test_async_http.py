@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import threading
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from aiohttp import web
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import AsyncHttpStream
+from airbyte_cdk.sources.streams.http.async_http import EventLoopThread
+from airbyte_cdk.utils.concurrency import map_in_order
+
+
+class StubAsyncHttpStream(AsyncHttpStream):
+    primary_key = "id"
+    retry_factor = 0
+
+    def __init__(self, url_base: str, **kwargs):
+        super().__init__(**kwargs)
+        self._url_base = url_base
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
+        return f"items/{stream_slice['id']}" if stream_slice else "items/0"
+
+    def request_params(self, next_page_token: Mapping[str, Any] = None, **kwargs) -> Mapping[str, Any]:
+        return {"page": next_page_token["page"] if next_page_token else 0}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json().get("next_page")
+        return {"page": next_page} if next_page is not None else None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["records"]
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    attempts = {}
+
+    async def items(request: web.Request) -> web.Response:
+        slice_id = request.match_info["id"]
+        page = int(request.query["page"])
+        if slice_id == "flaky":
+            attempts[slice_id] = attempts.get(slice_id, 0) + 1
+            if attempts[slice_id] == 1:
+                return web.Response(status=500)
+        if slice_id == "missing":
+            return web.Response(status=404)
+        next_page = page + 1 if page < 2 else None
+        return web.json_response({"records": [{"id": f"{slice_id}-{page}"}], "next_page": next_page})
+
+    async def start():
+        app = web.Application()
+        app.router.add_get("/items/{id}", items)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        return runner
+
+    event_loop = EventLoopThread.get()
+    runner = event_loop.run(start())
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}/"
+    event_loop.run(runner.cleanup())
+
+
+def test_read_records_paginates(server_url):
+    stream = StubAsyncHttpStream(server_url)
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice={"id": "a"}))
+    assert records == [{"id": "a-0"}, {"id": "a-1"}, {"id": "a-2"}]
+
+
+def test_retries_transient_errors(server_url):
+    stream = StubAsyncHttpStream(server_url)
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice={"id": "flaky"}))
+    assert records == [{"id": "flaky-0"}, {"id": "flaky-1"}, {"id": "flaky-2"}]
+
+
+def test_raises_on_http_errors(server_url):
+    stream = StubAsyncHttpStream(server_url)
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice={"id": "missing"}))
+
+
+def test_concurrent_slices_share_event_loop(server_url):
+    stream = StubAsyncHttpStream(server_url)
+    slices = [{"id": str(i)} for i in range(20)]
+    pages = map_in_order(lambda stream_slice: list(stream.read_records(SyncMode.full_refresh, stream_slice=stream_slice)), slices, 10)
+    assert [record["id"] for page in pages for record in page] == [f"{i}-{page}" for i in range(20) for page in range(3)]
+
+
+def test_client_session_closed_when_event_loop_stops(monkeypatch):
+    event_loop = EventLoopThread()
+    monkeypatch.setattr(EventLoopThread, "_instance", event_loop)
+    monkeypatch.setattr(AsyncHttpStream, "_client_sessions", {})
+    session = event_loop.run(AsyncHttpStream._get_client_session())
+
+    event_loop.stop()
+
+    assert session.closed
+    assert event_loop.loop.is_closed()
+    assert EventLoopThread._instance is None
+
+
+def test_client_session_per_connection_pool_size(monkeypatch):
+    class SmallPoolStream(StubAsyncHttpStream):
+        connection_pool_size = 2
+
+    event_loop = EventLoopThread()
+    monkeypatch.setattr(EventLoopThread, "_instance", event_loop)
+    monkeypatch.setattr(AsyncHttpStream, "_client_sessions", {})
+    default_session = event_loop.run(StubAsyncHttpStream._get_client_session())
+    small_session = event_loop.run(SmallPoolStream._get_client_session())
+
+    assert default_session.connector.limit == AsyncHttpStream.connection_pool_size
+    assert small_session.connector.limit == 2
+    assert event_loop.run(StubAsyncHttpStream._get_client_session()) is default_session
+    event_loop.stop()
+
+
+def test_parse_response_runs_outside_the_event_loop(server_url):
+    threads = []
+
+    class RecordingStream(StubAsyncHttpStream):
+        def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+            threads.append(threading.current_thread().name)
+            yield from super().parse_response(response, **kwargs)
+
+    records = list(RecordingStream(server_url).read_records(sync_mode=SyncMode.full_refresh, stream_slice={"id": "a"}))
+
+    assert len(records) == 3
+    assert len(threads) == 3
+    assert "airbyte-event-loop" not in threads
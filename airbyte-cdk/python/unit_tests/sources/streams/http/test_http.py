@@ -4,6 +4,7 @@
 
 
 import json
+import threading
 from http import HTTPStatus
 from typing import Any, Iterable, Mapping, Optional
 from unittest.mock import ANY
@@ -11,7 +12,7 @@ from unittest.mock import ANY
 import pytest
 import requests
 from airbyte_cdk.models import SyncMode
-from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
+from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream, ResponseCache
 from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
@@ -130,6 +131,46 @@ def test_next_page_token_is_input_to_other_methods(mocker):
     assert expected == records
 
 
+class StubPrefetchHttpStream(StubNextPageTokenHttpStream):
+    prefetch_pages = 2
+
+
+def test_prefetch_pages_reads_all_pages_in_order(mocker):
+    stream = StubPrefetchHttpStream(pages=5)
+    mocker.patch.object(StubPrefetchHttpStream, "_send_request", return_value={})
+    request_params = mocker.patch.object(stream, "request_params", wraps=stream.request_params)
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert records == [{"data": i} for i in range(1, 7)]
+    assert [c[1]["next_page_token"] for c in request_params.call_args_list] == [None] + [{"page": i} for i in range(5)]
+
+
+def test_prefetch_pages_requests_next_page_while_parsing(mocker):
+    stream = StubPrefetchHttpStream(pages=1)
+    second_page_requested = threading.Event()
+    mocker.patch.object(
+        StubPrefetchHttpStream,
+        "_send_request",
+        side_effect=lambda request, kwargs: second_page_requested.set() if stream.current_page else {},
+    )
+
+    records = stream.read_records(SyncMode.full_refresh)
+    assert next(records) == {"data": 1}
+    # The first page is still being consumed while the second one is requested in the background
+    assert second_page_requested.wait(timeout=5)
+    assert list(records) == [{"data": 2}]
+
+
+def test_prefetch_pages_raises_request_errors(mocker):
+    stream = StubPrefetchHttpStream(pages=1)
+    mocker.patch.object(StubPrefetchHttpStream, "_send_request", side_effect=[{}, requests.exceptions.ConnectionError()])
+
+    records = stream.read_records(SyncMode.full_refresh)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        list(records)
+
+
 class StubBadUrlHttpStream(StubBasicReadHttpStream):
     url_base = "bad_url"
 
@@ -374,32 +415,85 @@ class CacheHttpSubStream(HttpSubStream):
         return ""
 
 
-def test_caching_filename():
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_caching_filename(cache_dir):
+    stream = CacheHttpStream()
+    assert stream.cache_filename == f"{stream.name}.sqlite"
+
+
+def test_caching_caches_are_different(cache_dir):
+    stream_1 = CacheHttpStream()
+    stream_2 = CacheHttpStream()
+
+    assert stream_1._get_response_cache() is not stream_2._get_response_cache()
+
+
+def test_cache_created_on_first_request(cache_dir, requests_mock):
     stream = CacheHttpStream()
-    assert stream.cache_filename == f"{stream.name}.yml"
+    (cache_dir / stream.cache_filename).write_text("cache of a previous sync")
+    CacheHttpStream(response_cache=ResponseCache(str(cache_dir / "shared.sqlite")))
 
+    # building streams, e.g: for check or discover, leaves the filesystem alone
+    assert stream.response_cache is None
+    assert [path.name for path in cache_dir.iterdir()] == [stream.cache_filename]
 
-def test_caching_cassettes_are_different():
+    requests_mock.get(stream.url_base, json={"id": 1})
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert len(stream.response_cache) == 1
+
+
+def test_cache_file_deleted_once_per_process(cache_dir, requests_mock):
     stream_1 = CacheHttpStream()
+    requests_mock.get(stream_1.url_base, json={"id": 1})
+    list(stream_1.read_records(sync_mode=SyncMode.full_refresh))
+
+    # a later instance with the same cache_filename keeps the file the first one has open
     stream_2 = CacheHttpStream()
+    assert len(stream_2._get_response_cache()) == 1
+    assert len(stream_1.response_cache) == 1
+
 
-    assert stream_1.cache_file != stream_2.cache_file
+def test_shared_response_cache(cache_dir):
+    response_cache = ResponseCache(str(cache_dir / "shared.sqlite"))
+    stream_1 = CacheHttpStream(response_cache=response_cache)
+    stream_2 = CacheHttpStream(response_cache=response_cache)
 
+    assert stream_1.response_cache is stream_2.response_cache is response_cache
+    assert not (cache_dir / stream_1.cache_filename).exists()
 
-def test_parent_attribute_exist():
+
+def test_parent_attribute_exist(cache_dir):
     parent_stream = CacheHttpStream()
     child_stream = CacheHttpSubStream(parent=parent_stream)
 
     assert child_stream.parent == parent_stream
 
 
-def test_cache_response(mocker):
+def test_cache_response(cache_dir, requests_mock):
     stream = CacheHttpStream()
-    mocker.patch.object(stream, "url_base", "https://google.com/")
+    requests_mock.get(stream.url_base, json={"id": 1})
     list(stream.read_records(sync_mode=SyncMode.full_refresh))
 
-    with open(stream.cache_filename, "r") as f:
-        assert f.read()
+    assert len(stream.response_cache) == 1
+    assert (cache_dir / stream.cache_filename).exists()
+
+
+def test_cache_skips_failed_responses(cache_dir, requests_mock):
+    stream = CacheHttpStream()
+    responses = [{"status_code": 404}, {"json": {"id": 1}}]
+    requests_mock.get(stream.url_base, responses)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert len(stream.response_cache) == 0
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert len(stream.response_cache) == 1
 
 
 class CacheHttpStreamWithSlices(CacheHttpStream):
@@ -413,19 +507,22 @@ class CacheHttpStreamWithSlices(CacheHttpStream):
             yield {"path": path}
 
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
-        yield response
+        yield response.json()
 
 
-def test_using_cache(mocker):
+def test_using_cache(cache_dir, requests_mock):
     parent_stream = CacheHttpStreamWithSlices()
-    mocker.patch.object(parent_stream, "url_base", "https://google.com/")
+    requests_mock.get(parent_stream.url_base, json={"path": ""})
+    requests_mock.get(f"{parent_stream.url_base}/search", json={"path": "search"})
 
     for _slice in parent_stream.stream_slices():
         list(parent_stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=_slice))
+    assert requests_mock.call_count == 2
 
     child_stream = CacheHttpSubStream(parent=parent_stream)
 
-    for _slice in child_stream.stream_slices(sync_mode=SyncMode.full_refresh):
-        pass
+    slices = [_slice["parent"] for _slice in child_stream.stream_slices(sync_mode=SyncMode.full_refresh)]
 
-    assert parent_stream.cassete.play_count != 0
+    assert slices == [{"path": ""}, {"path": "search"}]
+    assert requests_mock.call_count == 2
+    assert parent_stream.response_cache.hits == 2
@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import time
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream, RateLimiter
+
+
+class StubRateLimitedHttpStream(HttpStream):
+    url_base = "https://test_base_url.com"
+    primary_key = ""
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield response.json()
+
+
+def make_response(headers: Mapping[str, str]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    return response
+
+
+@pytest.fixture
+def sleeps(mocker):
+    """Replaces time.sleep with a fake clock advancing time.monotonic"""
+    clock = {"now": 1000.0, "sleeps": []}
+
+    def sleep(seconds):
+        clock["sleeps"].append(seconds)
+        clock["now"] += seconds
+
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.monotonic", side_effect=lambda: clock["now"])
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.sleep", side_effect=sleep)
+    return clock["sleeps"]
+
+
+def test_token_bucket_allows_burst_then_waits(sleeps):
+    limiter = RateLimiter(calls=2, period=1)
+    for _ in range(4):
+        limiter.acquire("https://test_base_url.com")
+        limiter.release("https://test_base_url.com")
+
+    assert sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_endpoint_limiter_only_applies_to_matching_urls(sleeps):
+    search_limiter = RateLimiter(calls=1, period=10)
+    limiter = RateLimiter(calls=100, period=1, endpoints={"/search": search_limiter})
+
+    for url in ["https://test_base_url.com/search", "https://test_base_url.com/users", "https://test_base_url.com/users"]:
+        with limiter.limit(url):
+            pass
+    assert sleeps == []
+
+    with limiter.limit("https://test_base_url.com/search?q=1"):
+        pass
+    assert sleeps == [pytest.approx(10)]
+
+
+def test_concurrency_cap(sleeps):
+    limiter = RateLimiter(calls=100, period=1, max_concurrent_requests=1)
+    limiter.acquire("url")
+    assert limiter._try_acquire() == limiter.poll_interval_seconds
+    limiter.release("url")
+    assert limiter._try_acquire() == 0
+
+
+@pytest.mark.parametrize(
+    "headers, expected_sleep",
+    [
+        ({"Retry-After": "30"}, 30),
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "15"}, 15),
+        ({"X-RateLimit-Remaining": "0"}, 0.1),
+        ({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "15"}, None),
+    ],
+)
+def test_update_from_response_headers(sleeps, headers, expected_sleep):
+    limiter = RateLimiter(calls=10, period=1)
+    limiter.acquire("url")
+    limiter.release("url", make_response(headers))
+    limiter.acquire("url")
+
+    assert sleeps == ([pytest.approx(expected_sleep)] if expected_sleep else [])
+
+
+def test_reset_header_as_epoch_timestamp(sleeps, mocker):
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.time", return_value=1_600_000_000)
+    limiter = RateLimiter(calls=10, period=1)
+    limiter.acquire("url")
+    limiter.release("url", make_response({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1600000020"}))
+    limiter.acquire("url")
+
+    assert sleeps == [pytest.approx(20)]
+
+
+def test_acquire_async_does_not_block_the_loop(mocker):
+    limiter = RateLimiter(calls=1, period=0.05)
+
+    async def acquire_twice():
+        await limiter.acquire_async("url")
+        await limiter.acquire_async("url")
+
+    start = time.monotonic()
+    asyncio.run(acquire_twice())
+    assert time.monotonic() - start >= 0.04
+
+
+def test_limiter_is_shared_by_streams(requests_mock, sleeps):
+    requests_mock.get("https://test_base_url.com", json={"id": 1}, headers={"Retry-After": "7"})
+    limiter = RateLimiter(calls=10, period=1)
+    streams = [StubRateLimitedHttpStream(rate_limiter=limiter), StubRateLimitedHttpStream(rate_limiter=limiter)]
+
+    records = [record for stream in streams for record in stream.read_records(sync_mode=SyncMode.full_refresh)]
+
+    assert records == [{"id": 1}, {"id": 1}]
+    assert sleeps == [pytest.approx(7)]
+    assert limiter._in_flight == 0
+
+
+def test_no_rate_limiter_by_default(requests_mock):
+    requests_mock.get("https://test_base_url.com", json={"id": 1}, headers={"Retry-After": "7"})
+    stream = StubRateLimitedHttpStream()
+
+    assert stream.rate_limiter is None
+    assert list(stream.read_records(sync_mode=SyncMode.full_refresh)) == [{"id": 1}]
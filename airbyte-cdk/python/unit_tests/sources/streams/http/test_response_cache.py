@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import requests
+from airbyte_cdk.sources.streams.http import ResponseCache
+
+
+def make_request(url: str = "https://test_base_url.com/items?page=1", method: str = "GET", body: str = None) -> requests.PreparedRequest:
+    return requests.Request(method, url, data=body, headers={"Authorization": "Bearer token"}).prepare()
+
+
+def make_response(content: bytes = b'{"id": 1}', status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "OK"
+    response.url = "https://test_base_url.com/items?page=1"
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    return response
+
+
+def test_get_returns_stored_response(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    request = make_request()
+    assert cache.get(request) is None
+
+    cache.set(request, make_response())
+    response = cache.get(request)
+
+    assert response.json() == {"id": 1}
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.request is request
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_fingerprint_ignores_headers_but_not_body():
+    request = make_request()
+    other_credentials = requests.Request("GET", request.url, headers={"Authorization": "Bearer other"}).prepare()
+
+    assert ResponseCache.fingerprint(request) == ResponseCache.fingerprint(other_credentials)
+    assert ResponseCache.fingerprint(make_request(method="POST", body="a=1")) != ResponseCache.fingerprint(
+        make_request(method="POST", body="a=2")
+    )
+    assert ResponseCache.fingerprint(make_request()) != ResponseCache.fingerprint(
+        make_request(url="https://test_base_url.com/items?page=2")
+    )
+
+
+def test_cache_is_persisted(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResponseCache(path)
+    cache.set(make_request(), make_response())
+    cache.close()
+
+    assert ResponseCache(path).get(make_request()).content == b'{"id": 1}'
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path, mocker):
+    now = mocker.patch("airbyte_cdk.sources.streams.http.response_cache.time.time", return_value=1)
+    body = bytes(range(256)) * 4  # incompressible enough to keep a stable compressed size
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    cache.set(make_request(url="https://a.com"), make_response(body))
+    entry_size = cache._size
+    cache.max_size_bytes = entry_size * 2
+
+    now.return_value = 2
+    cache.set(make_request(url="https://b.com"), make_response(body))
+    now.return_value = 3
+    cache.get(make_request(url="https://a.com"))
+    now.return_value = 4
+    cache.set(make_request(url="https://c.com"), make_response(body))
+
+    assert len(cache) == 2
+    assert cache.get(make_request(url="https://b.com")) is None
+    assert cache.get(make_request(url="https://a.com")) is not None
+    assert cache.get(make_request(url="https://c.com")) is not None
+    assert cache._size == entry_size * 2
+
+
+def test_expired_responses_are_not_served(tmp_path, mocker):
+    now = mocker.patch("airbyte_cdk.sources.streams.http.response_cache.time.time", return_value=100)
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl_seconds=10)
+    cache.set(make_request(), make_response())
+
+    now.return_value = 105
+    assert cache.get(make_request()) is not None
+    now.return_value = 111
+    assert cache.get(make_request()) is None
+    assert len(cache) == 0
+
+
+def test_clear(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    cache.set(make_request(), make_response())
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache._size == 0
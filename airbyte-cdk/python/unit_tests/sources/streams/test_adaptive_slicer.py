@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+from itertools import count
+
+import pendulum
+import pytest
+from airbyte_cdk.sources.streams import AdaptiveDateSlicer
+
+START = pendulum.datetime(2021, 1, 1)
+
+
+def days(stream_slice):
+    return (stream_slice["end_date"] - stream_slice["start_date"]).total_days()
+
+
+def test_windows_cover_the_whole_range():
+    slicer = AdaptiveDateSlicer(START, end=START.add(days=100), initial_window=pendulum.duration(days=30))
+
+    slices = list(slicer)
+
+    assert [days(stream_slice) for stream_slice in slices] == [30, 30, 30, 10]
+    assert slices[0]["start_date"] == START
+    assert all(previous["end_date"] == current["start_date"] for previous, current in zip(slices, slices[1:]))
+    assert slices[-1]["end_date"] == START.add(days=100)
+
+
+def test_window_follows_target_records():
+    slicer = AdaptiveDateSlicer(START, end=START.add(days=1000), initial_window=pendulum.duration(days=10), target_records=1000)
+    windows = []
+    for stream_slice in slicer:
+        windows.append(days(stream_slice))
+        # 200 records per day
+        slicer.update(records=int(days(stream_slice) * 200), seconds=1)
+        if len(windows) == 3:
+            break
+
+    assert windows == [10, 5, 5]
+
+
+def test_window_follows_target_seconds_within_bounds():
+    slicer = AdaptiveDateSlicer(
+        START,
+        end=START.add(days=1000),
+        initial_window=pendulum.duration(days=30),
+        max_window=pendulum.duration(days=90),
+        target_seconds=15,
+    )
+    stream_slices = iter(slicer)
+
+    assert days(next(stream_slices)) == 30
+    # 8 days per minute: the next window should take 15 seconds
+    slicer.update(records=10, seconds=30 / 8 * 60)
+    assert days(next(stream_slices)) == 2
+    # windows are a multiple of min_window
+    slicer.update(records=10, seconds=100)
+    assert days(next(stream_slices)) == 1
+    # a fast window grows by at most max_growth_factor, up to max_window
+    slicer.update(records=10, seconds=0)
+    assert days(next(stream_slices)) == 4
+    for _ in range(3):
+        slicer.update(records=10, seconds=0)
+        next(stream_slices)
+    assert slicer.window == pendulum.duration(days=90)
+
+
+def test_empty_windows_grow():
+    slicer = AdaptiveDateSlicer(START, end=START.add(days=1000), initial_window=pendulum.duration(days=5), target_records=1000)
+    stream_slices = iter(slicer)
+
+    next(stream_slices)
+    slicer.update(records=0, seconds=1)
+
+    assert days(next(stream_slices)) == 20
+
+
+def test_read_slice_measures_window(monkeypatch):
+    clock = count(step=10)
+    monkeypatch.setattr("airbyte_cdk.sources.streams.adaptive_slicer.time.monotonic", lambda: next(clock))
+    slicer = AdaptiveDateSlicer(START, end=START.add(days=1000), initial_window=pendulum.duration(days=8), target_seconds=5)
+    stream_slice = next(iter(slicer))
+
+    records = list(slicer.read_slice(stream_slice, lambda s: [1, 2, 3]))
+
+    assert records == [1, 2, 3]
+    # reading took 10 seconds, twice the target
+    assert slicer.window == pendulum.duration(days=4)
+
+
+def test_read_slice_retries_smaller_window():
+    slicer = AdaptiveDateSlicer(START, end=START.add(days=1000), initial_window=pendulum.duration(days=8))
+    stream_slices = iter(slicer)
+    read_slices = []
+
+    def read(stream_slice):
+        read_slices.append(stream_slice)
+        if len(read_slices) < 3:
+            raise ConnectionError("closed")
+        yield days(stream_slice)
+
+    records = list(slicer.read_slice(next(stream_slices), read, retry_on=(ConnectionError,), max_attempts=3))
+
+    assert records == [2]
+    assert [days(stream_slice) for stream_slice in read_slices] == [8, 4, 2]
+    assert all(stream_slice["start_date"] == START for stream_slice in read_slices)
+    # the next window starts after the window read last
+    assert next(stream_slices)["start_date"] == START.add(days=2)
+
+
+def test_read_slice_raises_after_max_attempts():
+    slicer = AdaptiveDateSlicer(START, end=START.add(days=1000))
+
+    def read(stream_slice):
+        raise ConnectionError("closed")
+
+    with pytest.raises(ConnectionError):
+        list(slicer.read_slice(next(iter(slicer)), read, retry_on=(ConnectionError,), max_attempts=2))
+
+
+def test_shrink_before_any_window_fails():
+    slicer = AdaptiveDateSlicer(START, end=START.add(days=100))
+
+    with pytest.raises(Exception, match="before a window was generated"):
+        slicer.shrink()
@@ -0,0 +1,158 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Iterable, List, Mapping, Optional
+
+import pytest
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode, Type
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.streams import AsyncJobStatus, AsyncJobStream
+from airbyte_cdk.sources.streams.async_job import AsyncJobFailed
+
+
+class StubReportStream(AsyncJobStream):
+    """Each job completes after a number of polls, jobs of the first slices taking the longest"""
+
+    primary_key = "id"
+    cursor_field = "slice"
+    max_concurrent_jobs = 3
+
+    def __init__(self, slices: int = 5, polls_to_complete: Mapping[int, int] = None, failures: Mapping[int, int] = None):
+        self.slices = slices
+        self.polls_to_complete = polls_to_complete or {}
+        self.failures = dict(failures or {})
+        self.events = []
+        self.polls = {}
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return [{"slice": i} for i in range(self.slices)]
+
+    def create_job(self, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]) -> Any:
+        self.events.append(("create", stream_slice["slice"]))
+        self.polls[stream_slice["slice"]] = 0
+        return stream_slice["slice"]
+
+    def check_job_status(self, job: Any) -> AsyncJobStatus:
+        self.polls[job] += 1
+        if self.polls[job] < self.polls_to_complete.get(job, 1):
+            return AsyncJobStatus.RUNNING
+        if self.failures.get(job):
+            self.failures[job] -= 1
+            return AsyncJobStatus.FAILED
+        return AsyncJobStatus.COMPLETED
+
+    def read_job_records(self, job: Any, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]) -> Iterable[Mapping]:
+        self.events.append(("read", job))
+        yield {"id": job, "slice": job}
+
+    def cancel_job(self, job: Any):
+        self.events.append(("cancel", job))
+
+    def get_updated_state(self, current_stream_state, latest_record):
+        return {"slice": latest_record["slice"]}
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+class StubSource(AbstractSource):
+    def __init__(self, streams: List[AsyncJobStream]):
+        self._streams = streams
+
+    def check_connection(self, logger, config):
+        return True, None
+
+    def streams(self, config):
+        return self._streams
+
+
+@pytest.fixture
+def sleeps(mocker):
+    clock = {"now": 0.0, "sleeps": []}
+
+    def sleep(seconds):
+        clock["sleeps"].append(seconds)
+        clock["now"] += seconds
+
+    mocker.patch("airbyte_cdk.sources.streams.async_job.time.monotonic", side_effect=lambda: clock["now"])
+    mocker.patch("airbyte_cdk.sources.streams.async_job.time.sleep", side_effect=sleep)
+    return clock["sleeps"]
+
+
+def read(stream: AsyncJobStream, sync_mode: SyncMode = SyncMode.incremental, config: Mapping[str, Any] = None):
+    configured_stream = ConfiguredAirbyteStream(
+        stream=AirbyteStream(name=stream.name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh, SyncMode.incremental]),
+        sync_mode=sync_mode,
+        destination_sync_mode=DestinationSyncMode.overwrite,
+    )
+    catalog = ConfiguredAirbyteCatalog(streams=[configured_stream])
+    return list(StubSource([stream]).read(AirbyteLogger(), config or {}, catalog, state={}))
+
+
+def test_jobs_of_upcoming_slices_run_while_waiting(sleeps):
+    stream = StubReportStream(slices=5, polls_to_complete={0: 3})
+
+    messages = read(stream)
+
+    # Up to max_concurrent_jobs jobs are created before the first one completes, records are still read in slice order
+    assert stream.events[:3] == [("create", 0), ("create", 1), ("create", 2)]
+    assert [event for event in stream.events if event[0] == "read"] == [("read", i) for i in range(5)]
+    records = [message.record.data["slice"] for message in messages if message.type == Type.RECORD]
+    states = [message.state.data["stub_report_stream"]["slice"] for message in messages if message.type == Type.STATE]
+    assert records == states == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("sync_mode", [SyncMode.full_refresh, SyncMode.incremental])
+def test_jobs_submitted_ahead_are_cancelled_on_record_limit(sleeps, sync_mode):
+    stream = StubReportStream(slices=5)
+
+    messages = read(stream, sync_mode, config={"_limit": 1})
+
+    assert [message.record.data["slice"] for message in messages if message.type == Type.RECORD] == [0]
+    # the job of the first slice is cancelled too as its records were not read to the end, the job of slice 3 was never created
+    assert [event for event in stream.events if event[0] == "cancel"] == [("cancel", 0), ("cancel", 1), ("cancel", 2)]
+    assert ("create", 3) not in stream.events
+
+
+def test_read_jobs_are_not_cancelled(sleeps):
+    stream = StubReportStream(slices=5)
+
+    read(stream)
+
+    assert not [event for event in stream.events if event[0] == "cancel"]
+
+
+def test_poll_interval_grows(sleeps):
+    stream = StubReportStream(slices=1, polls_to_complete={0: 4})
+
+    list(stream.read_records(SyncMode.full_refresh, stream_slice={"slice": 0}))
+
+    assert sleeps == [5, 7.5, 11.25, 16.875]
+
+
+def test_failed_jobs_are_retried(sleeps):
+    stream = StubReportStream(slices=2, failures={0: 1})
+
+    messages = read(stream, SyncMode.full_refresh)
+
+    assert [message.record.data["slice"] for message in messages] == [0, 1]
+    assert stream.events.count(("create", 0)) == 2
+
+
+def test_job_failing_max_attempts_raises(sleeps):
+    stream = StubReportStream(slices=1, failures={0: 3})
+
+    with pytest.raises(AsyncJobFailed):
+        list(stream.read_records(SyncMode.full_refresh, stream_slice={"slice": 0}))
+
+
+def test_job_timeout(sleeps):
+    stream = StubReportStream(slices=1, polls_to_complete={0: 100})
+    stream.job_timeout_seconds = 30
+    stream.max_job_attempts = 1
+
+    with pytest.raises(AsyncJobFailed):
+        list(stream.read_records(SyncMode.full_refresh, stream_slice={"slice": 0}))
+    assert sum(sleeps) > 30
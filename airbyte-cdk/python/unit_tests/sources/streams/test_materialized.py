@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import gc
+import os
+from typing import Any, Iterable, List, Mapping, Optional
+
+import pytest
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams import MaterializedStream, Stream
+from airbyte_cdk.sources.streams.http import HttpSubStream
+
+
+class StubParentStream(Stream):
+    primary_key = "id"
+
+    def __init__(self):
+        self.reads = 0
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return [{"page": 0}, {"page": 1}]
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        assert sync_mode == SyncMode.full_refresh
+        self.reads += 1
+        for i in range(3):
+            yield {"id": stream_slice["page"] * 3 + i, "key": f"ISSUE-{stream_slice['page'] * 3 + i}", "fields": {"summary": "..."}}
+
+
+class StubSubStream(HttpSubStream):
+    url_base = "https://example.com"
+    primary_key = None
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response):
+        return None
+
+    def parse_response(self, response, **kwargs):
+        return []
+
+
+def test_parent_read_once():
+    parent = StubParentStream()
+    stream = MaterializedStream(parent, fields=["key"])
+    expected = [{"key": f"ISSUE-{i}"} for i in range(6)]
+
+    assert list(stream.read_records(sync_mode=SyncMode.full_refresh)) == expected
+    assert stream.materialized
+    assert parent.reads == 2
+
+    assert list(stream.read_records(sync_mode=SyncMode.full_refresh)) == expected
+    assert parent.reads == 2
+
+
+def test_interrupted_read_not_materialized():
+    parent = StubParentStream()
+    stream = MaterializedStream(parent)
+
+    records = iter(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert next(records)["id"] == 0
+    records.close()
+    assert not stream.materialized
+
+    assert [record["id"] for record in stream.read_records(sync_mode=SyncMode.full_refresh)] == list(range(6))
+    assert stream.materialized
+    assert parent.reads == 3
+
+
+def test_interleaved_reads_of_spool():
+    stream = MaterializedStream(StubParentStream(), fields=["id"])
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    outer = stream.read_records(sync_mode=SyncMode.full_refresh)
+    pairs = [(a["id"], b["id"]) for a in outer for b in stream.read_records(sync_mode=SyncMode.full_refresh)]
+    assert len(pairs) == 36
+
+
+def test_spool_removed_with_stream():
+    stream = MaterializedStream(StubParentStream())
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    spool_path = stream._spool_path
+    assert os.path.exists(spool_path)
+
+    del stream
+    gc.collect()
+    assert not os.path.exists(spool_path)
+
+
+@pytest.mark.parametrize("substreams", [1, 3])
+def test_http_sub_streams_share_parent(substreams):
+    parent = StubParentStream()
+    materialized_parent = MaterializedStream(parent, fields=["key"])
+
+    for _ in range(substreams):
+        sub_stream = StubSubStream(parent=materialized_parent)
+        stream_slices = list(sub_stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={"updated": "2021-01-01"}))
+        assert stream_slices == [{"parent": {"key": f"ISSUE-{i}"}} for i in range(6)]
+
+    assert parent.reads == 2
+    assert materialized_parent.name == parent.name
+    assert materialized_parent.primary_key == "id"
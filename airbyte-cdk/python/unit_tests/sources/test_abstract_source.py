@@ -346,3 +346,99 @@ def test_valid_incremental_read_with_slices_and_interval(mocker, logger):
     messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
 
     assert expected == messages
+
+
+def test_concurrent_read_keeps_per_stream_order(mocker, logger):
+    """Tests that reading streams concurrently outputs every message and keeps each stream's records before its STATE messages"""
+    slices = [{"1": "1"}, {"2": "2"}]
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}, {"k3": "v3"}]
+    s1 = MockStream(
+        [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, stream_output) for s in slices], name="s1"
+    )
+    s2 = MockStream(
+        [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, stream_output) for s in slices], name="s2"
+    )
+    state = {"cursor": "value"}
+    mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+    mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    mocker.patch.object(MockSource, "max_concurrent_streams", new_callable=mocker.PropertyMock, return_value=2)
+
+    src = MockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental), _configured_stream(s2, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+    for stream_name in ["s1", "s2"]:
+        stream_messages = [
+            msg
+            for msg in messages
+            if (msg.type == Type.RECORD and msg.record.stream == stream_name) or (msg.type == Type.STATE and stream_name in msg.state.data)
+        ]
+        # the first STATE message of a stream can only follow all records of its first slice
+        assert stream_messages[: len(stream_output)] == _as_records(stream_name, stream_output)
+        assert stream_messages[len(stream_output)].type == Type.STATE
+    assert len([msg for msg in messages if msg.type == Type.RECORD]) == 2 * len(slices) * len(stream_output)
+    assert messages[-1] == _state({"s1": state, "s2": state})
+
+
+def test_concurrent_read_raises_stream_exception(mocker, logger):
+    """Tests that an exception raised while reading one of the concurrently read streams fails the sync"""
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k1": "v1"}])], name="s1")
+    s2 = MockStream(name="s2")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockSource, "max_concurrent_streams", new_callable=mocker.PropertyMock, return_value=2)
+
+    src = MockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+    with pytest.raises(Exception, match="No mocked output supplied"):
+        list(src.read(logger, {}, catalog))
+
+
+def test_concurrent_read_reports_timing_per_stream(mocker, logger):
+    """Tests that every concurrently read stream logs the report of its own timer"""
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k1": "v1"}])], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k2": "v2"}])], name="s2")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockSource, "max_concurrent_streams", new_callable=mocker.PropertyMock, return_value=2)
+    info = mocker.patch.object(logger, "info")
+
+    src = MockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+    list(src.read(logger, {}, catalog))
+
+    reports = [call[0][0] for call in info.call_args_list if "runtimes" in call[0][0]]
+    assert sorted(report.splitlines()[1].split()[0] for report in reports) == ["s1", "s2"]
+
+
+@pytest.mark.parametrize("sync_mode", [SyncMode.full_refresh, SyncMode.incremental])
+def test_concurrent_slices_keep_slice_order(mocker, logger, sync_mode):
+    """Tests that reading slices concurrently outputs the records of each slice followed by its STATE message, in slice order"""
+    slices = [{"slice": i} for i in range(5)]
+    s1 = MockStream([({"sync_mode": sync_mode, "stream_slice": s, "stream_state": mocker.ANY}, [s]) for s in slices], name="s1")
+    state = {"cursor": "value"}
+    mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+    mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    mocker.patch.object(MockStream, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=3)
+    if sync_mode == SyncMode.full_refresh:
+        # full refresh reads don't pass the stream state to read_records
+        s1._inputs_and_mocked_outputs = [({"sync_mode": sync_mode, "stream_slice": s}, [s]) for s in slices]
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, sync_mode)])
+
+    if sync_mode == SyncMode.incremental:
+        expected = [msg for s in slices for msg in (_as_record("s1", s), _state({"s1": state}))]
+    else:
+        expected = _as_records("s1", slices)
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+    assert expected == messages
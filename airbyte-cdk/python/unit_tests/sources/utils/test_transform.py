@@ -151,8 +151,12 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, capsys):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize(
+    "config",
+    [TransformConfig.DefaultSchemaNormalization, TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization],
+)
+def test_transform(schema, actual, expected, expected_warns, config, capsys):
+    t = TypeTransformer(config)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     stdout = capsys.readouterr().out
@@ -208,3 +212,55 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+def test_compiled_custom_transform_with_default_normalization():
+    transformer = TypeTransformer(
+        TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization
+    )
+
+    @transformer.registerCustomTransform
+    def transform_cb(instance, schema):
+        assert instance == "12"
+        assert schema == SIMPLE_SCHEMA["properties"]["value"]
+        return "transformed"
+
+    obj = {"value": 12}
+    transformer.transform(obj, SIMPLE_SCHEMA)
+    assert obj == {"value": "transformed"}
+
+
+def test_compiled_transform_recursive_schema():
+    schema = {
+        "type": "object",
+        "properties": {"node": {"$ref": "#/definitions/node"}},
+        "definitions": {"node": {"type": "object", "properties": {"value": {"type": "integer"}, "child": {"$ref": "#/definitions/node"}}}},
+    }
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    obj = {"node": {"value": "1", "child": {"value": "2", "child": {"value": "3"}}}}
+    transformer.transform(obj, schema)
+    assert obj == {"node": {"value": 1, "child": {"value": 2, "child": {"value": 3}}}}
+
+
+def test_compiled_transform_bounds_compiled_schemas():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    transformer.max_compiled_schemas = 2
+    for _ in range(5):
+        # a new schema object on every call
+        obj = {"value": 12}
+        transformer.transform(obj, {"type": "object", "properties": {"value": {"type": "string"}}})
+        assert obj == {"value": "12"}
+    assert len(transformer._compiled_normalizers) == 2
+
+
+def test_compiled_transform_rate_limits_warnings(capsys):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    for value in ["a", "b", "c"]:
+        transformer.transform({"number_prop": value}, COMPLEX_SCHEMA)
+    stdout = capsys.readouterr().out
+    assert "'a' is not of type 'number'" in stdout
+    assert "'b' is not of type 'number'" not in stdout
+
+    transformer.warning_interval_seconds = 0
+    transformer.transform({"number_prop": "d"}, COMPLEX_SCHEMA)
+    assert "'d' is not of type 'number' (2 similar warnings for field 'number_prop' were suppressed)" in capsys.readouterr().out
@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import threading
+import time
+
+import pytest
+from airbyte_cdk.utils.concurrency import fan_out
+
+
+def read_children(parent):
+    # later parents are faster, so their children are read before the children of earlier parents
+    time.sleep(0.01 * (5 - parent))
+    return [f"{parent}-{i}" for i in range(parent)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_fan_out_yields_children_in_parent_order(max_workers):
+    result = list(fan_out(range(5), read_children, max_workers=max_workers))
+
+    assert result == [(parent, [f"{parent}-{i}" for i in range(parent)]) for parent in range(5)]
+
+
+def test_fan_out_reads_parents_lazily():
+    pulled = []
+
+    def parents():
+        for parent in range(100):
+            pulled.append(parent)
+            yield parent
+
+    output = fan_out(parents(), lambda parent: [parent], max_workers=4)
+    assert next(output) == (0, [0])
+    # only the parents being read by the workers were pulled
+    assert len(pulled) <= 4
+    output.close()
+
+
+def test_fan_out_reads_children_concurrently():
+    running, max_running = 0, 0
+    lock = threading.Lock()
+
+    def read(parent):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return [parent]
+
+    list(fan_out(range(12), read, max_workers=3))
+
+    assert max_running == 3
+
+
+def test_fan_out_raises_error_of_children():
+    def read(parent):
+        if parent == 2:
+            raise ValueError("children of 2")
+        return [parent]
+
+    output = fan_out(range(5), read, max_workers=2)
+
+    assert next(output) == (0, [0])
+    assert next(output) == (1, [1])
+    with pytest.raises(ValueError, match="children of 2"):
+        next(output)
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import time
+
+from airbyte_cdk.utils.output_buffer import OutputBuffer
+
+RECORD = '{"type": "RECORD", "record": {"stream": "s", "data": {}, "emitted_at": 1}}'
+STATE = '{"type": "STATE", "state": {"data": {}}}'
+
+
+def _output():
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+
+def _written(output: io.TextIOWrapper) -> str:
+    return output.buffer.getvalue().decode("utf-8")
+
+
+def test_records_are_buffered_until_flush():
+    output = _output()
+    buffer = OutputBuffer(max_bytes=1024 * 1024, max_interval_seconds=3600, output=output)
+    buffer.write_message(RECORD)
+    buffer.write_message(RECORD)
+    assert _written(output) == ""
+
+    buffer.flush()
+    assert _written(output) == f"{RECORD}\n{RECORD}\n"
+
+
+def test_state_message_flushes_preceding_records():
+    output = _output()
+    buffer = OutputBuffer(max_bytes=1024 * 1024, max_interval_seconds=3600, output=output)
+    buffer.write_message(RECORD)
+    buffer.write_message(STATE)
+    assert _written(output) == f"{RECORD}\n{STATE}\n"
+
+
+def test_flush_when_buffer_is_full():
+    output = _output()
+    buffer = OutputBuffer(max_bytes=len(RECORD) * 2, max_interval_seconds=3600, output=output)
+    buffer.write_message(RECORD)
+    assert _written(output) == ""
+    buffer.write_message(RECORD)
+    assert _written(output) == f"{RECORD}\n{RECORD}\n"
+
+
+def test_flush_after_interval():
+    output = _output()
+    buffer = OutputBuffer(max_bytes=1024 * 1024, max_interval_seconds=0, output=output)
+    buffer.write_message(RECORD)
+    assert _written(output) == f"{RECORD}\n"
+
+
+def test_flush_after_interval_without_further_writes():
+    output = _output()
+    buffer = OutputBuffer(max_bytes=1024 * 1024, max_interval_seconds=0.05, output=output)
+    buffer.write_message(RECORD)
+    assert _written(output) == ""
+
+    deadline = time.monotonic() + 5
+    while not _written(output) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _written(output) == f"{RECORD}\n"
+
+
+def test_text_written_to_output_comes_first():
+    output = _output()
+    buffer = OutputBuffer(max_bytes=1024 * 1024, max_interval_seconds=3600, output=output)
+    buffer.write_message(RECORD)
+    output.write("log line\n")
+    buffer.flush()
+    assert _written(output) == f"log line\n{RECORD}\n"
+
+
+def test_text_only_output():
+    output = io.StringIO()
+    buffer = OutputBuffer(output=output)
+    buffer.write("välue", flush=True)
+    assert output.getvalue() == "välue\n"
@@ -0,0 +1,25 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Level, Type
+from airbyte_cdk.utils.serialization import airbyte_message_to_json
+
+RECORD_DATA = {"id": 1, "name": "välue", "created_at": datetime.datetime(2021, 1, 1), "nested": {"items": [1, None, {"a": 1.5}]}}
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=RECORD_DATA, emitted_at=1)),
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=RECORD_DATA, emitted_at=1, namespace="ns")),
+        AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(stream="stream", data=RECORD_DATA, emitted_at=1)),
+        AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"stream": {"cursor": 1}})),
+        AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="message")),
+    ],
+)
+def test_airbyte_message_to_json_matches_pydantic(message):
+    assert airbyte_message_to_json(message) == message.json(exclude_unset=True)
@@ -3,54 +3,32 @@
 #
 
 
-import time
 import traceback
 import uuid
-from typing import Any, Iterable, Mapping
+from typing import Any, List, Mapping
 
 from airbyte_cdk import AirbyteLogger
-from airbyte_cdk.destinations import Destination
-from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
+from airbyte_cdk.destinations import BufferedDestination
+from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteRecordMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status
 from destination_kvdb.client import KvDbClient
 from destination_kvdb.writer import KvDbWriter
 
 
-class DestinationKvdb(Destination):
-    def write(
-        self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
-    ) -> Iterable[AirbyteMessage]:
+class DestinationKvdb(BufferedDestination):
+    # a transaction sets up to flush_interval keys
+    max_batch_records = KvDbWriter.flush_interval
+    # readers read the keys after the timestamp they last read, so batches must be committed in the order of their keys
+    max_concurrent_flushes = 1
 
-        """
-        Reads the input stream of messages, config, and catalog to write data to the destination.
-
-        This method returns an iterable (typically a generator of AirbyteMessages via yield) containing state messages received
-        in the input message stream. Outputting a state message means that every AirbyteRecordMessage which came before it has been
-        successfully persisted to the destination. This is used to ensure fault tolerance in the case that a sync fails before fully completing,
-        then the source is given the last state message output from this method as the starting point of the next sync.
-        """
-        writer = KvDbWriter(KvDbClient(**config))
+    def prepare(self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog):
+        self.writer = KvDbWriter(KvDbClient(**config))
 
         for configured_stream in configured_catalog.streams:
             if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
-                writer.delete_stream_entries(configured_stream.stream.name)
-
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                writer.flush()
-                yield message
-            elif message.type == Type.RECORD:
-                record = message.record
-                writer.queue_write_operation(
-                    record.stream, record.data, time.time_ns() / 1_000_000
-                )  # convert from nanoseconds to milliseconds
-            else:
-                # ignore other message types for now
-                continue
+                self.writer.delete_stream_entries(configured_stream.stream.name)
 
-        # Make sure to flush any records still in the queue
-        writer.flush()
+    def flush_batch(self, stream: str, records: List[AirbyteRecordMessage]):
+        self.writer.write_batch(stream, [record.data for record in records])
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
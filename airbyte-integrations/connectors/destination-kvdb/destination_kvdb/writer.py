@@ -2,7 +2,9 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from collections import Mapping
+import threading
+import time
+from typing import List, Mapping
 
 from destination_kvdb.client import KvDbClient
 
@@ -18,11 +20,15 @@ class KvDbWriter:
     read messages with a particular prefix e.g: name__ab__123, where 123 is the timestamp they last read data from.
     """
 
-    write_buffer = []
     flush_interval = 1000
 
+    # keys are milliseconds as floats, which are precise to a fraction of a microsecond
+    key_resolution_ns = 1000
+
     def __init__(self, client: KvDbClient):
         self.client = client
+        self._last_written_at_ns = 0
+        self._lock = threading.Lock()
 
     def delete_stream_entries(self, stream_name: str):
         """Deletes all the records belonging to the input stream"""
@@ -35,12 +41,14 @@ class KvDbWriter:
         if len(keys_to_delete) > 0:
             self.client.delete(keys_to_delete)
 
-    def queue_write_operation(self, stream_name: str, record: Mapping, written_at: int):
-        kv_pair = (f"{stream_name}__ab__{written_at}", record)
-        self.write_buffer.append(kv_pair)
-        if len(self.write_buffer) == self.flush_interval:
-            self.flush()
-
-    def flush(self):
-        self.client.batch_write(self.write_buffer)
-        self.write_buffer.clear()
+    def write_batch(self, stream_name: str, records: List[Mapping]):
+        """
+        Writes the records of a stream with one request, keyed by the time they are written, every record getting a distinct timestamp.
+        The lock is held until the batch is written, so a reader never sees the keys of a batch before the keys of an earlier one.
+        """
+        with self._lock:
+            first_ns = max(time.time_ns(), self._last_written_at_ns + self.key_resolution_ns)
+            self._last_written_at_ns = first_ns + (len(records) - 1) * self.key_resolution_ns
+            # convert from nanoseconds to milliseconds
+            keys = [f"{stream_name}__ab__{(first_ns + index * self.key_resolution_ns) / 1_000_000}" for index in range(len(records))]
+            self.client.batch_write(list(zip(keys, records)))
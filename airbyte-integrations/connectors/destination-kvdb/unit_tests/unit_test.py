@@ -2,6 +2,23 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+from unittest.mock import Mock
+
+from destination_kvdb.writer import KvDbWriter
+
 
 def test_example_method():
     assert True
+
+
+def test_batches_get_distinct_increasing_keys():
+    client = Mock()
+    writer = KvDbWriter(client)
+
+    writer.write_batch("s", [{"i": i} for i in range(3)])
+    writer.write_batch("s", [{"i": 3}])
+
+    keys = [key for call in client.batch_write.call_args_list for key, _ in call[0][0]]
+    timestamps = [float(key.split("__ab__")[1]) for key in keys]
+    assert all(key.startswith("s__ab__") for key in keys)
+    assert timestamps == sorted(set(timestamps))
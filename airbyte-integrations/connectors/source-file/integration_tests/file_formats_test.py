@@ -3,8 +3,12 @@
 #
 
 
+import json
 from pathlib import Path
 
+import openpyxl
+import pyarrow
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk import AirbyteLogger
 from source_file import SourceFile
@@ -40,6 +44,69 @@ def test_local_file_read(file_format, extension, expected_columns, expected_rows
     check_read(configs, expected_columns, expected_rows)
 
 
+@pytest.mark.parametrize(
+    "file_format, extension, filename",
+    [
+        ("csv", "csv", "demo"),
+        ("excel", "xlsx", "demo"),
+        ("feather", "feather", "demo"),
+        ("orc", "orc", "demo1"),
+        ("parquet", "parquet", "demo"),
+    ],
+)
+def test_local_file_read_in_batches(file_format, extension, filename):
+    file_path = str(SAMPLE_DIRECTORY.joinpath(file_format, f"{filename}.{extension}"))
+    client = Client(dataset_name="test", format=file_format, url=file_path, provider={"storage": "local"})
+    expected_rows = json.dumps(list(client.read()), default=str)
+
+    client.batch_size = 20
+    with client.reader.open(binary=client.binary_source) as fp:
+        assert all(len(df.index) <= 20 for df in client.load_dataframes(fp))
+    assert json.dumps(list(client.read()), default=str) == expected_rows
+
+
+def test_local_file_discover_type_change_after_first_batch(tmp_path):
+    xlsx_path = str(tmp_path / "types.xlsx")
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.append(["text_then_int", "int", "bool_then_null"])
+    for i in range(50):
+        worksheet.append(["x" if i < 5 else i, i, True if i < 30 else None])
+    workbook.save(xlsx_path)
+    parquet_path = str(tmp_path / "types.parquet")
+    pq.write_table(pyarrow.table({"bool_then_null": [True] * 30 + [None] * 20, "int": list(range(50))}), parquet_path)
+
+    expected_types = {
+        "excel": {"text_then_int": "string", "int": "number", "bool_then_null": "number"},
+        "parquet": {"bool_then_null": "string", "int": "number"},
+    }
+    for file_format, file_path in (("excel", xlsx_path), ("parquet", parquet_path)):
+        client = Client(dataset_name="test", format=file_format, url=file_path, provider={"storage": "local"})
+        whole_file_properties = client._stream_properties()
+        client.batch_size = 20
+        # the type of a column changes after the first batch, it is discovered as when the file is read whole
+        assert client._stream_properties() == whole_file_properties
+        assert {column: types["type"][0] for column, types in whole_file_properties.items()} == expected_types[file_format]
+
+
+@pytest.mark.parametrize(
+    "file_format, extension, fields, expected_columns",
+    [
+        ("csv", "csv", ["Id", "Age"], ["Age", "Id"]),
+        ("feather", "feather", ["b", "a"], ["a", "b"]),
+        ("parquet", "parquet", ["b", "a"], ["a", "b"]),
+    ],
+)
+def test_local_file_read_fields(file_format, extension, fields, expected_columns):
+    file_path = str(SAMPLE_DIRECTORY.joinpath(file_format, f"demo.{extension}"))
+    client = Client(dataset_name="test", format=file_format, url=file_path, provider={"storage": "local"})
+
+    with client.reader.open(binary=client.binary_source) as fp:
+        # only the selected columns are read, in the order of the file
+        assert all(list(df.columns) == expected_columns for df in client.load_dataframes(fp, fields=fields))
+    assert all(list(row) == expected_columns for row in client.read(fields=fields))
+
+
 def run_load_dataframes(config, expected_columns=10, expected_rows=42):
     df_list = SourceFile.load_dataframes(config=config, logger=AirbyteLogger(), skip_data=False)
     assert len(df_list) == 1  # Properly load 1 DataFrame
@@ -5,11 +5,15 @@
 
 import json
 import traceback
-from typing import Iterable
+from typing import Iterable, Iterator, List, Optional
 from urllib.parse import urlparse
 
 import google
+import openpyxl
 import pandas as pd
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet as pq
 import smart_open
 from airbyte_cdk.entrypoint import logger
 from airbyte_cdk.models import AirbyteStream, SyncMode
@@ -19,6 +23,7 @@ from botocore.config import Config
 from genson import SchemaBuilder
 from google.cloud.storage import Client as GCSClient
 from google.oauth2 import service_account
+from pandas.io.parsers import TextParser
 
 
 class ConfigurationError(Exception):
@@ -217,6 +222,10 @@ class Client:
     """Class that manages reading and parsing data from streams"""
 
     reader_class = URLFile
+    # Maximum number of rows of the dataframes a file is read in, see load_dataframes()
+    batch_size = 10000
+    # Formats read in batches by a _read_<format>_batches method -> reader options it supports, other options load the file whole
+    batch_reader_options = {"excel": set(), "feather": {"columns"}, "orc": {"columns"}, "parquet": {"columns"}}
 
     def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: str = None):
         self._dataset_name = dataset_name
@@ -252,24 +261,27 @@ class Client:
             result = result["items"]["properties"]
         return result
 
-    def load_nested_json(self, fp) -> list:
+    def load_nested_json(self, fp) -> Iterable:
         if self._reader_format == "jsonl":
-            result = []
-            line = fp.readline()
-            while line:
-                result.append(json.loads(line))
-                line = fp.readline()
+            # parsed line by line so records are not all held in memory at once
+            for line in fp:
+                yield json.loads(line)
         else:
             result = json.load(fp)
             if not isinstance(result, list):
                 result = [result]
-        return result
+            yield from result
 
-    def load_dataframes(self, fp, skip_data=False) -> Iterable:
+    def load_dataframes(self, fp, skip_data=False, fields: Iterable = None) -> Iterable:
         """load and return the appropriate pandas dataframe.
 
+        csv, excel (xlsx), parquet, orc and feather files are read in dataframes of up to batch_size rows, so the memory used
+        does not grow with the size of the file. Other formats, or reader options not supported by the batched readers,
+        load the whole file in one dataframe.
+
         :param fp: file-like object to read from
         :param skip_data: limit reading data
+        :param fields: columns to read, pushed down to the reader where the format allows it, defaults to all columns
         :return: a list of dataframe loaded from files described in the configuration
         """
         readers = {
@@ -296,15 +308,120 @@ class Client:
 
         reader_options = {**self._reader_options}
         if self._reader_format == "csv":
-            reader_options["chunksize"] = 10000
+            reader_options["chunksize"] = self.batch_size
             if skip_data:
                 reader_options["nrows"] = 0
                 reader_options["index_col"] = 0
+            if fields and "usecols" not in reader_options:
+                fields = set(fields)
+                reader_options["usecols"] = lambda column: column in fields
 
             yield from reader(fp, **reader_options)
+        elif self._reader_format in self.batch_reader_options and set(reader_options) <= self.batch_reader_options[self._reader_format]:
+            batch_reader = getattr(self, f"_read_{self._reader_format}_batches")
+            yield from batch_reader(fp, columns=reader_options.get("columns") or (list(fields) if fields else None))
         else:
             yield reader(fp, **reader_options)
 
+    def _arrow_batches_to_dataframes(self, batches: Iterable[pyarrow.RecordBatch], schema: pyarrow.Schema) -> Iterator[pd.DataFrame]:
+        """Converts the record batches to dataframes of up to batch_size rows"""
+        empty = True
+        for batch in batches:
+            for offset in range(0, batch.num_rows, self.batch_size):
+                empty = False
+                yield batch.slice(offset, self.batch_size).to_pandas()
+        if empty:
+            # a file without rows still has columns, which are needed to discover its schema
+            yield schema.empty_table().to_pandas()
+
+    @staticmethod
+    def _project(schema: pyarrow.Schema, columns: Optional[Iterable]) -> Optional[List[str]]:
+        """
+        :return: the names of the columns of the file to read, in the order of the file, None to read all of them
+        """
+        if not columns:
+            return None
+        columns = set(columns)
+        return [name for name in schema.names if name in columns]
+
+    @staticmethod
+    def _project_schema(schema: pyarrow.Schema, columns: Optional[List[str]]) -> pyarrow.Schema:
+        return schema if columns is None else pyarrow.schema([schema.field(name) for name in columns])
+
+    def _read_parquet_batches(self, fp, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Reads the row groups of the file batch_size rows at a time"""
+        parquet_file = pq.ParquetFile(fp)
+        columns = self._project(parquet_file.schema_arrow, columns)
+        batches = parquet_file.iter_batches(batch_size=self.batch_size, columns=columns)
+        yield from self._arrow_batches_to_dataframes(batches, self._project_schema(parquet_file.schema_arrow, columns))
+
+    def _read_orc_batches(self, fp, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Reads the file stripe by stripe"""
+        # imported here as pyarrow is not built with ORC support on every platform
+        from pyarrow import orc
+
+        orc_file = orc.ORCFile(fp)
+        columns = self._project(orc_file.schema, columns)
+        batches = (orc_file.read_stripe(index, columns=columns) for index in range(orc_file.nstripes))
+        yield from self._arrow_batches_to_dataframes(batches, self._project_schema(orc_file.schema, columns))
+
+    def _read_feather_batches(self, fp, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Reads the record batches of the file one at a time, feather V1 files are loaded whole"""
+        try:
+            feather_file = pyarrow.ipc.open_file(fp)
+        except pyarrow.ArrowInvalid:
+            fp.seek(0)
+            yield pd.read_feather(fp, columns=columns)
+            return
+        columns = self._project(feather_file.schema, columns)
+        batches = (feather_file.get_batch(index) for index in range(feather_file.num_record_batches))
+        for df in self._arrow_batches_to_dataframes(batches, feather_file.schema):
+            yield df if columns is None else df[columns]
+
+    @staticmethod
+    def _excel_row(values: tuple) -> list:
+        """Converts the values of a worksheet row the way pandas.read_excel does"""
+        row = ["" if value is None else int(value) if isinstance(value, float) and value.is_integer() else value for value in values]
+        while row and row[-1] == "":
+            row.pop()
+        return row
+
+    def _read_excel_batches(self, fp, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Reads the rows of the first worksheet of xlsx workbooks with a read-only openpyxl workbook, batch_size rows at a time.
+        Rows are parsed by the same parser as pandas.read_excel, so column names and types are the same.
+        Legacy xls workbooks can't be read row by row and are loaded whole.
+        """
+        is_xlsx = fp.read(4) == b"PK\x03\x04"  # xlsx workbooks are zip archives
+        fp.seek(0)
+        if not is_xlsx:
+            yield pd.read_excel(fp)
+            return
+
+        workbook = openpyxl.load_workbook(fp, read_only=True, data_only=True)
+        try:
+            rows = (self._excel_row(values) for values in workbook.worksheets[0].iter_rows(values_only=True))
+            header = next(rows, None)
+            if header is None:
+                yield pd.DataFrame()
+                return
+            batch, blank_rows, empty = [], [], True
+            for row in rows:
+                # blank rows at the end of the worksheet are ignored, as pandas does
+                if not row:
+                    blank_rows.append(row)
+                    continue
+                batch.extend(blank_rows)
+                blank_rows = []
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    yield TextParser([header, *batch], header=0).read()
+                    batch, empty = [], False
+            if batch or empty:
+                yield TextParser([header, *batch], header=0).read()
+        finally:
+            workbook.close()
+
     @staticmethod
     def dtype_to_json_type(dtype) -> str:
         """Convert Pandas Dataframe types to Airbyte Types.
@@ -336,8 +453,8 @@ class Client:
                 yield from self.load_nested_json(fp)
             else:
                 fields = set(fields) if fields else None
-                for df in self.load_dataframes(fp):
-                    columns = fields.intersection(set(df.columns)) if fields else df.columns
+                for df in self.load_dataframes(fp, fields=fields):
+                    columns = [column for column in df.columns if column in fields] if fields else df.columns
                     df = df.where(pd.notnull(df), None)
                     yield from df[columns].to_dict(orient="records")
 
@@ -350,9 +467,22 @@ class Client:
             fields = {}
             for df in df_list:
                 for col in df.columns:
-                    fields[col] = self.dtype_to_json_type(df[col].dtype)
+                    json_type = self.dtype_to_json_type(df[col].dtype)
+                    fields[col] = self._merge_json_types(fields[col], json_type) if col in fields else json_type
             return {field: {"type": [fields[field], "null"]} for field in fields}
 
+    def _merge_json_types(self, json_type: str, other_json_type: str) -> str:
+        """
+        The dtype of each batch is inferred from its own rows only, so a column can be typed differently by two batches,
+        e.g: when its values of a batch are all blank. Returns the type pandas infers when the whole file is read in one dataframe.
+        """
+        if json_type == other_json_type:
+            return json_type
+        if self._reader_format == "excel" and {json_type, other_json_type} == {"boolean", "number"}:
+            # the parser of spreadsheets reads booleans as numbers in a column holding both, blank cells included
+            return "number"
+        return "string"
+
     @property
     def streams(self) -> Iterable:
         """Discovers available streams"""
@@ -14,9 +14,7 @@ from requests.status_codes import codes as status_codes
 from .client import GoogleSheetsClient
 from .helpers import Helpers
 from .models.spreadsheet import Spreadsheet
-from .models.spreadsheet_values import SpreadsheetValues
-
-ROW_BATCH_SIZE = 200
+from .row_batch_reader import RowBatchReader
 
 
 class GoogleSheetsSource(Source):
@@ -119,39 +117,19 @@ class GoogleSheetsSource(Source):
         spreadsheet_id = config["spreadsheet_id"]
 
         logger.info(f"Starting syncing spreadsheet {spreadsheet_id}")
-        # For each sheet in the spreadsheet, get a batch of rows, and as long as there hasn't been
-        # a blank row, emit the row batch
+        # For each sheet in the spreadsheet, get batches of rows, and as long as there hasn't been
+        # a blank batch, emit the row batch. The batches of several sheets are requested at once
         sheet_to_column_index_to_name = Helpers.get_available_sheets_to_column_index_to_name(client, spreadsheet_id, sheet_to_column_name)
-        sheet_row_counts = Helpers.get_sheet_row_count(client, spreadsheet_id)
-        logger.info(f"Row counts: {sheet_row_counts}")
-        for sheet in sheet_to_column_index_to_name.keys():
-            logger.info(f"Syncing sheet {sheet}")
+        sheet_grid_sizes = Helpers.get_sheet_grid_sizes(client, spreadsheet_id)
+        logger.info(f"Row and column counts: {sheet_grid_sizes}")
+        row_batch_reader = RowBatchReader(
+            client, spreadsheet_id, {sheet: sheet_grid_sizes[sheet] for sheet in sheet_to_column_index_to_name.keys()}, logger=logger
+        )
+        for sheet, row_values in row_batch_reader.read():
             column_index_to_name = sheet_to_column_index_to_name[sheet]
-            row_cursor = 2  # we start syncing past the header row
-            # For the loop, it is necessary that the initial row exists when we send a request to the API,
-            # if the last row of the interval goes outside the sheet - this is normal, we will return
-            # only the real data of the sheet and in the next iteration we will loop out.
-            while row_cursor <= sheet_row_counts[sheet]:
-                range = f"{sheet}!{row_cursor}:{row_cursor + ROW_BATCH_SIZE}"
-                logger.info(f"Fetching range {range}")
-                row_batch = SpreadsheetValues.parse_obj(
-                    client.get_values(spreadsheetId=spreadsheet_id, ranges=range, majorDimension="ROWS")
-                )
-
-                row_cursor += ROW_BATCH_SIZE + 1
-                # there should always be one range since we requested only one
-                value_ranges = row_batch.valueRanges[0]
-
-                if not value_ranges.values:
-                    break
-
-                row_values = value_ranges.values
-                if len(row_values) == 0:
-                    break
-
-                for row in row_values:
-                    if not Helpers.is_row_empty(row) and Helpers.row_contains_relevant_data(row, column_index_to_name.keys()):
-                        yield AirbyteMessage(type=Type.RECORD, record=Helpers.row_data_to_record_message(sheet, row, column_index_to_name))
+            for row in row_values:
+                if not Helpers.is_row_empty(row) and Helpers.row_contains_relevant_data(row, column_index_to_name.keys()):
+                    yield AirbyteMessage(type=Type.RECORD, record=Helpers.row_data_to_record_message(sheet, row, column_index_to_name))
         logger.info(f"Finished syncing spreadsheet {spreadsheet_id}")
 
     @staticmethod
@@ -5,7 +5,7 @@
 import json
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, FrozenSet, Iterable, List
+from typing import Dict, FrozenSet, Iterable, List, Tuple
 
 from airbyte_protocol import AirbyteRecordMessage, AirbyteStream, ConfiguredAirbyteCatalog
 from base_python import AirbyteLogger
@@ -154,10 +154,18 @@ class Helpers(object):
 
     @staticmethod
     def get_sheet_row_count(client, spreadsheet_id: str) -> Dict[str, int]:
+        return {sheet: row_count for sheet, (row_count, _) in Helpers.get_sheet_grid_sizes(client, spreadsheet_id).items()}
+
+    @staticmethod
+    def get_sheet_grid_sizes(client, spreadsheet_id: str) -> Dict[str, Tuple[int, int]]:
+        """Returns the (row count, column count) of every sheet"""
         spreadsheet_metadata = Spreadsheet.parse_obj(client.get(spreadsheetId=spreadsheet_id, includeGridData=False))
         # filter out sheets without gridProperties (like in diagram sheets)
         data_sheets = [sheet for sheet in spreadsheet_metadata.sheets if hasattr(sheet.properties, "gridProperties")]
-        return {sheet.properties.title: sheet.properties.gridProperties["rowCount"] for sheet in data_sheets}
+        return {
+            sheet.properties.title: (sheet.properties.gridProperties["rowCount"], sheet.properties.gridProperties.get("columnCount", 0))
+            for sheet in data_sheets
+        }
 
     @staticmethod
     def get_grid_sheets(spreadsheet_metadata) -> List[str]:
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+from typing import Dict, Iterator, List, Tuple
+
+from base_python import AirbyteLogger
+
+# Responses are kept around the payload size recommended by the Sheets API
+TARGET_RESPONSE_BYTES = 2 * 1024 * 1024
+# Ranges are sent in the query string of values.batchGet, so their number is kept small
+MAX_RANGES_PER_REQUEST = 10
+MIN_ROW_BATCH_SIZE = 200
+MAX_ROW_BATCH_SIZE = 20000
+# Estimated size of a cell before any row of the sheet was read, and the JSON overhead of each cell (quotes and separator)
+INITIAL_CELL_BYTES = 16
+CELL_OVERHEAD_BYTES = 3
+
+
+class SheetCursor:
+    """Position of the next row to read in a sheet and the estimated size of its rows"""
+
+    def __init__(self, sheet: str, row_count: int, column_count: int):
+        self.sheet = sheet
+        self.row_count = row_count
+        self.row_cursor = 2  # we start syncing past the header row
+        self.row_bytes = max(1, column_count) * (INITIAL_CELL_BYTES + CELL_OVERHEAD_BYTES)
+        self.finished = row_count < self.row_cursor
+
+    def next_range(self, budget_bytes: int) -> Tuple[str, int]:
+        """
+        :return: the A1 notation of the next rows of the sheet which fit in budget_bytes, and the number of rows
+        """
+        rows = min(max(budget_bytes // self.row_bytes, MIN_ROW_BATCH_SIZE), MAX_ROW_BATCH_SIZE)
+        # if the last row of the range goes outside the sheet, the API returns only the real data of the sheet
+        return f"{self.sheet}!{self.row_cursor}:{self.row_cursor + rows - 1}", rows
+
+    def advance(self, rows: int, values: List[List[str]]):
+        """Moves past the requested rows, the sheet is finished once a range has no values or the end of the sheet is reached"""
+        self.row_cursor += rows
+        if not values:
+            self.finished = True
+            return
+        if self.row_cursor > self.row_count:
+            self.finished = True
+        cells = sum(len(row) for row in values)
+        self.row_bytes = max(1, (sum(len(cell) for row in values for cell in row) + cells * CELL_OVERHEAD_BYTES) // len(values))
+
+
+class RowBatchReader:
+    """
+    Reads the rows of several sheets with values.batchGet, requesting the next rows of up to MAX_RANGES_PER_REQUEST sheets at once.
+    The number of rows requested from each sheet is sized so a response stays around TARGET_RESPONSE_BYTES: it starts from the number of
+    columns of the sheet and follows the size of the rows read so far. Values are read from the response as is, without building models.
+    """
+
+    def __init__(self, client, spreadsheet_id: str, sheet_grid_sizes: Dict[str, Tuple[int, int]], logger: AirbyteLogger = None):
+        """
+        :param client: GoogleSheetsClient
+        :param spreadsheet_id: spreadsheet to read
+        :param sheet_grid_sizes: sheet name -> (row count, column count) of the sheets to read, in the order to read them
+        """
+        self.client = client
+        self.spreadsheet_id = spreadsheet_id
+        self.cursors = [SheetCursor(sheet, row_count, column_count) for sheet, (row_count, column_count) in sheet_grid_sizes.items()]
+        self.logger = logger or AirbyteLogger()
+
+    def read(self) -> Iterator[Tuple[str, List[List[str]]]]:
+        """
+        :return: (sheet name, rows) for every range read, the rows of each sheet are yielded in order
+        """
+        pending = [cursor for cursor in self.cursors if not cursor.finished]
+        while pending:
+            batch = pending[:MAX_RANGES_PER_REQUEST]
+            budget_bytes = TARGET_RESPONSE_BYTES // len(batch)
+            ranges, row_counts = zip(*[cursor.next_range(budget_bytes) for cursor in batch])
+            self.logger.info(f"Fetching ranges {list(ranges)}")
+            response = self.client.get_values(spreadsheetId=self.spreadsheet_id, ranges=list(ranges), majorDimension="ROWS")
+
+            # value ranges are returned in the order of the requested ranges
+            value_ranges = response.get("valueRanges", [])
+            for index, cursor in enumerate(batch):
+                values = (value_ranges[index].get("values") if index < len(value_ranges) else None) or []
+                cursor.advance(row_counts[index], values)
+                if values:
+                    yield cursor.sheet, values
+            pending = [cursor for cursor in pending if not cursor.finished]
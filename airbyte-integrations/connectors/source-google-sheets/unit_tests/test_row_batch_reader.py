@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import re
+import unittest
+from unittest.mock import Mock
+
+from google_sheets_source.row_batch_reader import MAX_RANGES_PER_REQUEST, MAX_ROW_BATCH_SIZE, MIN_ROW_BATCH_SIZE, RowBatchReader
+
+
+def fake_client(sheets):
+    """Returns a client answering values.batchGet from sheet name -> rows, the first row being the header"""
+
+    def get_values(spreadsheetId, ranges, majorDimension):
+        value_ranges = []
+        for requested_range in ranges:
+            sheet, start, end = re.fullmatch(r"(.+)!(\d+):(\d+)", requested_range).groups()
+            values = sheets[sheet][int(start) - 1 : int(end)]
+            value_ranges.append({"range": requested_range, "values": values} if values else {"range": requested_range})
+        return {"spreadsheetId": spreadsheetId, "valueRanges": value_ranges}
+
+    client = Mock()
+    client.get_values.side_effect = get_values
+    return client
+
+
+def window(requested_range):
+    start, end = requested_range.split("!")[1].split(":")
+    return int(end) - int(start) + 1
+
+
+class TestRowBatchReader(unittest.TestCase):
+    def test_read_all_rows_of_all_sheets(self):
+        sheets = {
+            "s1": [["h1", "h2"]] + [[f"a{i}", f"b{i}"] for i in range(1000)],
+            "s2": [["h1"]] + [[f"c{i}"] for i in range(10)],
+            "empty": [["h1"]],
+        }
+        client = fake_client(sheets)
+        reader = RowBatchReader(client, "id", {sheet: (len(rows), len(rows[0])) for sheet, rows in sheets.items()})
+
+        rows = {}
+        for sheet, values in reader.read():
+            rows.setdefault(sheet, []).extend(values)
+
+        self.assertEqual(rows, {"s1": sheets["s1"][1:], "s2": sheets["s2"][1:]})
+        # both sheets are read with a single request
+        self.assertEqual(client.get_values.call_count, 1)
+
+    def test_windows_follow_row_size(self):
+        wide_rows = [["x" * 1000] * 50 for _ in range(5000)]
+        client = fake_client({"wide": [["h"] * 50] + wide_rows, "narrow": [["h"]] + [["1"]] * 5000})
+        reader = RowBatchReader(client, "id", {"wide": (5001, 50), "narrow": (5001, 1)})
+
+        list(reader.read())
+
+        first_ranges = client.get_values.call_args_list[0][1]["ranges"]
+        second_ranges = client.get_values.call_args_list[1][1]["ranges"]
+        # the narrow sheet is read in larger windows than the wide one
+        self.assertGreater(window(first_ranges[1]), window(first_ranges[0]))
+        # wide rows are larger than estimated from the column count: the next window is smaller but never below the minimum
+        self.assertEqual(window(second_ranges[0]), MIN_ROW_BATCH_SIZE)
+        self.assertLessEqual(window(first_ranges[1]), MAX_ROW_BATCH_SIZE)
+
+    def test_ranges_per_request_are_limited(self):
+        sheets = {f"s{i}": [["h"], ["v"]] for i in range(MAX_RANGES_PER_REQUEST + 5)}
+        client = fake_client(sheets)
+        reader = RowBatchReader(client, "id", {sheet: (2, 1) for sheet in sheets})
+
+        self.assertEqual([sheet for sheet, _ in reader.read()], list(sheets))
+        self.assertEqual([len(call[1]["ranges"]) for call in client.get_values.call_args_list], [MAX_RANGES_PER_REQUEST, 5])
+
+    def test_blank_range_finishes_sheet(self):
+        client = fake_client({"s1": [["h"]] + [["v"]] * 10})
+        # the grid is larger than the data: reading stops at the first range without values
+        reader = RowBatchReader(client, "id", {"s1": (100000, 1)})
+
+        self.assertEqual(list(reader.read()), [("s1", [["v"]] * 10)])
+        self.assertEqual(client.get_values.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
-    "airbyte-cdk~=0.1",
+    "airbyte-cdk~=0.1.50",
     "backoff==1.11.1",
     "pendulum==2.1.2",
     "requests==2.26.0",
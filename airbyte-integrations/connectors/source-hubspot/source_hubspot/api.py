@@ -4,6 +4,7 @@
 
 
 import sys
+import threading
 import time
 import urllib.parse
 from abc import ABC, abstractmethod
@@ -15,7 +16,9 @@ import backoff
 import pendulum as pendulum
 import requests
 from airbyte_cdk.entrypoint import logger
+from airbyte_cdk.sources.streams.http import RateLimiter
 from airbyte_cdk.sources.streams.http.requests_native_auth import Oauth2Authenticator
+from airbyte_cdk.utils.concurrency import map_in_order
 from source_hubspot.errors import HubspotAccessDenied, HubspotInvalidAuth, HubspotRateLimited, HubspotTimeout
 
 # The value is obtained experimentally, HubSpot allows the URL length up to ~16300 symbols,
@@ -70,6 +73,21 @@ def split_properties(properties_list: List[str]) -> Iterator[Tuple[str]]:
         yield local_properties
 
 
+def merge_property_chunks(chunks: Iterable[Iterable[MutableMapping[str, Any]]]) -> Iterable[MutableMapping[str, Any]]:
+    """
+    Merges the transformed records of one page requested once per chunk of properties, see split_properties.
+    The records of the first chunk are kept and the properties of the same records in the next chunks are added to them in place,
+    records missing from the first chunk (e.g: created between the requests) are kept as well.
+    """
+    records: MutableMapping[str, MutableMapping[str, Any]] = {}
+    for chunk in chunks:
+        for record in chunk:
+            merged = records.setdefault(record["id"], record)
+            if merged is not record and merged.get("properties"):
+                merged["properties"].update(record.get("properties", {}))
+    return records.values()
+
+
 def retry_connection_handler(**kwargs):
     """Retry helper, log each attempt"""
 
@@ -123,27 +141,47 @@ class API:
 
     BASE_URL = "https://api.hubapi.com"
     USER_AGENT = "Airbyte"
+    # HubSpot allows 100 requests per 10 seconds to API keys and OAuth apps, see https://developers.hubspot.com/docs/api/usage-details
+    RATE_LIMIT_CALLS = 100
+    RATE_LIMIT_PERIOD_SECONDS = 10
 
     def __init__(self, credentials: Mapping[str, Any]):
-        self._session = requests.Session()
+        # Shared by all requests of the source, including the concurrent requests of property chunks
+        self.rate_limiter = RateLimiter(
+            calls=self.RATE_LIMIT_CALLS, period=self.RATE_LIMIT_PERIOD_SECONDS, remaining_header="X-HubSpot-RateLimit-Remaining"
+        )
+        # The property chunks are requested from several threads, each one gets its own session, see _session
+        self._sessions = threading.local()
+        self._auth: Optional[Oauth2Authenticator] = None
+        self._params: MutableMapping[str, Any] = {}
         credentials_title = credentials.get("credentials_title")
 
         if credentials_title == "OAuth Credentials":
-            self._session.auth = Oauth2Authenticator(
+            self._auth = Oauth2Authenticator(
                 token_refresh_endpoint=self.BASE_URL + "/oauth/v1/token",
                 client_id=credentials["client_id"],
                 client_secret=credentials["client_secret"],
                 refresh_token=credentials["refresh_token"],
             )
         elif credentials_title == "API Key Credentials":
-            self._session.params["hapikey"] = credentials.get("api_key")
+            self._params["hapikey"] = credentials.get("api_key")
         else:
             raise Exception("No supported `credentials_title` specified. See spec.json for references")
 
-        self._session.headers = {
-            "Content-Type": "application/json",
-            "User-Agent": self.USER_AGENT,
-        }
+    @property
+    def _session(self) -> requests.Session:
+        """The session of the current thread, created on its first request"""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.auth = self._auth
+            session.params = dict(self._params)
+            session.headers = {
+                "Content-Type": "application/json",
+                "User-Agent": self.USER_AGENT,
+            }
+            self._sessions.session = session
+        return session
 
     @staticmethod
     def _parse_and_handle_errors(response) -> Union[MutableMapping[str, Any], List[MutableMapping[str, Any]]]:
@@ -171,16 +209,26 @@ class API:
 
         return response.json()
 
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        url = self.BASE_URL + url
+        self.rate_limiter.acquire(url)
+        response = None
+        try:
+            response = self._session.request(method, url, **kwargs)
+        finally:
+            self.rate_limiter.release(url, response)
+        return response
+
     @retry_connection_handler(max_tries=5, factor=5)
     @retry_after_handler(max_tries=3)
     def get(self, url: str, params: MutableMapping[str, Any] = None) -> Union[MutableMapping[str, Any], List[MutableMapping[str, Any]]]:
-        response = self._session.get(self.BASE_URL + url, params=params)
+        response = self._send("GET", url, params=params)
         return self._parse_and_handle_errors(response)
 
     def post(
         self, url: str, data: Mapping[str, Any], params: MutableMapping[str, Any] = None
     ) -> Union[Mapping[str, Any], List[Mapping[str, Any]]]:
-        response = self._session.post(self.BASE_URL + url, params=params, json=data)
+        response = self._send("POST", url, params=params, json=data)
         return self._parse_and_handle_errors(response)
 
 
@@ -199,6 +247,8 @@ class Stream(ABC):
     limit_field = "limit"
     limit = 100
     offset = 0
+    # Maximum number of requests for the property chunks of a page in flight at the same time
+    max_concurrent_property_chunks = 5
 
     @property
     @abstractmethod
@@ -312,31 +362,33 @@ class Stream(ABC):
                     continue
             yield record
 
+    def _read_property_chunks(
+        self, getter: Callable, params: Mapping[str, Any], properties_chunks: List[str]
+    ) -> List[Union[Mapping[str, Any], List[dict]]]:
+        """Requests the page once per chunk of properties, concurrently, the responses are in the order of the chunks"""
+        max_workers = min(len(properties_chunks), self.max_concurrent_property_chunks)
+        return list(map_in_order(lambda properties: getter(params={**params, "properties": properties}), properties_chunks, max_workers))
+
     def _read(self, getter: Callable, params: MutableMapping[str, Any] = None) -> Iterator:
+        # TODO: Additional processing was added due to the fact that users receive 414 errors while syncing their streams (issues #3977 and #5835).
+        #  We will need to fix this code when the HubSpot developers add the ability to use a special parameter to get all properties for an entity.
+        #  According to HubSpot Community (https://community.hubspot.com/t5/APIs-Integrations/Get-all-contact-properties-without-explicitly-listing-them/m-p/447950)
+        #  and the official documentation, this does not exist at the moment.
+        properties_chunks = [",".join(properties) for properties in split_properties(list(self.properties.keys()))]
         next_page_token = None
         while True:
             if next_page_token:
                 params.update(next_page_token)
 
-            properties_list = list(self.properties.keys())
-            if properties_list:
-                # TODO: Additional processing was added due to the fact that users receive 414 errors while syncing their streams (issues #3977 and #5835).
-                #  We will need to fix this code when the HubSpot developers add the ability to use a special parameter to get all properties for an entity.
-                #  According to HubSpot Community (https://community.hubspot.com/t5/APIs-Integrations/Get-all-contact-properties-without-explicitly-listing-them/m-p/447950)
-                #  and the official documentation, this does not exist at the moment.
-                stream_records = {}
-
-                for properties in split_properties(properties_list):
-                    params.update({"properties": ",".join(properties)})
-                    response = getter(params=params)
-                    for record in self._transform(self.parse_response(response)):
-                        if record["id"] not in stream_records:
-                            stream_records[record["id"]] = record
-                        elif stream_records[record["id"]].get("properties"):
-                            stream_records[record["id"]]["properties"].update(record.get("properties", {}))
-
-                yield from [value for key, value in stream_records.items()]
+            if len(properties_chunks) > 1:
+                responses = self._read_property_chunks(getter, params, properties_chunks)
+                # All chunks of a page share the same pagination
+                response = responses[-1]
+                # Records are merged on their id, which some streams only set in _transform, e.g: engagements
+                yield from merge_property_chunks(self._transform(self.parse_response(chunk_response)) for chunk_response in responses)
             else:
+                if properties_chunks:
+                    params["properties"] = properties_chunks[0]
                 response = getter(params=params)
                 yield from self._transform(self.parse_response(response))
 
@@ -3,10 +3,13 @@
 #
 
 
+import threading
+import time
 from functools import partial
+from unittest.mock import PropertyMock, patch
 
 import pytest
-from source_hubspot.api import API, PROPERTIES_PARAM_MAX_LENGTH, split_properties
+from source_hubspot.api import API, PROPERTIES_PARAM_MAX_LENGTH, EngagementStream, merge_property_chunks, split_properties
 from source_hubspot.client import Client
 
 NUMBER_OF_PROPERTIES = 2000
@@ -260,3 +263,88 @@ class TestSplittingPropertiesFunctionality:
         stream_records = list(test_stream.read(getter=partial(self.get, test_stream.url, api=api)))
 
         assert len(stream_records) == 6
+
+    def test_property_chunks_requested_concurrently(self, requests_mock, client, fake_properties_list):
+        """
+        Check that the requests of the property chunks of a page are in flight at the same time
+        """
+        self.set_mock_properties(requests_mock, "/properties/v2/company/properties", fake_properties_list)
+        test_stream = client._apis.get("companies")
+        number_of_chunks = len(list(split_properties(fake_properties_list)))
+        assert number_of_chunks > 1
+
+        in_flight = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        def get(params):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.1)
+            with lock:
+                in_flight -= 1
+            properties = params["properties"].split(",")
+            return {"results": [{**self.BASE_OBJECT_BODY, "id": "1", "properties": {p: "fake_data" for p in properties}}], "paging": {}}
+
+        stream_records = list(test_stream.read(getter=get))
+
+        assert max_in_flight == min(number_of_chunks, test_stream.max_concurrent_property_chunks)
+        assert len(stream_records) == 1
+        assert len(stream_records[0]["properties"]) == NUMBER_OF_PROPERTIES
+
+    def test_property_chunks_merged_after_transform(self, client, fake_properties_list):
+        """
+        Check that the records of engagements, whose id is only set by _transform, are merged across property chunks
+        """
+        test_stream = client._apis.get("engagements")
+
+        def get(params):
+            return {"results": [{"engagement": {"id": 1, "lastUpdated": 1628000000000}, "metadata": {"chunk": params["properties"][:20]}}]}
+
+        with patch.object(EngagementStream, "properties", new_callable=PropertyMock, return_value={p: {} for p in fake_properties_list}):
+            stream_records = list(test_stream._read(getter=get, params={}))
+
+        assert [record["id"] for record in stream_records] == [1]
+
+    def test_session_per_thread(self, api):
+        """
+        Check that the property chunks requested from worker threads don't share a session
+        """
+        sessions = []
+        worker = threading.Thread(target=lambda: sessions.append(api._session))
+        worker.start()
+        worker.join()
+
+        assert api._session is api._session
+        assert sessions[0] is not api._session
+        assert sessions[0].params == api._session.params == {"hapikey": "wrong_key"}
+
+
+def test_merge_property_chunks():
+    chunks = [
+        [{"id": "1", "properties": {"a": 1}}, {"id": "2", "properties": {"a": 2}}],
+        [{"id": "2", "properties": {"b": 2}}, {"id": "1", "properties": {"b": 1}}, {"id": "3", "properties": {"b": 3}}],
+    ]
+    first_record = chunks[0][0]
+
+    records = list(merge_property_chunks(chunks))
+
+    assert records == [
+        {"id": "1", "properties": {"a": 1, "b": 1}},
+        {"id": "2", "properties": {"a": 2, "b": 2}},
+        {"id": "3", "properties": {"b": 3}},
+    ]
+    # records of the first chunk are updated in place
+    assert records[0] is first_record
+
+
+def test_api_rate_limit_remaining_header(requests_mock, some_credentials):
+    api = API(some_credentials)
+    requests_mock.register_uri("GET", API.BASE_URL + "/some/url", json={}, headers={"X-HubSpot-RateLimit-Remaining": "0"})
+
+    api.get("/some/url")
+
+    # the rate limit of the portal is exhausted, further requests wait for it to refill
+    assert api.rate_limiter._try_acquire() > 0
@@ -243,26 +243,20 @@ class IterableExportStreamAdjustableRange(IterableExportStream):
         stream_slice: StreamSlice,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
-        start_time = pendulum.now()
-        for _ in range(self.CHUNKED_ENCODING_ERROR_RETRIES):
-            try:
-
-                self.logger.info(
-                    f"Processing slice of {(stream_slice.end_date - stream_slice.start_date).total_days()} days for stream {self.name}"
-                )
-                for record in super().read_records(
-                    sync_mode=sync_mode,
-                    cursor_field=cursor_field,
-                    stream_slice=stream_slice,
-                    stream_state=stream_state,
-                ):
-                    now = pendulum.now()
-                    self._adjustable_generator.adjust_range(now - start_time)
-                    yield record
-                    start_time = now
-                break
-            except ChunkedEncodingError:
-                self.logger.warn("ChunkedEncodingError occured, decrease days range and try again")
-                stream_slice = self._adjustable_generator.reduce_range()
-        else:
+        def read_slice(stream_slice: StreamSlice) -> Iterable[Mapping[str, Any]]:
+            self.logger.info(
+                f"Processing slice of {(stream_slice.end_date - stream_slice.start_date).total_days()} days for stream {self.name}"
+            )
+            return super(IterableExportStreamAdjustableRange, self).read_records(
+                sync_mode=sync_mode,
+                cursor_field=cursor_field,
+                stream_slice=stream_slice,
+                stream_state=stream_state,
+            )
+
+        try:
+            yield from self._adjustable_generator.read_slice(
+                stream_slice, read_slice, retry_on=(ChunkedEncodingError,), max_attempts=self.CHUNKED_ENCODING_ERROR_RETRIES
+            )
+        except ChunkedEncodingError:
             raise Exception(f"ChunkedEncodingError: Reached maximum number of retires: {self.CHUNKED_ENCODING_ERROR_RETRIES}")
@@ -10,16 +10,23 @@ from source_iterable.slice_generators import AdjustableSliceGenerator, RangeSlic
 TEST_DATE = pendulum.parse("2020-01-01")
 
 
+@freezegun.freeze_time(TEST_DATE + pendulum.Duration(days=1000))
 def test_slice_gen():
     start_date = TEST_DATE
     generator = AdjustableSliceGenerator(start_date)
     dates = []
     for i in generator:
         dates.append(i)
-        generator.adjust_range(pendulum.Period(start=start_date, end=start_date))
+        # slices processed instantly grow up to MAX_RANGE_DAYS
+        generator.update(records=1, seconds=0)
     assert dates
     days = [(slice.end_date - slice.start_date).total_days() for slice in dates]
-    assert days[1] == AdjustableSliceGenerator.DEFAULT_RANGE_DAYS
+    assert days[:4] == [
+        AdjustableSliceGenerator.INITIAL_RANGE_DAYS,
+        120,
+        AdjustableSliceGenerator.MAX_RANGE_DAYS,
+        AdjustableSliceGenerator.MAX_RANGE_DAYS,
+    ]
 
 
 @freezegun.freeze_time(TEST_DATE + pendulum.Duration(days=1000))
@@ -32,7 +39,18 @@ def test_slice_gen_no_range_adjust():
     assert dates
     days = [(slice.end_date - slice.start_date).total_days() for slice in dates]
     assert days
-    assert days[1] == AdjustableSliceGenerator.MAX_RANGE_DAYS
+    assert days[1] == AdjustableSliceGenerator.INITIAL_RANGE_DAYS
+
+
+@freezegun.freeze_time(TEST_DATE + pendulum.Duration(days=1000))
+def test_slice_gen_reduce_range():
+    generator = AdjustableSliceGenerator(TEST_DATE)
+    slice = next(iter(generator))
+    retry_slice = generator.shrink()
+    assert retry_slice.start_date == slice.start_date
+    assert (retry_slice.end_date - retry_slice.start_date).total_days() == (
+        AdjustableSliceGenerator.INITIAL_RANGE_DAYS / AdjustableSliceGenerator.RANGE_REDUCE_FACTOR
+    )
 
 
 @pytest.mark.parametrize(
@@ -5,7 +5,7 @@
 
 from setuptools import find_packages, setup
 
-MAIN_REQUIREMENTS = ["airbyte-cdk~=0.1", "requests==2.25.1", "pendulum>=1.2.0", "vcrpy==4.1.1"]
+MAIN_REQUIREMENTS = ["airbyte-cdk~=0.1.52", "requests==2.25.1", "pendulum>=1.2.0", "vcrpy==4.1.1"]
 
 TEST_REQUIREMENTS = [
     "pytest==6.1.2",
@@ -9,7 +9,8 @@ from typing import Any, List, Mapping, Optional, Tuple
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources import AbstractSource
-from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams import MaterializedStream, Stream
+from airbyte_cdk.sources.streams.http import RateLimiter
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator
 
 from .streams import (
@@ -68,6 +69,10 @@ from .streams import (
 
 
 class SourceJira(AbstractSource):
+    # Jira Cloud does not publish fixed rate limits, a 429 response with a Retry-After header pauses all streams sharing the limiter
+    RATE_LIMIT_CALLS = 100
+    RATE_LIMIT_PERIOD_SECONDS = 10
+
     @staticmethod
     def get_authenticator(config: Mapping[str, Any]):
         token = b64encode(bytes(config["email"] + ":" + config["api_token"], "utf-8")).decode("ascii")
@@ -99,9 +104,19 @@ class SourceJira(AbstractSource):
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         authenticator = self.get_authenticator(config)
-        args = {"authenticator": authenticator, "domain": config["domain"], "projects": config.get("projects", [])}
+        # Shared by all streams, as the resources of several issues are requested at the same time by the issue substreams
+        rate_limiter = RateLimiter(calls=self.RATE_LIMIT_CALLS, period=self.RATE_LIMIT_PERIOD_SECONDS)
+        args = {
+            "authenticator": authenticator,
+            "domain": config["domain"],
+            "projects": config.get("projects", []),
+            "rate_limiter": rate_limiter,
+        }
         incremental_args = {**args, "start_date": config.get("start_date", "")}
         render_fields = config.get("render_fields", False)
+        # the issues are read once for all the streams reading a resource of each issue
+        issues_stream = MaterializedStream(Issues(additional_fields=[], **incremental_args), fields=["key"])
+        issue_args = {**incremental_args, "issues_stream": issues_stream}
         return [
             ApplicationRoles(**args),
             Avatars(**args),
@@ -118,7 +133,7 @@ class SourceJira(AbstractSource):
                 expand_changelog=config.get("expand_issue_changelog", False),
                 render_fields=render_fields
             ),
-            IssueComments(**incremental_args),
+            IssueComments(**issue_args),
             IssueFields(**args),
             IssueFieldConfigurations(**args),
             IssueCustomFieldContexts(**args),
@@ -126,15 +141,15 @@ class SourceJira(AbstractSource):
             IssueNavigatorSettings(**args),
             IssueNotificationSchemes(**args),
             IssuePriorities(**args),
-            IssueProperties(**incremental_args),
-            IssueRemoteLinks(**incremental_args),
+            IssueProperties(**issue_args),
+            IssueRemoteLinks(**issue_args),
             IssueResolutions(**args),
             IssueSecuritySchemes(**args),
             IssueTypeSchemes(**args),
             IssueTypeScreenSchemes(**args),
-            IssueVotes(**incremental_args),
-            IssueWatchers(**incremental_args),
-            IssueWorklogs(**incremental_args),
+            IssueVotes(**issue_args),
+            IssueWatchers(**issue_args),
+            IssueWorklogs(**issue_args),
             JiraSettings(**args),
             Labels(**args),
             Permissions(**args),
@@ -10,7 +10,9 @@ from urllib.parse import parse_qs
 import pendulum
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.utils.concurrency import fan_out
 
 API_VERSION = 3
 
@@ -177,7 +179,9 @@ class Boards(V1ApiJiraStream):
         return params
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        projects_stream = Projects(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        projects_stream = Projects(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for project in projects_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"project_id": project["id"], "project_key": project["key"]}, **kwargs)
 
@@ -214,7 +218,9 @@ class BoardIssues(V1ApiJiraStream, IncrementalJiraStream):
         return params
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        boards_stream = Boards(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        boards_stream = Boards(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for board in boards_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"board_id": board["id"]}, **kwargs)
 
@@ -265,7 +271,9 @@ class Epics(IncrementalJiraStream):
         return params
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        projects_stream = Projects(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        projects_stream = Projects(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for project in projects_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"project_id": project["id"], "project_key": project["key"]}, **kwargs)
 
@@ -297,7 +305,9 @@ class FilterSharing(JiraStream):
         return f"filter/{filter_id}/permission"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        filters_stream = Filters(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        filters_stream = Filters(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for filters in filters_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"filter_id": filters["id"]}, **kwargs)
 
@@ -353,7 +363,12 @@ class Issues(IncrementalJiraStream):
         return params
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        stream_args = {"authenticator": self.authenticator, "domain": self._domain, "projects": self._projects}
+        stream_args = {
+            "authenticator": self.authenticator,
+            "domain": self._domain,
+            "projects": self._projects,
+            "rate_limiter": self.rate_limiter,
+        }
         field_ids_by_name = IssueFields(**stream_args).field_ids_by_name()
         fields = [
             "assignee",
@@ -389,27 +404,57 @@ class Issues(IncrementalJiraStream):
         return record
 
 
-class IssueComments(StartDateJiraStream):
+class IssueSubStream(StartDateJiraStream, ABC):
     """
-    https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-comments/#api-rest-api-3-issue-issueidorkey-comment-get
+    Stream reading a resource of each issue.
+    Pass the same MaterializedStream of issues to all IssueSubStreams of a source so the issues are read once per sync,
+    and the same RateLimiter to the issues and all IssueSubStreams so the requests of the issues read at the same time share one budget.
     """
 
-    parse_response_root = "comments"
-
-    def path(self, stream_slice: Mapping[str, Any], **kwargs) -> str:
-        key = stream_slice["key"]
-        return f"issue/{key}/comment"
+    # maximum number of issues whose resource is read at the same time
+    max_concurrent_issues = 5
 
-    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        issues_stream = Issues(
+    def __init__(self, issues_stream: Optional[Stream] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._issues_stream = issues_stream or Issues(
             additional_fields=[],
             authenticator=self.authenticator,
             domain=self._domain,
             projects=self._projects,
             start_date=self._start_date,
+            rate_limiter=self.rate_limiter,
         )
-        for issue in issues_stream.read_records(sync_mode=SyncMode.full_refresh):
-            yield from super().read_records(stream_slice={"key": issue["key"]}, **kwargs)
+
+    def issue_slices(self, issue: Mapping[str, Any], **kwargs) -> Iterable[Mapping[str, Any]]:
+        """
+        :return: the slices read for the issue
+        """
+        yield {"key": issue["key"]}
+
+    def read_issue_records(self, issue: Mapping[str, Any], **kwargs) -> Iterable[Mapping[str, Any]]:
+        """
+        :return: the records of the resource of the issue
+        """
+        for issue_slice in self.issue_slices(issue, **kwargs):
+            yield from super().read_records(stream_slice=issue_slice, **kwargs)
+
+    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+        issues = self._issues_stream.read_records(sync_mode=SyncMode.full_refresh)
+        # the resources of several issues are read at the same time, the records are still emitted in the issue order
+        for _, records in fan_out(issues, lambda issue: self.read_issue_records(issue, **kwargs), max_workers=self.max_concurrent_issues):
+            yield from records
+
+
+class IssueComments(IssueSubStream):
+    """
+    https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-comments/#api-rest-api-3-issue-issueidorkey-comment-get
+    """
+
+    parse_response_root = "comments"
+
+    def path(self, stream_slice: Mapping[str, Any], **kwargs) -> str:
+        key = stream_slice["key"]
+        return f"issue/{key}/comment"
 
 
 class IssueFields(JiraStream):
@@ -449,7 +494,9 @@ class IssueCustomFieldContexts(JiraStream):
         return f"field/{field_id}/context"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        fields_stream = IssueFields(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        fields_stream = IssueFields(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for field in fields_stream.read_records(sync_mode=SyncMode.full_refresh):
             if field.get("custom", False):
                 yield from super().read_records(stream_slice={"field_id": field["id"]}, **kwargs)
@@ -514,7 +561,7 @@ class IssuePropertyKeys(JiraStream):
         yield from super().read_records(stream_slice={"key": issue_key}, **kwargs)
 
 
-class IssueProperties(StartDateJiraStream):
+class IssueProperties(IssueSubStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-properties/#api-rest-api-3-issue-issueidorkey-properties-propertykey-get
     """
@@ -524,21 +571,15 @@ class IssueProperties(StartDateJiraStream):
         issue_key = stream_slice["issue_key"]
         return f"issue/{issue_key}/properties/{key}"
 
-    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        issues_stream = Issues(
-            additional_fields=[],
-            authenticator=self.authenticator,
-            domain=self._domain,
-            projects=self._projects,
-            start_date=self._start_date,
+    def issue_slices(self, issue: Mapping[str, Any], **kwargs) -> Iterable[Mapping[str, Any]]:
+        issue_property_keys_stream = IssuePropertyKeys(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
         )
-        issue_property_keys_stream = IssuePropertyKeys(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
-        for issue in issues_stream.read_records(sync_mode=SyncMode.full_refresh):
-            for property_key in issue_property_keys_stream.read_records(stream_slice={"key": issue["key"]}, **kwargs):
-                yield from super().read_records(stream_slice={"key": property_key["key"], "issue_key": issue["key"]}, **kwargs)
+        for property_key in issue_property_keys_stream.read_records(stream_slice={"key": issue["key"]}, **kwargs):
+            yield {"key": property_key["key"], "issue_key": issue["key"]}
 
 
-class IssueRemoteLinks(StartDateJiraStream):
+class IssueRemoteLinks(IssueSubStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-remote-links/#api-rest-api-3-issue-issueidorkey-remotelink-get
     """
@@ -547,17 +588,6 @@ class IssueRemoteLinks(StartDateJiraStream):
         key = stream_slice["key"]
         return f"issue/{key}/remotelink"
 
-    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        issues_stream = Issues(
-            additional_fields=[],
-            authenticator=self.authenticator,
-            domain=self._domain,
-            projects=self._projects,
-            start_date=self._start_date,
-        )
-        for issue in issues_stream.read_records(sync_mode=SyncMode.full_refresh):
-            yield from super().read_records(stream_slice={"key": issue["key"]}, **kwargs)
-
 
 class IssueResolutions(JiraStream):
     """
@@ -601,7 +631,7 @@ class IssueTypeScreenSchemes(JiraStream):
         return "issuetypescreenscheme"
 
 
-class IssueVotes(StartDateJiraStream):
+class IssueVotes(IssueSubStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-votes/#api-rest-api-3-issue-issueidorkey-votes-get
 
@@ -618,19 +648,8 @@ class IssueVotes(StartDateJiraStream):
         key = stream_slice["key"]
         return f"issue/{key}/votes"
 
-    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        issues_stream = Issues(
-            additional_fields=[],
-            authenticator=self.authenticator,
-            domain=self._domain,
-            projects=self._projects,
-            start_date=self._start_date,
-        )
-        for issue in issues_stream.read_records(sync_mode=SyncMode.full_refresh):
-            yield from super().read_records(stream_slice={"key": issue["key"]}, **kwargs)
-
 
-class IssueWatchers(StartDateJiraStream):
+class IssueWatchers(IssueSubStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-watchers/#api-rest-api-3-issue-issueidorkey-watchers-get
 
@@ -644,19 +663,8 @@ class IssueWatchers(StartDateJiraStream):
         key = stream_slice["key"]
         return f"issue/{key}/watchers"
 
-    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        issues_stream = Issues(
-            additional_fields=[],
-            authenticator=self.authenticator,
-            domain=self._domain,
-            projects=self._projects,
-            start_date=self._start_date,
-        )
-        for issue in issues_stream.read_records(sync_mode=SyncMode.full_refresh):
-            yield from super().read_records(stream_slice={"key": issue["key"]}, **kwargs)
-
 
-class IssueWorklogs(StartDateJiraStream):
+class IssueWorklogs(IssueSubStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-worklogs/#api-rest-api-3-issue-issueidorkey-worklog-get
     """
@@ -668,17 +676,6 @@ class IssueWorklogs(StartDateJiraStream):
         key = stream_slice["key"]
         return f"issue/{key}/worklog"
 
-    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        issues_stream = Issues(
-            additional_fields=[],
-            authenticator=self.authenticator,
-            domain=self._domain,
-            projects=self._projects,
-            start_date=self._start_date,
-        )
-        for issue in issues_stream.read_records(sync_mode=SyncMode.full_refresh):
-            yield from super().read_records(stream_slice={"key": issue["key"]}, **kwargs)
-
 
 class JiraSettings(JiraStream):
     """
@@ -764,7 +761,9 @@ class ProjectAvatars(JiraStream):
             yield from records
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        projects_stream = Projects(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        projects_stream = Projects(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for project in projects_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"key": project["key"]}, **kwargs)
 
@@ -790,7 +789,9 @@ class ProjectComponents(JiraStream):
         return f"project/{key}/component"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        projects_stream = Projects(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        projects_stream = Projects(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for project in projects_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"key": project["key"]}, **kwargs)
 
@@ -807,7 +808,9 @@ class ProjectEmail(JiraStream):
         return f"project/{project_id}/email"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        projects_stream = Projects(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        projects_stream = Projects(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for project in projects_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"project_id": project["id"]}, **kwargs)
 
@@ -824,7 +827,9 @@ class ProjectPermissionSchemes(JiraStream):
         return f"project/{key}/securitylevel"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        projects_stream = Projects(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        projects_stream = Projects(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for project in projects_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"key": project["key"]}, **kwargs)
 
@@ -852,7 +857,9 @@ class ProjectVersions(JiraStream):
         return f"project/{key}/version"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        projects_stream = Projects(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        projects_stream = Projects(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for project in projects_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from super().read_records(stream_slice={"key": project["key"]}, **kwargs)
 
@@ -882,7 +889,9 @@ class ScreenTabs(JiraStream):
         return f"screens/{screen_id}/tabs"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        screens_stream = Screens(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        screens_stream = Screens(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for screen in screens_stream.read_records(sync_mode=SyncMode.full_refresh):
             yield from self.read_tab_records(stream_slice={"screen_id": screen["id"]}, **kwargs)
 
@@ -902,8 +911,12 @@ class ScreenTabFields(JiraStream):
         return f"screens/{screen_id}/tabs/{tab_id}/fields"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        screens_stream = Screens(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
-        screen_tabs_stream = ScreenTabs(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        screens_stream = Screens(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
+        screen_tabs_stream = ScreenTabs(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for screen in screens_stream.read_records(sync_mode=SyncMode.full_refresh):
             for tab in screen_tabs_stream.read_tab_records(stream_slice={"screen_id": screen["id"]}, **kwargs):
                 if id in tab:  # Check for proper tab record since the ScreenTabs stream doesn't throw http errors
@@ -934,7 +947,9 @@ class Sprints(V1ApiJiraStream):
         return f"board/{board_id}/sprint"
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        boards_stream = Boards(authenticator=self.authenticator, domain=self._domain, projects=self._projects)
+        boards_stream = Boards(
+            authenticator=self.authenticator, domain=self._domain, projects=self._projects, rate_limiter=self.rate_limiter
+        )
         for board in boards_stream.read_records(sync_mode=SyncMode.full_refresh):
             if board["type"] == "scrum":
                 yield from super().read_records(stream_slice={"board_id": board["id"]}, **kwargs)
@@ -967,7 +982,12 @@ class SprintIssues(V1ApiJiraStream, IncrementalJiraStream):
         return params
 
     def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-        stream_args = {"authenticator": self.authenticator, "domain": self._domain, "projects": self._projects}
+        stream_args = {
+            "authenticator": self.authenticator,
+            "domain": self._domain,
+            "projects": self._projects,
+            "rate_limiter": self.rate_limiter,
+        }
         field_ids_by_name = IssueFields(**stream_args).field_ids_by_name()
         fields = ["key", "status", "updated"]
         for name in ["Story Points", "Story point estimate"]:
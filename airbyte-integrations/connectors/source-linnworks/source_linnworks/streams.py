@@ -3,18 +3,15 @@
 #
 
 import json
-import os
 from abc import ABC, abstractmethod
 from typing import Any, Iterable, Mapping, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
 import pendulum
 import requests
-import vcr
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.streams.http.auth.core import HttpAuthenticator
 from requests.auth import AuthBase
-from vcr.cassette import Cassette
 
 
 class LinnworksStream(HttpStream, ABC):
@@ -226,19 +223,6 @@ class ProcessedOrders(LinnworksGenericPagedResult, IncrementalLinnworksStream):
         for record in self.paged_result(response)["Data"]:
             yield record
 
-    def request_cache(self) -> Cassette:
-        try:
-            os.remove(self.cache_filename)
-        except FileNotFoundError:
-            pass
-
-        return vcr.use_cassette(
-            self.cache_filename,
-            record_mode="new_episodes",
-            serializer="yaml",
-            match_on=["method", "scheme", "host", "port", "path", "query", "body"],
-        )
-
 
 class ProcessedOrderDetails(HttpSubStream, LinnworksStream):
     # https://apps.linnworks.net/Api/Method/Orders-GetOrdersById
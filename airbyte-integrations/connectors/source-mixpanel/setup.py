@@ -6,7 +6,8 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
-    "airbyte-cdk~=0.1",
+    "airbyte-cdk~=0.1.50",
+    "orjson~=3.6",
 ]
 
 TEST_REQUIREMENTS = [
@@ -4,22 +4,32 @@
 
 
 import base64
-import json
-import time
 from abc import ABC
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
+import orjson
 import pendulum
 import requests
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
-from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http import HttpStream, RateLimiter
 from airbyte_cdk.sources.streams.http.auth import HttpAuthenticator, TokenAuthenticator
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.utils.concurrency import interleave
+
+
+def hourly_rate_limiter(reqs_per_hour_limit: int) -> RateLimiter:
+    """
+    Rate limiter allowing bursts of a tenth of reqs_per_hour_limit requests, refilled slowly enough that
+    no period of one hour sees more than reqs_per_hour_limit requests.
+    """
+    burst = max(1, reqs_per_hour_limit // 10)
+    return RateLimiter(calls=burst, period=3600 * burst / max(1, reqs_per_hour_limit - burst))
 
 
 class MixpanelStream(HttpStream, ABC):
@@ -28,7 +38,8 @@ class MixpanelStream(HttpStream, ABC):
       A maximum of 5 concurrent queries
       400 queries per hour.
 
-    API Rate Limit Handler: after each request freeze for the time period: 3600/reqs_per_hour_limit seconds
+    API Rate Limit Handler: requests wait for the rate limiter of the stream, see hourly_rate_limiter.
+    Pass the same rate_limiter to the streams of the same API to share their budget.
     """
 
     @property
@@ -48,6 +59,7 @@ class MixpanelStream(HttpStream, ABC):
         date_window_size: int = 30,  # in days
         attribution_window: int = 0,  # in days
         select_properties_by_default: bool = True,
+        rate_limiter: RateLimiter = None,
         **kwargs,
     ):
         self.start_date = start_date
@@ -57,7 +69,10 @@ class MixpanelStream(HttpStream, ABC):
         self.additional_properties = select_properties_by_default
         self.region = region if region else "US"
 
-        super().__init__(authenticator=authenticator)
+        if rate_limiter is None and self.reqs_per_hour_limit > 0:
+            # we skip the limit if self.reqs_per_hour_limit = 0
+            rate_limiter = hourly_rate_limiter(self.reqs_per_hour_limit)
+        super().__init__(authenticator=authenticator, rate_limiter=rate_limiter)
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """Define abstract method"""
@@ -94,16 +109,11 @@ class MixpanelStream(HttpStream, ABC):
         # parse the whole response
         yield from self.process_response(response, **kwargs)
 
-        if self.reqs_per_hour_limit > 0:
-            # we skip this block, if self.reqs_per_hour_limit = 0,
-            # in all other cases wait for X seconds to match API limitations
-            time.sleep(3600 / self.reqs_per_hour_limit)
-
     def get_stream_params(self) -> Mapping[str, Any]:
         """
-        Fetch required parameters in a given stream. Used to create sub-streams
+        Fetch required parameters in a given stream. Used to create sub-streams, which share the rate limiter of the stream
         """
-        return {"authenticator": self.authenticator, "region": self.region}
+        return {"authenticator": self.authenticator, "region": self.region, "rate_limiter": self.rate_limiter}
 
 
 class IncrementalMixpanelStream(MixpanelStream, ABC):
@@ -518,7 +528,8 @@ class Engage(MixpanelStream):
         }
 
         # read existing Engage schema from API
-        schema_properties = EngageSchema(**self.get_stream_params()).read_records(sync_mode=SyncMode.full_refresh)
+        # the schema is read without a rate limit, see EngageSchema
+        schema_properties = EngageSchema(**{**self.get_stream_params(), "rate_limiter": None}).read_records(sync_mode=SyncMode.full_refresh)
         for property_entry in schema_properties:
             property_name: str = property_entry["name"]
             property_type: str = property_entry["type"]
@@ -689,11 +700,20 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     Raw Export API Rate Limit (https://help.mixpanel.com/hc/en-us/articles/115004602563-Rate-Limits-for-API-Endpoints):
      A maximum of 100 concurrent queries,
      3 queries per second and 60 queries per hour.
+
+    The export of a date window is streamed: it is downloaded and parsed line by line on a worker thread,
+    while the records parsed so far are emitted.
     """
 
     primary_key: str = None
     cursor_field: str = "time"
-    reqs_per_hour_limit: str = 60  # 1 query per minute
+    reqs_per_hour_limit: int = 60  # 1 query per minute
+
+    # Size of the chunks the export is downloaded in
+    download_chunk_size: int = 1024 * 1024
+    # Records are handed over from the worker thread in batches, at most max_buffered_batches of them wait to be emitted
+    records_batch_size: int = 1000
+    max_buffered_batches: int = 10
 
     @property
     def url_base(self):
@@ -703,6 +723,55 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     def path(self, **kwargs) -> str:
         return "export"
 
+    def request_kwargs(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        return {"stream": True}
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        records = super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state)
+        batches = interleave([partial(self._batches, records)], max_workers=1, buffer_size=self.max_buffered_batches)
+        for batch in batches:
+            yield from batch
+
+    def _batches(self, records: Iterable[Mapping[str, Any]]) -> Iterator[List[Mapping[str, Any]]]:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.records_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def transform_record(record: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Flattens the properties of the record into the item, in a single pass over them
+        """
+        item = {"event": record["event"]}
+        for property_name, value in record["properties"].items():
+            if property_name.startswith("$"):
+                # Just remove leading '$' for 'reserved' mixpanel properties name, example:
+                # from API: '$browser'
+                # to stream: 'browser'
+                property_name = property_name[1:]
+            # Convert all values to string (this is default property type)
+            # because API does not provide properties type information
+            item[property_name] = str(value)
+
+        # convert timestamp to datetime string
+        if item.get("time") and item["time"].isdigit():
+            item["time"] = datetime.fromtimestamp(int(item["time"])).isoformat()
+
+        return item
+
     def process_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         """Export API return response.text in JSONL format but each line is a valid JSON object
         Raw item example:
@@ -722,32 +791,19 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
                 }
             }
         """
-        if response.text == "terminated early\n":
-            # no data available
-            self.logger.warn(f"Couldn't fetch data from Export API. Response: {response.text}")
-            return []
-
-        for record_line in response.text.splitlines():
-            record = json.loads(record_line)
-            # transform record into flat dict structure
-            item = {"event": record["event"]}
-            properties = record["properties"]
-            for property_name in properties:
-                this_property_name = property_name
-                if property_name.startswith("$"):
-                    # Just remove leading '$' for 'reserved' mixpanel properties name, example:
-                    # from API: '$browser'
-                    # to stream: 'browser'
-                    this_property_name = this_property_name[1:]
-                # Convert all values to string (this is default property type)
-                # because API does not provide properties type information
-                item[this_property_name] = str(properties[property_name])
-
-            # convert timestamp to datetime string
-            if item.get("time") and item["time"].isdigit():
-                item["time"] = datetime.fromtimestamp(int(item["time"])).isoformat()
-
-            yield item
+        try:
+            for record_line in response.iter_lines(chunk_size=self.download_chunk_size):
+                if not record_line:
+                    continue
+                if record_line == b"terminated early":
+                    # no data available
+                    self.logger.warn(f"Couldn't fetch data from Export API. Response: {record_line.decode()}")
+                    return
+                # transform record into flat dict structure
+                yield self.transform_record(orjson.loads(record_line))
+        finally:
+            # the connection is only released once the body was read entirely, or when the response is closed
+            response.close()
 
     def get_json_schema(self) -> Mapping[str, Any]:
         """
@@ -765,7 +821,8 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
         schema["additionalProperties"] = self.additional_properties
 
         # read existing Export schema from API
-        schema_properties = ExportSchema(**self.get_stream_params()).read_records(sync_mode=SyncMode.full_refresh)
+        # the schema is read without a rate limit, see ExportSchema
+        schema_properties = ExportSchema(**{**self.get_stream_params(), "rate_limiter": None}).read_records(sync_mode=SyncMode.full_refresh)
         for property_entry in schema_properties:
             property_name: str = property_entry
             if property_name.startswith("$"):
@@ -840,12 +897,14 @@ class SourceMixpanel(AbstractSource):
         AirbyteLogger().log("INFO", f"Using start_date: {config['start_date']}, end_date: {config['end_date']}")
 
         auth = TokenAuthenticatorBase64(token=config["api_secret"])
+        # The Export API has its own limit, all other streams share the limit of the query API
+        rate_limiter = hourly_rate_limiter(MixpanelStream.reqs_per_hour_limit)
         return [
-            Annotations(authenticator=auth, **config),
-            Cohorts(authenticator=auth, **config),
-            CohortMembers(authenticator=auth, **config),
-            Engage(authenticator=auth, **config),
+            Annotations(authenticator=auth, rate_limiter=rate_limiter, **config),
+            Cohorts(authenticator=auth, rate_limiter=rate_limiter, **config),
+            CohortMembers(authenticator=auth, rate_limiter=rate_limiter, **config),
+            Engage(authenticator=auth, rate_limiter=rate_limiter, **config),
             Export(authenticator=auth, **config),
-            Funnels(authenticator=auth, **config),
-            Revenue(authenticator=auth, **config),
+            Funnels(authenticator=auth, rate_limiter=rate_limiter, **config),
+            Revenue(authenticator=auth, rate_limiter=rate_limiter, **config),
         ]
@@ -2,10 +2,12 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from datetime import date, timedelta
 
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http.auth import NoAuth
-from source_mixpanel.source import Annotations
+from source_mixpanel.source import Annotations, CohortMembers, Cohorts, Export, hourly_rate_limiter
 
 
 def test_date_slices():
@@ -92,3 +94,60 @@ def test_date_slices():
         date_window_size=1,
     ).stream_slices(sync_mode="any", stream_state={"date": "2021-07-02"})
     assert [{"start_date": "2021-07-02", "end_date": "2021-07-02"}, {"start_date": "2021-07-03", "end_date": "2021-07-03"}] == stream_slices
+
+
+def export_stream(**kwargs):
+    return Export(authenticator=NoAuth(), start_date=date(2021, 6, 16), end_date=date(2021, 6, 16), **kwargs)
+
+
+def test_export_streams_records(requests_mock):
+    stream = export_stream()
+    stream.records_batch_size = 2
+    lines = [
+        json.dumps({"event": "Viewed Page", "properties": {"time": 1623860880 + i, "$browser": "Chrome", "noninteraction": True}})
+        for i in range(5)
+    ]
+    requests_mock.get(f"{stream.url_base}export", text="\n".join(lines) + "\n")
+    stream_slice = stream.stream_slices(sync_mode=SyncMode.incremental)[0]
+
+    records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))
+
+    assert requests_mock.last_request.qs["from_date"] == ["2021-06-16"]
+    assert len(records) == 5
+    assert records[0].keys() == {"event", "time", "browser", "noninteraction"}
+    assert records[0]["browser"] == "Chrome"
+    assert records[0]["noninteraction"] == "True"
+    assert [record["time"][-2:] for record in records] == ["00", "01", "02", "03", "04"]
+
+
+def test_export_terminated_early(requests_mock):
+    stream = export_stream()
+    requests_mock.get(f"{stream.url_base}export", text="terminated early\n")
+    stream_slice = stream.stream_slices(sync_mode=SyncMode.incremental)[0]
+
+    assert list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice)) == []
+
+
+def test_hourly_rate_limiter():
+    rate_limiter = hourly_rate_limiter(60)
+    # a burst of a tenth of the limit, then the rest of the hour is shared by the remaining requests
+    assert rate_limiter.calls == 6
+    assert rate_limiter.calls + 3600 * rate_limiter.calls / rate_limiter.period == 60
+
+    rate_limiter = hourly_rate_limiter(5)
+    assert rate_limiter.calls == 1
+    assert rate_limiter.period == 900
+
+
+def test_streams_rate_limiter():
+    stream = Annotations(authenticator=NoAuth(), start_date=date(2021, 6, 16), end_date=date(2021, 6, 16))
+    assert stream.rate_limiter is not None
+    assert export_stream().rate_limiter is not stream.rate_limiter
+
+    rate_limiter = hourly_rate_limiter(400)
+    stream = Annotations(authenticator=NoAuth(), start_date=date(2021, 6, 16), end_date=date(2021, 6, 16), rate_limiter=rate_limiter)
+    assert stream.rate_limiter is rate_limiter
+
+    # helper streams, e.g: the cohorts read by CohortMembers, share the limiter of the stream
+    stream = CohortMembers(authenticator=NoAuth(), rate_limiter=rate_limiter)
+    assert Cohorts(**stream.get_stream_params()).rate_limiter is rate_limiter
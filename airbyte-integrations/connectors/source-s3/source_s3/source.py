@@ -39,6 +39,12 @@ class SourceS3Spec(SourceFilesAbstractSpec, BaseModel):
         endpoint: str = Field("", description="Endpoint to an S3 compatible service. Leave empty to use AWS.")
         use_ssl: bool = Field(default=None, description="Is remote server using secure SSL/TLS connection")
         verify_ssl_cert: bool = Field(default=None, description="Allow self signed certificates")
+        max_concurrent_listings: int = Field(
+            default=1,
+            ge=1,
+            le=64,
+            description="Number of list requests sent at the same time. Above 1, the objects under each folder directly under the path prefix are listed concurrently, which speeds up discovering the files of buckets holding a lot of objects.",
+        )
 
     provider: S3Provider
 
@@ -0,0 +1,124 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Mapping, Set
+
+# How long a worker blocked on a full buffer waits before checking whether the read-ahead was closed
+PUT_TIMEOUT_SECONDS = 0.1
+
+
+class _Done:
+    """Put in the buffer of a file once all its records were read"""
+
+
+class _Failed:
+    """Wraps an exception raised while reading a file so it is re-raised to the consumer of its records"""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+class FileReadAhead:
+    """
+    Downloads and parses files on a pool of max_workers threads while the records of earlier files are consumed.
+
+    Files are read in the order they are submitted and the records of each file are consumed in that same order, see records().
+    Every file buffers at most max_buffered_batches batches of batch_size records, its worker blocks once the buffer is full.
+    The caller should keep about max_workers files submitted ahead of the file being consumed (see pending), so memory is
+    bounded to roughly (max_workers + 1) * max_buffered_batches * batch_size records.
+    """
+
+    def __init__(
+        self,
+        read_file: Callable[[Mapping[str, Any]], Iterable[Mapping[str, Any]]],
+        max_workers: int,
+        batch_size: int = 1000,
+        max_buffered_batches: int = 10,
+    ):
+        """
+        :param read_file: yields the records of a file, given its file_info from a stream slice, called from the worker threads
+        :param max_workers: number of files read at the same time
+        :param batch_size: number of records handed over from a worker at once
+        :param max_buffered_batches: number of batches of a file waiting to be consumed before its worker blocks
+        """
+        self._read_file = read_file
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_buffered_batches = max_buffered_batches
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._stop = threading.Event()
+        # unique_url -> buffer of each submitted file which was not consumed yet, in submission order
+        self._buffers: "OrderedDict[str, queue.Queue]" = OrderedDict()
+        self._submitted: Set[str] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted files whose records were not consumed yet"""
+        return len(self._buffers)
+
+    def submit(self, file_info: Mapping[str, Any]) -> bool:
+        """
+        Schedules the file to be read once a worker is free, files are started in the order they are submitted.
+        :return: False if the file was already submitted
+        """
+        url = file_info["unique_url"]
+        if url in self._submitted:
+            return False
+        self._submitted.add(url)
+        buffer = queue.Queue(maxsize=self.max_buffered_batches)
+        self._buffers[url] = buffer
+        self._executor.submit(self._produce, file_info, buffer)
+        return True
+
+    def records(self, file_info: Mapping[str, Any]) -> Iterator[Mapping[str, Any]]:
+        """
+        Yields the records of the file as they are read, submitting it first if needed.
+        :raises: the exception raised while reading the file
+        """
+        self.submit(file_info)
+        buffer = self._buffers[file_info["unique_url"]]
+        while True:
+            item = buffer.get()
+            if isinstance(item, _Done):
+                break
+            if isinstance(item, _Failed):
+                raise item.exception
+            yield from item
+        del self._buffers[file_info["unique_url"]]
+
+    def close(self):
+        """Stops the workers, records of files which were not consumed are dropped"""
+        self._stop.set()
+        self._executor.shutdown(wait=True)
+
+    def _produce(self, file_info: Mapping[str, Any], buffer: queue.Queue):
+        if self._stop.is_set():
+            return
+        try:
+            batch = []
+            for record in self._read_file(file_info):
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    if not self._put(buffer, batch):
+                        return
+                    batch = []
+            if batch and not self._put(buffer, batch):
+                return
+            self._put(buffer, _Done())
+        except Exception as e:
+            self._put(buffer, _Failed(e))
+
+    def _put(self, buffer: queue.Queue, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                buffer.put(item, timeout=PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
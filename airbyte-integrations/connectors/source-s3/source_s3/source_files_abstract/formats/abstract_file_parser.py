@@ -3,7 +3,7 @@
 #
 
 from abc import ABC, abstractmethod
-from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
+from typing import Any, BinaryIO, Iterator, List, Mapping, TextIO, Union
 
 import pyarrow as pa
 from airbyte_cdk.logger import AirbyteLogger
@@ -39,14 +39,26 @@ class AbstractFileParser(ABC):
         """
 
     @abstractmethod
-    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+    def stream_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, List[Any]]]:
         """
-        Override this with format-specifc logic to stream each data row from the file as a mapping of {columns:values}
+        Override this with format-specifc logic to stream the data rows from the file in batches of columns, e.g. from pyarrow RecordBatches
         Note: avoid loading the whole file into memory to avoid OOM breakages
 
+        :param file: file-like object (opened via StorageFile)
+        :yield: batch of data rows as a mapping of {column: [values]}, every column holding one value per row
+        """
+
+    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+        """
+        Streams each data row from the file as a mapping of {columns:values}, built from the batches of stream_batches()
+
         :param file: file-like object (opened via StorageFile)
         :yield: data record as a mapping of {columns:values}
         """
+        for batch in self.stream_batches(file):
+            columns = list(batch.keys())
+            for record_values in zip(*batch.values()):
+                yield dict(zip(columns, record_values))
 
     @staticmethod
     def json_type_to_pyarrow_type(typ: str, reverse: bool = False, logger: AirbyteLogger = AirbyteLogger()) -> str:
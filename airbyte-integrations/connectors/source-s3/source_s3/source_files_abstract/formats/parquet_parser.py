@@ -101,7 +101,7 @@ class ParquetParser(AbstractFileParser):
             raise OSError("empty Parquet file")
         return schema_dict
 
-    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+    def stream_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, List[Any]]]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html
         PyArrow reads streaming batches from a Parquet file
@@ -125,13 +125,10 @@ class ParquetParser(AbstractFileParser):
             for batch in reader.iter_batches(**args):
                 # this gives us a dist of lists where each nested list holds ordered values for a single column
                 # {'number': [1.0, 2.0, 3.0], 'name': ['foo', None, 'bar'], 'flag': [True, False, True], 'delta': [-1.0, 2.5, 0.1]}
-                batch_columns = [col.name for col in batch.schema]
                 batch_dict = batch.to_pydict()
-                columnwise_record_values = [batch_dict[column] for column in batch_columns]
-
-                # we zip this to get row-by-row
-                for record_values in zip(*columnwise_record_values):
-                    yield {
-                        batch_columns[i]: self.convert_field_data(logical_types[batch_columns[i]], record_values[i])
-                        for i in range(len(batch_columns))
-                    }
+                # only columns of types without a JSON representation are converted, one column at a time
+                for column, values in batch_dict.items():
+                    logical_type = logical_types[column]
+                    if PARQUET_TYPES[logical_type][2]:
+                        batch_dict[column] = [self.convert_field_data(logical_type, value) for value in values]
+                yield batch_dict
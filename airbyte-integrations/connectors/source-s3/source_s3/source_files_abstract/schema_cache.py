@@ -0,0 +1,92 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import os
+import tempfile
+from typing import Any, Iterable, Mapping, MutableMapping, Optional
+
+from airbyte_cdk.logger import AirbyteLogger
+
+LOGGER = AirbyteLogger()
+
+
+class SchemaInferenceCache:
+    """
+    Schemas inferred from files, optionally persisted to a JSON file so the schema of a file is only inferred again once the file changed.
+    The file only outlives the sync if it is on a volume kept between syncs, without a path the cache is kept in memory only.
+
+    Entries are keyed by the url of the file and hold a fingerprint of the version of the file they were inferred from,
+    e.g. its ETag, size and last modified date. The cache also holds a scope, e.g. a hash of the provider and format settings,
+    all entries are dropped if it changed since the schema inferred from a file depends on them.
+    """
+
+    def __init__(self, path: Optional[str], scope: str):
+        """
+        :param path: JSON file holding the cache, created on save() if it does not exist, None to keep the cache in memory
+        :param scope: entries stored under a different scope are ignored
+        """
+        self.path = path
+        self.scope = scope
+        self._entries: MutableMapping[str, Mapping[str, Any]] = {}
+        self._changed = False
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                content = json.load(f)
+        except (OSError, ValueError) as e:
+            LOGGER.warn(f"Ignoring unreadable schema cache {self.path}: {e}")
+            return
+        if content.get("scope") == self.scope:
+            self._entries = content.get("files", {})
+
+    def get(self, url: str, fingerprint: str) -> Optional[Mapping[str, Any]]:
+        """
+        :return: the schema inferred from the file, None if it was not inferred yet or the file changed since
+        """
+        entry = self._entries.get(url)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return entry["schema"]
+
+    def set(self, url: str, fingerprint: str, schema: Mapping[str, Any]):
+        self._entries[url] = {"fingerprint": fingerprint, "schema": schema}
+        self._changed = True
+
+    def prune(self, urls: Iterable[str]):
+        """Drops the entries of the files which are not in urls, e.g: files deleted since their schema was inferred"""
+        urls = set(urls)
+        for url in [url for url in self._entries if url not in urls]:
+            del self._entries[url]
+            self._changed = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self):
+        """
+        Writes the cache if it changed, through a temporary file so a failed write never leaves a truncated cache behind
+        """
+        if not self.path or not self._changed:
+            return
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"scope": self.scope, "files": self._entries}, f)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
+            LOGGER.warn(f"Could not save schema cache {self.path}: {e}")
+            return
+        self._changed = False
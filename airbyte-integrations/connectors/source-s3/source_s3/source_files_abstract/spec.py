@@ -5,7 +5,7 @@
 
 import json
 import re
-from typing import Union
+from typing import Optional, Union
 
 from jsonschema import RefResolver
 from pydantic import BaseModel, Field
@@ -62,6 +62,19 @@ class SourceFilesAbstractSpec(BaseModel):
 
     format: Union[CsvFormat, ParquetFormat] = Field(default=CsvFormat.Config.title)
 
+    max_concurrent_files: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Number of files downloaded and parsed at the same time. Records are still output in the order of the files' last modified dates. Increase this to speed up syncs of many small files.",
+    )
+
+    schema_cache_path: Optional[str] = Field(
+        default=None,
+        description="Optional directory in which the schema inferred from each file is kept, so only new or changed files are downloaded to infer the schema. Each sync runs in a new container: the directory must be on a volume kept between syncs, e.g. a folder under /local. Leave empty to infer the schema from every file on each sync.",
+        examples=["/local/s3_schema_cache"],
+    )
+
     @staticmethod
     def change_format_to_oneOf(schema: dict) -> dict:
         props_to_change = ["format"]
@@ -4,11 +4,14 @@
 
 
 import concurrent
+import hashlib
 import json
+import os
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime
-from functools import lru_cache
+from functools import lru_cache, partial
+from itertools import chain, repeat
 from operator import itemgetter
 from traceback import format_exc
 from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
@@ -18,8 +21,10 @@ from airbyte_cdk.models.airbyte_protocol import SyncMode
 from airbyte_cdk.sources.streams import Stream
 from wcmatch.glob import GLOBSTAR, SPLIT, globmatch
 
+from .file_read_ahead import FileReadAhead
 from .formats.csv_parser import CsvParser
 from .formats.parquet_parser import ParquetParser
+from .schema_cache import SchemaInferenceCache
 
 JSON_TYPES = ["string", "number", "integer", "object", "array", "boolean", "null"]
 
@@ -46,13 +51,24 @@ class FileStream(Stream, ABC):
     airbyte_columns = [ab_additional_col, ab_last_mod_col, ab_file_name_col]
     datetime_format_string = "%Y-%m-%dT%H:%M:%S%z"
 
-    def __init__(self, dataset: str, provider: dict, format: dict, path_pattern: str, schema: str = None):
+    def __init__(
+        self,
+        dataset: str,
+        provider: dict,
+        format: dict,
+        path_pattern: str,
+        schema: str = None,
+        max_concurrent_files: int = 1,
+        schema_cache_path: str = None,
+    ):
         """
         :param dataset: table name for this stream
         :param provider: provider specific mapping as described in spec.json
         :param format: file format specific mapping as described in spec.json
         :param path_pattern: glob-style pattern for file-matching (https://facelessuser.github.io/wcmatch/glob/)
         :param schema: JSON-syntax user provided schema, defaults to None
+        :param max_concurrent_files: number of files downloaded and parsed at the same time, defaults to 1
+        :param schema_cache_path: directory kept between syncs to cache the schema inferred from each file in, defaults to None
         """
         self.dataset = dataset
         self._path_pattern = path_pattern
@@ -62,6 +78,11 @@ class FileStream(Stream, ABC):
         if schema:
             self._schema = self._parse_user_input_schema(schema)
         self.master_schema = None
+        self._max_concurrent_files = max_concurrent_files or 1
+        self._schema_cache_path = schema_cache_path
+        self._file_read_ahead: Optional[FileReadAhead] = None
+        # filepath -> metadata of the file provided by file_metadata_iterator(), see get_time_ordered_filepaths()
+        self._file_metadata: MutableMapping[str, Mapping[str, Any]] = {}
         LOGGER.info(f"initialised stream with format: {format}")
 
     @staticmethod
@@ -132,6 +153,17 @@ class FileStream(Stream, ABC):
         :yield: url filepath to use in StorageFile()
         """
 
+    def file_metadata_iterator(self) -> Iterator[Tuple[str, Optional[Mapping[str, Any]]]]:
+        """
+        Override this if listing the files already provides their metadata, e.g. the last modified date of each object listed by S3,
+        which saves getting last_modified from a StorageFile for every file.
+
+        :yield: tuples of (filepath, metadata), where metadata holds "last_modified" and optionally "size" and "etag",
+            or None if last_modified should be requested from the StorageFile
+        """
+        for filepath in self.filepath_iterator():
+            yield filepath, None
+
     def pattern_matched_filepath_iterator(self, filepaths: Iterable[str]) -> Iterator[str]:
         """
         iterates through iterable filepaths and yields only those filepaths that match user-provided path patterns
@@ -147,7 +179,8 @@ class FileStream(Stream, ABC):
     def get_time_ordered_filepaths(self) -> Iterable[Tuple[datetime, str]]:
         """
         Iterates through pattern_matched_filepath_iterator(), acquiring last_modified property of each file to return in time ascending order.
-        Uses concurrent.futures to thread this asynchronously in order to improve performance when there are many files (network I/O)
+        last_modified comes from file_metadata_iterator() when the listing provides it, otherwise it is requested from each StorageFile,
+        using concurrent.futures to thread this asynchronously in order to improve performance when there are many files (network I/O)
         Caches results after first run of method to avoid repeating network calls as this is used more than once
 
         :return: list in time-ascending order
@@ -158,17 +191,25 @@ class FileStream(Stream, ABC):
             return (fc.last_modified, filepath)
 
         storagefiles = []
-        # use concurrent future threads to parallelise grabbing last_modified from all the files
-        # TODO: don't hardcode max_workers like this
-        with concurrent.futures.ThreadPoolExecutor(max_workers=64) as executor:
-
-            filepath_gen = self.pattern_matched_filepath_iterator(self.filepath_iterator())
-
-            futures = [executor.submit(get_storagefile_with_lastmod, fp) for fp in filepath_gen]
-
-            for future in concurrent.futures.as_completed(futures):
-                # this will failfast on any errors
-                storagefiles.append(future.result())
+        filepaths_without_metadata = []
+        listed_files = dict(self.file_metadata_iterator())
+        for filepath in self.pattern_matched_filepath_iterator(listed_files):
+            metadata = listed_files[filepath]
+            if metadata is None:
+                filepaths_without_metadata.append(filepath)
+            else:
+                self._file_metadata[filepath] = metadata
+                storagefiles.append((metadata["last_modified"], filepath))
+
+        if filepaths_without_metadata:
+            # use concurrent future threads to parallelise grabbing last_modified from all the files
+            # TODO: don't hardcode max_workers like this
+            with concurrent.futures.ThreadPoolExecutor(max_workers=64) as executor:
+                futures = [executor.submit(get_storagefile_with_lastmod, fp) for fp in filepaths_without_metadata]
+
+                for future in concurrent.futures.as_completed(futures):
+                    # this will failfast on any errors
+                    storagefiles.append(future.result())
 
         # The array storagefiles contain tuples of (last_modified, filepath), so sort by last_modified
         return sorted(storagefiles, key=itemgetter(0))
@@ -198,6 +239,41 @@ class FileStream(Stream, ABC):
         properties[self.ab_last_mod_col]["format"] = "date-time"
         return {"type": "object", "properties": properties}
 
+    @property
+    def schema_cache_filename(self) -> Optional[str]:
+        """
+        JSON file caching the schema inferred from each file between syncs, see SchemaInferenceCache.
+        None unless schema_cache_path is configured: every sync runs in a new container, so the file must be on a volume kept between syncs.
+        The name holds a hash of the settings, so streams of different connections sharing the directory use their own file.
+        """
+        if not self._schema_cache_path:
+            return None
+        return os.path.join(self._schema_cache_path, f"{self.name}_{self._schema_cache_scope()[:16]}_schema_cache.json")
+
+    def _schema_cache_scope(self) -> str:
+        """
+        :return: hash of the settings the inferred schemas depend on, cached schemas are dropped when they change
+        """
+        settings = json.dumps([self._provider, self._format, self._path_pattern], sort_keys=True, default=str)
+        return hashlib.sha256(settings.encode("utf-8")).hexdigest()
+
+    def _file_fingerprint(self, last_modified: datetime, filepath: str) -> str:
+        """
+        :return: identifies the version of a file, a file whose fingerprint changed has its schema inferred again
+        """
+        metadata = self._file_metadata.get(filepath, {})
+        return "|".join([last_modified.isoformat(), str(metadata.get("size", "")), str(metadata.get("etag", ""))])
+
+    def _get_inferred_schema(self, file_reader, schema_cache: SchemaInferenceCache, last_mod: datetime, filepath: str) -> Mapping[str, Any]:
+        fingerprint = self._file_fingerprint(last_mod, filepath)
+        schema = schema_cache.get(filepath, fingerprint)
+        if schema is None:
+            storagefile = self.storagefile_class(filepath, self._provider)
+            with storagefile.open(file_reader.is_binary) as f:
+                schema = file_reader.get_inferred_schema(f)
+            schema_cache.set(filepath, fingerprint, schema)
+        return schema
+
     def _get_master_schema(self, min_datetime: datetime = None) -> Mapping[str, Any]:
         """
         In order to auto-infer a schema across many files and/or allow for additional properties (columns),
@@ -206,6 +282,8 @@ class FileStream(Stream, ABC):
             to build up this superset schema (master_schema).
         This runs datatype checks to Warn or Error if we find incompatible schemas (e.g. same column is 'date' in one file but 'float' in another).
         This caches the master_schema after first run in order to avoid repeated compute and network calls to infer schema on all files.
+        If schema_cache_path is configured, the schema inferred from each file is also cached between syncs in schema_cache_filename,
+            so only new or changed files are opened.
 
         :param min_datetime: if passed, will only use files with last_modified >= this to determine master schema
 
@@ -218,52 +296,66 @@ class FileStream(Stream, ABC):
             master_schema = deepcopy(self._schema)
 
             file_reader = self.fileformatparser_class(self._format)
-
-            for last_mod, filepath in self.get_time_ordered_filepaths():
-                # skip this file if it's earlier than min_datetime
-                if (min_datetime is not None) and (last_mod < min_datetime):
-                    continue
-
-                storagefile = self.storagefile_class(filepath, self._provider)
-                with storagefile.open(file_reader.is_binary) as f:
-                    this_schema = file_reader.get_inferred_schema(f)
-
-                if this_schema == master_schema:
-                    continue  # exact schema match so go to next file
-
-                # creates a superset of columns retaining order of master_schema with any additional columns added to end
-                column_superset = list(master_schema.keys()) + [c for c in this_schema.keys() if c not in master_schema.keys()]
-                # this compares datatype of every column that the two schemas have in common
-                for col in column_superset:
-                    if (col in master_schema.keys()) and (col in this_schema.keys()) and (master_schema[col] != this_schema[col]):
-                        # if this column exists in a provided schema or schema state, we'll WARN here rather than throw an error
-                        # this is to allow more leniency as we may be able to coerce this datatype mismatch on read according to provided schema state
-                        # if not, then the read will error anyway
-                        if col in self._schema.keys():
-                            LOGGER.warn(
-                                f"Detected mismatched datatype on column '{col}', in file '{storagefile.url}'. "
-                                + f"Should be '{master_schema[col]}', but found '{this_schema[col]}'. "
-                                + f"Airbyte will attempt to coerce this to {master_schema[col]} on read."
-                            )
-                        # else we're inferring the schema (or at least this column) from scratch and therefore throw an error on mismatching datatypes
-                        else:
-                            raise RuntimeError(
-                                f"Detected mismatched datatype on column '{col}', in file '{storagefile.url}'. "
-                                + f"Should be '{master_schema[col]}', but found '{this_schema[col]}'."
-                            )
-
-                # missing columns in this_schema doesn't affect our master_schema so we don't check for it here
-
-                # add to master_schema any columns from this_schema that aren't already present
-                for col, datatype in this_schema.items():
-                    if col not in master_schema.keys():
-                        master_schema[col] = datatype
+            schema_cache = SchemaInferenceCache(self.schema_cache_filename, scope=self._schema_cache_scope())
+            try:
+                master_schema = self._merge_inferred_schemas(master_schema, file_reader, schema_cache, min_datetime)
+            finally:
+                schema_cache.save()
 
             LOGGER.info(f"determined master schema: {master_schema}")
             self.master_schema = master_schema
 
         return self.master_schema
 
+    def _merge_inferred_schemas(
+        self, master_schema: MutableMapping[str, Any], file_reader, schema_cache: SchemaInferenceCache, min_datetime: datetime = None
+    ) -> Mapping[str, Any]:
+        """
+        Adds the columns of the schema inferred from each file to master_schema, see _get_master_schema()
+        """
+        time_ordered_filepaths = self.get_time_ordered_filepaths()
+        # files which are no longer listed won't be read again
+        schema_cache.prune(filepath for _, filepath in time_ordered_filepaths)
+        for last_mod, filepath in time_ordered_filepaths:
+            # skip this file if it's earlier than min_datetime
+            if (min_datetime is not None) and (last_mod < min_datetime):
+                continue
+
+            this_schema = self._get_inferred_schema(file_reader, schema_cache, last_mod, filepath)
+
+            if this_schema == master_schema:
+                continue  # exact schema match so go to next file
+
+            # creates a superset of columns retaining order of master_schema with any additional columns added to end
+            column_superset = list(master_schema.keys()) + [c for c in this_schema.keys() if c not in master_schema.keys()]
+            # this compares datatype of every column that the two schemas have in common
+            for col in column_superset:
+                if (col in master_schema.keys()) and (col in this_schema.keys()) and (master_schema[col] != this_schema[col]):
+                    # if this column exists in a provided schema or schema state, we'll WARN here rather than throw an error
+                    # this is to allow more leniency as we may be able to coerce this datatype mismatch on read according to provided schema state
+                    # if not, then the read will error anyway
+                    if col in self._schema.keys():
+                        LOGGER.warn(
+                            f"Detected mismatched datatype on column '{col}', in file '{filepath}'. "
+                            + f"Should be '{master_schema[col]}', but found '{this_schema[col]}'. "
+                            + f"Airbyte will attempt to coerce this to {master_schema[col]} on read."
+                        )
+                    # else we're inferring the schema (or at least this column) from scratch and therefore throw an error on mismatching datatypes
+                    else:
+                        raise RuntimeError(
+                            f"Detected mismatched datatype on column '{col}', in file '{filepath}'. "
+                            + f"Should be '{master_schema[col]}', but found '{this_schema[col]}'."
+                        )
+
+            # missing columns in this_schema doesn't affect our master_schema so we don't check for it here
+
+            # add to master_schema any columns from this_schema that aren't already present
+            for col, datatype in this_schema.items():
+                if col not in master_schema.keys():
+                    master_schema[col] = datatype
+
+        return master_schema
+
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
@@ -275,51 +367,98 @@ class FileStream(Stream, ABC):
         Incremental stream_slices are implemented in the IncrementalFileStream child class.
         """
 
-        # TODO: this could be optimised via concurrent reads, however we'd lose chronology and need to deal with knock-ons of that
-        # we could do this concurrently both full and incremental by running batches in parallel
-        # and then incrementing the cursor per each complete batch
+        # files are read concurrently if max_concurrent_files > 1, see _read_from_slice()
         for last_mod, filepath in self.get_time_ordered_filepaths():
             storagefile = self.storagefile_class(filepath, self._provider)
             yield [{"unique_url": storagefile.url, "last_modified": last_mod, "storagefile": storagefile}]
 
-    def _match_target_schema(self, record: Mapping[str, Any], target_columns: List) -> Mapping[str, Any]:
+    def _records_from_batch(
+        self, batch: Mapping[str, List[Any]], target_columns: List[str], extra_map: Mapping[str, Any]
+    ) -> Iterator[Mapping[str, Any]]:
         """
-        This method handles missing or additional fields in each record, according to the provided target_columns.
-        All missing fields are added, with a value of None (null)
-        All additional fields are packed into the _ab_additional_properties object column
-        We start off with a check to see if we're already lined up to target in order to avoid unnecessary iterations (useful if many columns)
+        Builds the records of a batch of columns, lining them up to target_columns one column at a time rather than record by record.
+        All missing columns are added, with a value of None (null)
+        All additional columns are packed into the _ab_additional_properties object column
+        The columns of extra_map are added with the same value in every record
+
+        :param batch: data rows as a mapping of {column: [values]} (obtained via AbstractFileParser.stream_batches())
+        :param target_columns: list of column names to line the records up to, without the airbyte columns
+        :param extra_map: map of additional columns and values to add
+        :yield: json-like representation of each data row {column:value}
+        """
+        num_rows = len(next(iter(batch.values()), []))
+        target = set(target_columns)
+        additional_columns = [column for column in batch if column not in target]
+
+        column_values = [batch[column] if column in batch else repeat(None, num_rows) for column in target_columns]
+        if additional_columns:
+            column_values.append(dict(zip(additional_columns, values)) for values in zip(*[batch[column] for column in additional_columns]))
+        else:
+            column_values.append({} for _ in range(num_rows))
+        column_values.extend(repeat(value, num_rows) for value in extra_map.values())
 
-        :param record: json-like representation of a data row {column:value}
-        :param target_columns: list of column names to mutate this record into (obtained via self._get_schema_map().keys() as of now)
-        :return: mutated record with columns lining up to target_columns
+        columns = target_columns + [self.ab_additional_col] + list(extra_map.keys())
+        for record_values in zip(*column_values):
+            yield dict(zip(columns, record_values))
+
+    def _read_file(self, file_reader, file_info: Mapping[str, Any]) -> Iterator[Mapping[str, Any]]:
+        """
+        Uses provider-relevant StorageFile to open file and then iterates through stream_batches() using format-relevant AbstractFileParser.
+        Batches are lined up to the desired final schema with _records_from_batch().
         """
-        compare_columns = [c for c in target_columns if c not in [self.ab_last_mod_col, self.ab_file_name_col]]
-        # check if we're already matching to avoid unnecessary iteration
-        if set(list(record.keys()) + [self.ab_additional_col]) == set(compare_columns):
-            record[self.ab_additional_col] = {}
-            return record
-        # missing columns
-        for c in [col for col in compare_columns if col != self.ab_additional_col]:
-            if c not in record.keys():
-                record[c] = None
-        # additional columns
-        record[self.ab_additional_col] = {c: deepcopy(record[c]) for c in record.keys() if c not in compare_columns}
-        for c in record[self.ab_additional_col]:
-            del record[c]
+        # the target columns and metadata values are the same for every record of the file
+        target_columns = [column for column in self._get_schema_map().keys() if column not in self.airbyte_columns]
+        extra_map = {
+            self.ab_last_mod_col: datetime.strftime(file_info["last_modified"], self.datetime_format_string),
+            self.ab_file_name_col: file_info["unique_url"],
+        }
+        with file_info["storagefile"].open(file_reader.is_binary) as f:
+            for batch in file_reader.stream_batches(f):
+                yield from self._records_from_batch(batch, target_columns, extra_map)
 
-        return record
+    @lru_cache(maxsize=None)
+    def _time_ordered_positions(self) -> Mapping[str, int]:
+        """:return: filepath -> its index in get_time_ordered_filepaths()"""
+        return {filepath: index for index, (_, filepath) in enumerate(self.get_time_ordered_filepaths())}
 
-    def _add_extra_fields_from_map(self, record: Mapping[str, Any], extra_map: Mapping[str, Any]) -> Mapping[str, Any]:
+    def _upcoming_files(self, stream_slice: List[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+        """
+        :yield: file_info of the files after the last file of stream_slice in get_time_ordered_filepaths(), i.e. those of the next slices
         """
-        Simple method to take a mapping of columns:values and add them to the provided record
+        time_ordered_filepaths = self.get_time_ordered_filepaths()
+        index = self._time_ordered_positions().get(stream_slice[-1]["unique_url"], len(time_ordered_filepaths))
+        for last_mod, filepath in time_ordered_filepaths[index + 1 :]:
+            storagefile = self.storagefile_class(filepath, self._provider)
+            yield {"unique_url": storagefile.url, "last_modified": last_mod, "storagefile": storagefile}
 
-        :param record: json-like representation of a data row {column:value}
-        :param extra_map: map of additional columns and values to add
-        :return: mutated record with additional fields
+    def _read_ahead_from_slice(self, file_reader, stream_slice: List[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+        """
+        Reads the files of the slice, and up to max_concurrent_files files of the next slices, on worker threads.
+        Records are still yielded file by file in last_modified order, so the cursor never moves past a file which was not read entirely.
         """
-        for key, value in extra_map.items():
-            record[key] = value
-        return record
+        if self._file_read_ahead is None:
+            self._file_read_ahead = FileReadAhead(partial(self._read_file, file_reader), max_workers=self._max_concurrent_files)
+        read_ahead = self._file_read_ahead
+        files_ahead = chain(stream_slice, self._upcoming_files(stream_slice))
+        try:
+            for file_info in stream_slice:
+                # keep max_concurrent_files files being read ahead of the file being consumed
+                while read_ahead.pending <= self._max_concurrent_files:
+                    next_file = next(files_ahead, None)
+                    if next_file is None:
+                        break
+                    read_ahead.submit(next_file)
+                yield from read_ahead.records(file_info)
+        except BaseException:
+            # e.g: the sync failed or stopped reading, stop the workers
+            read_ahead.close()
+            self._file_read_ahead = None
+            raise
+
+        if read_ahead.pending == 0:
+            # there is nothing left to read after this slice
+            read_ahead.close()
+            self._file_read_ahead = None
 
     def _read_from_slice(
         self,
@@ -328,24 +467,15 @@ class FileStream(Stream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
         """
-        Uses provider-relevant StorageFile to open file and then iterates through stream_records() using format-relevant AbstractFileParser.
-        Records are mutated on the fly using _match_target_schema() and _add_extra_fields_from_map() to achieve desired final schema.
+        Reads the records of each file of the slice, see _read_file().
+        If max_concurrent_files > 1, files are downloaded and parsed concurrently, see _read_ahead_from_slice().
         Since this is called per stream_slice, this method works for both full_refresh and incremental.
         """
-        # TODO: read all files in a stream_slice concurrently
-        for file_info in stream_slice:
-            with file_info["storagefile"].open(file_reader.is_binary) as f:
-                # TODO: make this more efficient than mutating every record one-by-one as they stream
-                for record in file_reader.stream_records(f):
-                    schema_matched_record = self._match_target_schema(record, list(self._get_schema_map().keys()))
-                    complete_record = self._add_extra_fields_from_map(
-                        schema_matched_record,
-                        {
-                            self.ab_last_mod_col: datetime.strftime(file_info["last_modified"], self.datetime_format_string),
-                            self.ab_file_name_col: file_info["unique_url"],
-                        },
-                    )
-                    yield complete_record
+        if self._max_concurrent_files > 1 and stream_slice:
+            yield from self._read_ahead_from_slice(file_reader, stream_slice)
+        else:
+            for file_info in stream_slice:
+                yield from self._read_file(file_reader, file_info)
         LOGGER.info("finished reading a stream slice")
         # Always return an empty generator just in case no records were ever yielded
         yield from []
@@ -3,7 +3,8 @@
 #
 
 
-from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Mapping, Optional, Tuple
 
 from boto3 import session as boto3session
 from botocore import UNSIGNED
@@ -19,15 +20,11 @@ class IncrementalFileStreamS3(IncrementalFileStream):
     def storagefile_class(self) -> type:
         return S3File
 
-    def _list_bucket(self, accept_key=lambda k: True) -> Iterator[str]:
+    def _make_client(self):
         """
-        Wrapper for boto3's list_objects_v2 so we can handle pagination, filter by lambda func and operate with or without credentials
-
-        :param accept_key: lambda function to allow filtering return keys, e.g. lambda k: not k.endswith('/'), defaults to lambda k: True
-        :yield: key (name) of each object
+        boto3 clients are thread-safe (unlike sessions and resources), so one client is shared by all listing threads
         """
         provider = self._provider
-
         client_config = None
         if S3File.use_aws_account(provider):
             session = boto3session.Session(
@@ -36,35 +33,89 @@ class IncrementalFileStreamS3(IncrementalFileStream):
         else:
             session = boto3session.Session()
             client_config = Config(signature_version=UNSIGNED)
-        client = make_s3_client(provider, config=client_config, session=session)
+        return make_s3_client(provider, config=client_config, session=session)
+
+    def _list_pages(self, client, prefix: str, delimiter: Optional[str] = None) -> Iterator[Mapping[str, Any]]:
+        """
+        Wrapper for boto3's list_objects_v2 so we can handle pagination
 
+        :yield: each list_objects_v2 response
+        """
+        kwargs = dict(Bucket=self._provider["bucket"], Prefix=prefix)
+        if delimiter:
+            kwargs["Delimiter"] = delimiter
         ctoken = None
         while True:
             # list_objects_v2 doesn't like a None value for ContinuationToken
             # so we don't set it if we don't have one.
             if ctoken:
-                kwargs = dict(Bucket=provider["bucket"], Prefix=provider.get("path_prefix", ""), ContinuationToken=ctoken)
-            else:
-                kwargs = dict(Bucket=provider["bucket"], Prefix=provider.get("path_prefix", ""))
+                kwargs["ContinuationToken"] = ctoken
             response = client.list_objects_v2(**kwargs)
-            try:
-                content = response["Contents"]
-            except KeyError:
-                pass
-            else:
-                for c in content:
-                    key = c["Key"]
-                    if accept_key(key):
-                        yield key
+            yield response
             ctoken = response.get("NextContinuationToken", None)
             if not ctoken:
                 break
 
-    def filepath_iterator(self) -> Iterator[str]:
+    def _list_objects(self, client, prefix: str) -> Iterator[Mapping[str, Any]]:
         """
-        See _list_bucket() for logic of interacting with S3
+        :yield: each object under prefix, page by page as they are listed
+        """
+        for response in self._list_pages(client, prefix):
+            yield from response.get("Contents", [])
 
-        :yield: url filepath to use in S3File()
+    def _list_objects_concurrently(self, client, prefix: str, max_concurrent_listings: int) -> Iterator[Mapping[str, Any]]:
+        """
+        Lists prefix with a "/" delimiter, yielding the objects at its top level as they are listed,
+        then lists the objects under each common prefix (i.e. folder) found on up to max_concurrent_listings threads.
+
+        :yield: each object under prefix, folder by folder in the order the folders were listed
+        """
+        common_prefixes = []
+        for response in self._list_pages(client, prefix, delimiter="/"):
+            yield from response.get("Contents", [])
+            common_prefixes.extend(common_prefix["Prefix"] for common_prefix in response.get("CommonPrefixes", []))
+        if not common_prefixes:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrent_listings)
+        futures = [executor.submit(lambda p: list(self._list_objects(client, p)), common_prefix) for common_prefix in common_prefixes]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            # e.g: the caller only needed the first objects, don't list the remaining folders
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _list_bucket(self, accept_key=lambda k: True) -> Iterator[Mapping[str, Any]]:
+        """
+        Lists the objects under path_prefix, filtered by lambda func, with or without credentials.
+        Objects are yielded as they are listed, so a caller only needing the first objects only sends the first requests.
+        With max_concurrent_listings above 1, the bucket is first listed with a "/" delimiter, then the objects under each
+        common prefix (i.e. folder) found are listed concurrently, see _list_objects_concurrently().
+
+        :param accept_key: lambda function to allow filtering return keys, e.g. lambda k: not k.endswith('/'), defaults to lambda k: True
+        :yield: each object as returned by list_objects_v2, including its Key, LastModified, Size and ETag
+        """
+        client = self._make_client()
+        prefix = self._provider.get("path_prefix") or ""
+        max_concurrent_listings = self._provider.get("max_concurrent_listings") or 1
+
+        if max_concurrent_listings <= 1:
+            objects = self._list_objects(client, prefix)
+        else:
+            objects = self._list_objects_concurrently(client, prefix, max_concurrent_listings)
+
+        for content in objects:
+            if accept_key(content["Key"]):
+                yield content
+
+    def file_metadata_iterator(self) -> Iterator[Tuple[str, Optional[Mapping[str, Any]]]]:
+        """
+        The listing already holds the last modified date of each object, so no request is sent per file to get it.
+
+        :yield: tuples of (key, metadata) of each object
         """
         prefix = self._provider.get("path_prefix")
         if prefix is None:
@@ -73,4 +124,14 @@ class IncrementalFileStreamS3(IncrementalFileStream):
         msg = f"Iterating S3 bucket '{self._provider['bucket']}'"
         self.logger.info(msg + f" with prefix: '{prefix}' " if prefix != "" else msg)
 
-        yield from self._list_bucket(accept_key=lambda k: not k.endswith("/"))
+        for content in self._list_bucket(accept_key=lambda k: not k.endswith("/")):
+            yield content["Key"], {"last_modified": content["LastModified"], "size": content["Size"], "etag": content["ETag"]}
+
+    def filepath_iterator(self) -> Iterator[str]:
+        """
+        See _list_bucket() for logic of interacting with S3
+
+        :yield: url filepath to use in S3File()
+        """
+        for filepath, _ in self.file_metadata_iterator():
+            yield filepath
@@ -0,0 +1,75 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+
+import pytest
+from source_s3.source_files_abstract.file_read_ahead import FileReadAhead
+
+
+def file_info(index: int):
+    return {"unique_url": f"file_{index}", "index": index}
+
+
+def test_records_in_submission_order():
+    def read_file(info):
+        # later files are faster, so they complete before the earlier ones
+        time.sleep(0.01 * (5 - info["index"]))
+        for i in range(25):
+            yield {"file": info["index"], "row": i}
+
+    read_ahead = FileReadAhead(read_file, max_workers=3, batch_size=10)
+    files = [file_info(i) for i in range(5)]
+    for info in files:
+        assert read_ahead.submit(info)
+    assert not read_ahead.submit(files[0])
+
+    records = [record for info in files for record in read_ahead.records(info)]
+    read_ahead.close()
+
+    assert records == [{"file": f, "row": i} for f in range(5) for i in range(25)]
+    assert read_ahead.pending == 0
+
+
+def test_buffer_is_bounded():
+    produced = []
+
+    def read_file(info):
+        for i in range(1000):
+            produced.append(i)
+            yield {"row": i}
+
+    read_ahead = FileReadAhead(read_file, max_workers=1, batch_size=10, max_buffered_batches=2)
+    read_ahead.submit(file_info(0))
+    time.sleep(0.3)
+
+    # 2 batches waiting in the buffer, plus the one the worker is blocked on
+    assert len(produced) <= 30
+    read_ahead.close()
+
+
+def test_error_is_raised_to_consumer():
+    def read_file(info):
+        yield {"row": 0}
+        raise ValueError("broken file")
+
+    read_ahead = FileReadAhead(read_file, max_workers=2, batch_size=1)
+    with pytest.raises(ValueError, match="broken file"):
+        list(read_ahead.records(file_info(0)))
+    read_ahead.close()
+
+
+def test_close_stops_blocked_workers():
+    def read_file(info):
+        while True:
+            yield {"row": 0}
+
+    read_ahead = FileReadAhead(read_file, max_workers=2, batch_size=1, max_buffered_batches=1)
+    read_ahead.submit(file_info(0))
+    read_ahead.submit(file_info(1))
+    closer = threading.Thread(target=read_ahead.close)
+    closer.start()
+    closer.join(timeout=5)
+    assert not closer.is_alive()
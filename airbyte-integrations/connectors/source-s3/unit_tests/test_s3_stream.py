@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from source_s3.s3file import S3File
+from source_s3.stream import IncrementalFileStreamS3
+
+START = datetime(2021, 1, 1, tzinfo=timezone.utc)
+KEYS = ["top.csv", "a/1.csv", "a/2.csv", "a/nested/3.csv", "b/4.csv", "b/", "c/5.json"]
+
+
+class FakeS3Client:
+    """Answers list_objects_v2 from KEYS, two objects per page"""
+
+    page_size = 2
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def list_objects_v2(self, Bucket, Prefix, Delimiter=None, ContinuationToken=None):
+        with self._lock:
+            self.requests.append(Prefix)
+        entries = []
+        for index, key in enumerate(sorted(KEYS)):
+            if not key.startswith(Prefix):
+                continue
+            if Delimiter and Delimiter in key[len(Prefix) :]:
+                common_prefix = key[: len(Prefix) + key[len(Prefix) :].index(Delimiter) + 1]
+                entry = ("CommonPrefixes", {"Prefix": common_prefix})
+            else:
+                entry = ("Contents", {"Key": key, "LastModified": START + timedelta(minutes=index), "Size": index, "ETag": f'"{key}"'})
+            if entry not in entries:
+                entries.append(entry)
+
+        start = int(ContinuationToken or 0)
+        response = {}
+        for name, value in entries[start : start + self.page_size]:
+            response.setdefault(name, []).append(value)
+        if start + self.page_size < len(entries):
+            response["NextContinuationToken"] = str(start + self.page_size)
+        return response
+
+
+class TestIncrementalFileStreamS3:
+    @pytest.mark.parametrize("max_concurrent_listings", [1, 4])
+    def test_time_ordered_filepaths_from_listing(self, max_concurrent_listings):
+        provider = {"bucket": "dummy", "path_prefix": "", "max_concurrent_listings": max_concurrent_listings}
+        fs = IncrementalFileStreamS3(dataset="dummy", provider=provider, format={"filetype": "csv"}, path_pattern="**/*.csv")
+        client = FakeS3Client()
+        with patch.object(IncrementalFileStreamS3, "_make_client", return_value=client), patch.object(
+            S3File, "last_modified", new_callable=PropertyMock, side_effect=AssertionError("last_modified requested per file")
+        ):
+            time_ordered_filepaths = fs.get_time_ordered_filepaths()
+
+        csv_keys = sorted(key for key in KEYS if key.endswith(".csv"))
+        assert time_ordered_filepaths == [(START + timedelta(minutes=sorted(KEYS).index(key)), key) for key in csv_keys]
+        assert fs._file_metadata["a/1.csv"] == {"last_modified": START, "size": 0, "etag": '"a/1.csv"'}
+        if max_concurrent_listings > 1:
+            # the folders found by the delimited listing are listed on their own
+            assert sorted(set(client.requests)) == ["", "a/", "b/", "c/"]
+        else:
+            assert set(client.requests) == {""}
+
+    @pytest.mark.parametrize("max_concurrent_listings", [1, 4])
+    def test_first_file_lists_first_page_only(self, max_concurrent_listings):
+        provider = {"bucket": "dummy", "path_prefix": "", "max_concurrent_listings": max_concurrent_listings}
+        fs = IncrementalFileStreamS3(dataset="dummy", provider=provider, format={"filetype": "csv"}, path_pattern="**/*.csv")
+        client = FakeS3Client()
+        with patch.object(IncrementalFileStreamS3, "_make_client", return_value=client):
+            # as done by check_connection
+            filepath = next(fs.filepath_iterator())
+
+        if max_concurrent_listings > 1:
+            # objects at the top level are yielded before any folder is listed
+            assert filepath == "top.csv"
+            assert set(client.requests) == {""}
+        else:
+            assert filepath == "a/1.csv"
+            assert client.requests == [""]
@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+from source_s3.source_files_abstract.schema_cache import SchemaInferenceCache
+
+
+class TestSchemaInferenceCache:
+    def test_roundtrip(self, tmp_path):
+        path = str(tmp_path / "cache.json")
+        cache = SchemaInferenceCache(path, scope="scope")
+        assert cache.get("a.csv", "v1") is None
+        cache.set("a.csv", "v1", {"id": "integer"})
+        cache.save()
+
+        cache = SchemaInferenceCache(path, scope="scope")
+        assert len(cache) == 1
+        assert cache.get("a.csv", "v1") == {"id": "integer"}
+        # the file changed since its schema was inferred
+        assert cache.get("a.csv", "v2") is None
+
+    def test_entries_dropped_when_scope_changed(self, tmp_path):
+        path = str(tmp_path / "cache.json")
+        cache = SchemaInferenceCache(path, scope="scope")
+        cache.set("a.csv", "v1", {"id": "integer"})
+        cache.save()
+
+        cache = SchemaInferenceCache(path, scope="other scope")
+        assert len(cache) == 0
+        assert cache.get("a.csv", "v1") is None
+
+    def test_unreadable_cache_ignored(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+        cache = SchemaInferenceCache(str(path), scope="scope")
+        assert len(cache) == 0
+
+        cache.set("a.csv", "v1", {"id": "integer"})
+        cache.save()
+        assert json.loads(path.read_text()) == {"scope": "scope", "files": {"a.csv": {"fingerprint": "v1", "schema": {"id": "integer"}}}}
+
+    def test_save_only_when_changed(self, tmp_path):
+        path = tmp_path / "cache.json"
+        SchemaInferenceCache(str(path), scope="scope").save()
+        assert not path.exists()
+
+    def test_prune(self, tmp_path):
+        path = str(tmp_path / "cache.json")
+        cache = SchemaInferenceCache(path, scope="scope")
+        cache.set("a.csv", "v1", {"id": "integer"})
+        cache.set("b.csv", "v1", {"id": "integer"})
+        cache.save()
+
+        cache = SchemaInferenceCache(path, scope="scope")
+        cache.prune(["b.csv", "c.csv"])
+        cache.save()
+        assert len(SchemaInferenceCache(path, scope="scope")) == 1
+
+    def test_without_path_kept_in_memory(self, tmp_path):
+        cache = SchemaInferenceCache(None, scope="scope")
+        cache.set("a.csv", "v1", {"id": "integer"})
+        cache.save()
+        assert cache.get("a.csv", "v1") == {"id": "integer"}
+        assert list(tmp_path.iterdir()) == []
@@ -2,10 +2,15 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
 from unittest.mock import patch
 
 import pytest
 from airbyte_cdk import AirbyteLogger
+from airbyte_cdk.models import SyncMode
 from source_s3.source_files_abstract.stream import FileStream
 
 LOGGER = AirbyteLogger()
@@ -92,13 +97,14 @@ class TestFileStream:
     @patch(
         "source_s3.source_files_abstract.stream.FileStream.__abstractmethods__", set()
     )  # patching abstractmethods to empty set so we can instantiate ABC to test
-    def test_match_target_schema(self, target_columns, record, expected_return_record):
+    def test_records_from_batch_match_target_schema(self, target_columns, record, expected_return_record):
         fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern=[])
+        batch = {column: [value, value] for column, value in record.items()}
         if expected_return_record is not None:
-            assert fs._match_target_schema(record, target_columns) == expected_return_record
+            assert list(fs._records_from_batch(batch, target_columns, {})) == [expected_return_record, expected_return_record]
         else:
             with pytest.raises(Exception) as e_info:
-                fs._match_target_schema(record, target_columns)
+                list(fs._records_from_batch(batch, target_columns, {}))
                 LOGGER.debug(str(e_info))
 
     @pytest.mark.parametrize(  # set expected_return_record to None for an expected fail
@@ -124,13 +130,15 @@ class TestFileStream:
     @patch(
         "source_s3.source_files_abstract.stream.FileStream.__abstractmethods__", set()
     )  # patching abstractmethods to empty set so we can instantiate ABC to test
-    def test_add_extra_fields_from_map(self, extra_map, record, expected_return_record):
+    def test_records_from_batch_add_extra_fields_from_map(self, extra_map, record, expected_return_record):
         fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern=[])
+        batch = {column: [value] for column, value in record.items()}
         if expected_return_record is not None:
-            assert fs._add_extra_fields_from_map(record, extra_map) == expected_return_record
+            expected_return_record = {**expected_return_record, "_ab_additional_properties": {}}
+            assert list(fs._records_from_batch(batch, list(record.keys()), extra_map)) == [expected_return_record]
         else:
             with pytest.raises(Exception) as e_info:
-                fs._add_extra_fields_from_map(record, extra_map)
+                list(fs._records_from_batch(batch, list(record.keys()), extra_map))
                 LOGGER.debug(str(e_info))
 
     @pytest.mark.parametrize(  #
@@ -298,3 +306,87 @@ class TestFileStream:
     def test_pattern_matched_filepath_iterator(self, patterns, filepaths, expected_filepaths):
         fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern=patterns)
         assert set([p for p in fs.pattern_matched_filepath_iterator(filepaths)]) == set(expected_filepaths)
+
+    @pytest.mark.parametrize("max_concurrent_files", [1, 3])
+    @patch(
+        "source_s3.source_files_abstract.stream.FileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_read_slices_in_last_modified_order(self, max_concurrent_files):
+        class LocalFile:
+            def __init__(self, url, provider):
+                self.url = url
+
+            @contextmanager
+            def open(self, binary):
+                yield BytesIO("\n".join(f"{self.url},{i}" for i in range(50)).encode())
+
+        class LineParser:
+            is_binary = True
+
+            def stream_batches(self, f):
+                rows = [line.decode().strip().split(",") for line in f]
+                yield {"name": [name for name, _ in rows], "row": [int(row) for _, row in rows]}
+
+        start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        filepaths = [(start + timedelta(minutes=i), f"file_{i}.csv") for i in range(10)]
+
+        fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern="**", max_concurrent_files=max_concurrent_files)
+        fs._schema = {"name": "string", "row": "integer"}
+        with patch.object(FileStream, "storagefile_class", LocalFile), patch.object(
+            FileStream, "get_time_ordered_filepaths", return_value=filepaths
+        ):
+            records = []
+            for stream_slice in fs.stream_slices(sync_mode=SyncMode.full_refresh):
+                records.extend(fs._read_from_slice(LineParser(), stream_slice))
+
+        assert [(record["name"], record["row"]) for record in records] == [(f"file_{f}.csv", i) for f in range(10) for i in range(50)]
+        assert records[-1]["_ab_source_file_url"] == "file_9.csv"
+        assert fs._file_read_ahead is None
+
+    @patch(
+        "source_s3.source_files_abstract.stream.FileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_master_schema_inferred_from_changed_files_only(self, tmp_path):
+        opened = []
+
+        class LocalFile:
+            def __init__(self, url, provider):
+                self.url = url
+
+            @contextmanager
+            def open(self, binary):
+                opened.append(self.url)
+                yield BytesIO(self.url.encode())
+
+        class ColumnParser:
+            is_binary = True
+
+            def __init__(self, format):
+                pass
+
+            def get_inferred_schema(self, f):
+                return {f.read().decode().split(".")[0]: "string"}
+
+        start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        filepaths = [(start, "a.csv"), (start, "b.csv")]
+
+        def master_schema():
+            fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern="**", schema_cache_path=str(tmp_path / "cache"))
+            with patch.object(FileStream, "storagefile_class", LocalFile), patch.object(
+                FileStream, "fileformatparser_class", ColumnParser
+            ), patch.object(FileStream, "get_time_ordered_filepaths", return_value=filepaths):
+                return fs._get_master_schema()
+
+        assert master_schema() == {"a": "string", "b": "string"}
+        assert opened == ["a.csv", "b.csv"]
+
+        filepaths[1] = (start + timedelta(days=1), "b.csv")
+        filepaths.append((start, "c.csv"))
+        assert master_schema() == {"a": "string", "b": "string", "c": "string"}
+        assert opened == ["a.csv", "b.csv", "b.csv", "c.csv"]
+
+        # the entries of files which are no longer listed are dropped
+        del filepaths[0]
+        assert master_schema() == {"b": "string", "c": "string"}
+        (cache_file,) = (tmp_path / "cache").iterdir()
+        assert set(json.loads(cache_file.read_text())["files"]) == {"b.csv", "c.csv"}
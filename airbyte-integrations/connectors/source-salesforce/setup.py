@@ -5,7 +5,7 @@
 
 from setuptools import find_packages, setup
 
-MAIN_REQUIREMENTS = ["airbyte-cdk", "vcrpy==4.1.1"]
+MAIN_REQUIREMENTS = ["airbyte-cdk~=0.1.50", "vcrpy==4.1.1"]
 
 TEST_REQUIREMENTS = ["pytest~=6.1", "source-acceptance-test", "requests_mock", "pytest-timeout"]
 
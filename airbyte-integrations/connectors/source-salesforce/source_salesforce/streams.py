@@ -2,15 +2,18 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
 import math
 import time
 from abc import ABC
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from contextlib import closing
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import pendulum
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams import AsyncJobStatus, AsyncJobStream
 from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from pendulum import DateTime
@@ -104,6 +107,10 @@ class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT_MINS = 10
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    # Size of the chunks job results are downloaded in
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    # Maximum number of records of one result set of a job, None to let Salesforce decide
+    RESULTS_MAX_RECORDS = None
 
     def __init__(self, wait_timeout: Optional[int], **kwargs):
         super().__init__(**kwargs)
@@ -125,9 +132,9 @@ class BulkSalesforceStream(SalesforceStream):
         return instance
 
     @default_backoff_handler(max_tries=5, factor=15)
-    def _send_http_request(self, method: str, url: str, json: dict = None):
+    def _send_http_request(self, method: str, url: str, json: dict = None, params: dict = None, stream: bool = False):
         headers = self.authenticator.get_auth_header()
-        response = self._session.request(method, url=url, headers=headers, json=json)
+        response = self._session.request(method, url=url, headers=headers, json=json, params=params, stream=stream)
         response.raise_for_status()
         return response
 
@@ -206,15 +213,50 @@ class BulkSalesforceStream(SalesforceStream):
             raise Exception(f"Job for {self.name} stream using BULK API was failed.")
         return job_full_url
 
-    def download_data(self, url: str) -> Tuple[int, dict]:
-        job_data = self._send_http_request("GET", f"{url}/results")
-        decoded_content = job_data.content.decode("utf-8")
-        csv_data = csv.reader(decoded_content.splitlines(), delimiter=",")
-        for i, row in enumerate(csv_data):
-            if i == 0:
-                head = row
-            else:
-                yield i, dict(zip(head, row))
+    @staticmethod
+    def _iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+        """
+        Decodes the chunks of a CSV result into lines, keeping the line endings so csv.reader keeps line breaks inside quoted values.
+        Jobs are created with the LF line ending.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+        for chunk in chunks:
+            pending += decoder.decode(chunk)
+            lines = pending.split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    def download_data(self, url: str) -> Iterator[Tuple[int, dict]]:
+        """
+        Streams the results of the job and yields the records as they are downloaded, so memory use does not depend on the result size.
+        Large results are split by Salesforce into several result sets, the Sforce-Locator header of a result set locates the next one.
+        docs: https://developer.salesforce.com/docs/atlas.en-us.api_asynch.meta/api_asynch/query_get_job_results.htm
+        :return: the number of records downloaded so far with each record
+        """
+        count = 0
+        locator = None
+        while True:
+            params = {}
+            if locator:
+                params["locator"] = locator
+            if self.RESULTS_MAX_RECORDS:
+                params["maxRecords"] = self.RESULTS_MAX_RECORDS
+            response = self._send_http_request("GET", f"{url}/results", params=params, stream=True)
+            with closing(response):
+                csv_data = csv.reader(self._iter_lines(response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE)), delimiter=",")
+                head = next(csv_data, None)
+                for row in csv_data:
+                    count += 1
+                    yield count, dict(zip(head, row))
+
+            locator = response.headers.get("Sforce-Locator")
+            if not locator or locator == "null":
+                break
 
     def abort_job(self, url: str):
         data = {"state": "Aborted"}
@@ -317,7 +359,148 @@ class IncrementalSalesforceStream(SalesforceStream, ABC):
         return {self.cursor_field: latest_benchmark}
 
 
-class BulkIncrementalSalesforceStream(BulkSalesforceStream, IncrementalSalesforceStream):
+class BulkIncrementalSalesforceStream(BulkSalesforceStream, IncrementalSalesforceStream, AsyncJobStream):
+    """
+    Splits the replication period of large objects into cursor ranges and reads each range with its own bulk job, several jobs running
+    at the same time. The number of ranges follows the number of records to read, so small objects are still read with one job and the
+    daily bulk limits are not spent on empty ranges. The result of each job is streamed as soon as it completes while the jobs of later
+    ranges keep running, and records and state are emitted in range order so the state only covers contiguous completed ranges.
+    """
+
+    DEFAULT_MAX_CONCURRENT_JOBS = 5
+    # Objects with more records to read than this are split into ranges of about that many records, each one read by its own job
+    RECORDS_PER_JOB = 1000000
+
+    min_poll_interval_seconds = 0.5
+    max_poll_interval_seconds = 10
+
+    def __init__(self, max_concurrent_jobs: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.max_concurrent_jobs = max_concurrent_jobs or self.DEFAULT_MAX_CONCURRENT_JOBS
+        self._job_started_at = {}
+        # set once the BULK API rejected the object, so the jobs of the remaining slices are not attempted
+        self._bulk_unsupported = False
+
     def next_page_token(self, last_record: dict) -> str:
         if self.name not in UNSUPPORTED_FILTERING_STREAMS:
             return last_record[self.cursor_field]
+
+    def stream_slices(
+        self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        start = (stream_state or {}).get(self.cursor_field) or self.start_date
+        if not start:
+            # Without a lower bound the whole object is read by one job
+            yield {}
+            return
+
+        start, now = pendulum.parse(start), pendulum.now(tz="UTC")
+        record_count = self.count_records(start.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        jobs = max(1, math.ceil(record_count / self.RECORDS_PER_JOB)) if record_count else 1
+        # Ranges have the same length, records being assumed to be spread evenly over the replication period
+        step = pendulum.duration(seconds=(now - start).total_seconds() / jobs)
+        for job in range(jobs):
+            end = now if job == jobs - 1 else start + step
+            yield {"start_date": start.strftime("%Y-%m-%dT%H:%M:%SZ"), "end_date": end.strftime("%Y-%m-%dT%H:%M:%SZ")}
+            start = end
+
+    def count_records(self, start_date: str) -> Optional[int]:
+        """
+        Counts the records to read with a REST query, which does not count against the bulk limits.
+        :return: the number of records with a cursor value from start_date on, None if they could not be counted
+        """
+        url = f"{self.url_base}/services/data/{self.sf_api.version}/queryAll"
+        query = f"SELECT COUNT() FROM {self.name} WHERE {self.cursor_field} >= {start_date}"
+        try:
+            return self._send_http_request("GET", url=url, params={"q": query}).json()["totalSize"]
+        except exceptions.HTTPError as error:
+            self.logger.warning(f"Cannot count the records of stream '{self.name}', reading it with one job: {error}")
+            return None
+
+    def request_params(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> MutableMapping[str, Any]:
+        if not stream_slice:
+            return super().request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+
+        # Results of a job are streamed in result sets, so a range does not need to be read in pages
+        selected_properties = {
+            key: value
+            for key, value in self.get_json_schema().get("properties", {}).items()
+            if value.get("format") != "base64" and "object" not in value["type"]
+        }
+        query = (
+            f"SELECT {','.join(selected_properties.keys())} FROM {self.name} "
+            f"WHERE {self.cursor_field} >= {stream_slice['start_date']} AND {self.cursor_field} < {stream_slice['end_date']} "
+            f"ORDER BY {self.cursor_field} ASC"
+        )
+        return {"q": query}
+
+    def create_job(self, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]) -> Optional[str]:
+        if self._bulk_unsupported:
+            return None
+        params = self.request_params(stream_state=stream_state, stream_slice=stream_slice)
+        url = f"{self.url_base}{self.path()}"
+        job_id = self.create_stream_job(query=params["q"], url=url)
+        if not job_id:
+            self._bulk_unsupported = True
+            return None
+        job_full_url = f"{url}/{job_id}"
+        self._job_started_at[job_full_url] = time.monotonic()
+        return job_full_url
+
+    def check_job_status(self, job: Optional[str]) -> AsyncJobStatus:
+        if not job:
+            # the stream is not supported by the BULK API, nothing to read
+            return AsyncJobStatus.COMPLETED
+
+        job_info = self._send_http_request("GET", url=job).json()
+        job_status = job_info["state"]
+        if job_status == "JobComplete":
+            return AsyncJobStatus.COMPLETED
+        if job_status in ["Aborted", "Failed"]:
+            self.logger.error(f"Job {job} of stream {self.name} failed: {job_info}")
+            self.delete_job(url=job)
+            self._job_started_at.pop(job)
+            return AsyncJobStatus.FAILED
+        if time.monotonic() - self._job_started_at[job] > self._wait_timeout * 60.0:
+            self.logger.error(f"Not wait the {self.name} data for {self._wait_timeout} minutes, data: {job_info}!!")
+            self.abort_job(url=job)
+            self._job_started_at.pop(job)
+            return AsyncJobStatus.FAILED
+        return AsyncJobStatus.RUNNING
+
+    def cancel_job(self, job: Optional[str]):
+        if not job:
+            return
+        self._job_started_at.pop(job, None)
+        job_status = self._send_http_request("GET", url=job).json()["state"]
+        if job_status not in ["JobComplete", "Aborted", "Failed"]:
+            self.abort_job(url=job)
+        self.delete_job(url=job)
+
+    def read_job_records(
+        self, job: Optional[str], stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]
+    ) -> Iterable[Mapping[str, Any]]:
+        if not job:
+            return
+        for _, record in self.download_data(url=job):
+            yield record
+        self.delete_job(url=job)
+        self._job_started_at.pop(job, None)
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        if not stream_slice:
+            # the whole object is read in pages of one job each, one after another
+            return super().read_records(
+                sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+            )
+        return AsyncJobStream.read_records(
+            self, sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+        )
@@ -2,11 +2,14 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlparse
 
+import pendulum
 import pytest
 import requests_mock
-from airbyte_cdk.models import SyncMode
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode, Type
 from requests.exceptions import HTTPError
 from source_salesforce.api import Salesforce
 from source_salesforce.source import SourceSalesforce
@@ -151,6 +154,31 @@ def test_bulk_sync_unsupported_stream(stream_bulk_config, stream_bulk_api, caplo
         )
 
 
+def test_bulk_incremental_unsupported_stream_creates_one_job(stream_bulk_config, stream_bulk_api, caplog):
+    stream_name = "AcceptedEventRelation"
+    stream: BulkIncrementalSalesforceStream = _generate_stream(stream_name, stream_bulk_config, stream_bulk_api)
+    start = pendulum.now(tz="UTC").subtract(days=65)
+    stream_state = {stream.cursor_field: start.strftime("%Y-%m-%dT%H:%M:%SZ")}
+    stream.RECORDS_PER_JOB = 10
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", stream.url_base + "/services/data/v52.0/queryAll", json={"totalSize": 30})
+        m.register_uri(
+            "POST",
+            stream.path(),
+            status_code=400,
+            json=[{"errorCode": "INVALIDENTITY", "message": f"Entity '{stream_name}' is not supported by the Bulk API."}],
+        )
+        jobs = [
+            stream.create_job(stream_slice=stream_slice, stream_state=stream_state)
+            for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental, stream_state=stream_state)
+        ]
+
+    assert jobs == [None, None, None]
+    # the job creation and its error are not repeated for the remaining slices
+    assert [request.method for request in m.request_history] == ["GET", "POST"]
+    assert len([record for record in caplog.records if record.msg.startswith(f"Cannot receive data for stream '{stream_name}'")]) == 1
+
+
 @pytest.mark.parametrize("item_number", [0, 15, 2000, 2324, 193434])
 def test_bulk_sync_pagination(item_number, stream_bulk_config, stream_bulk_api):
     stream: BulkIncrementalSalesforceStream = _generate_stream("Account", stream_bulk_config, stream_bulk_api)
@@ -241,6 +269,126 @@ def test_bulk_sync_failed_retry(stream_bulk_config, stream_bulk_api):
         assert "stream using BULK API was failed" in str(err.value)
 
 
+def test_bulk_download_follows_result_locators(stream_bulk_config, stream_bulk_api):
+    stream: BulkIncrementalSalesforceStream = _generate_stream("Account", stream_bulk_config, stream_bulk_api)
+    job_url = f"{stream.url_base}{stream.path()}/fake_job_1"
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", job_url + "/results?maxRecords=2", text="ID,Name\n1,a\n2,b\n", headers={"Sforce-Locator": "MTAwMDA"})
+        m.register_uri("GET", job_url + "/results?locator=MTAwMDA&maxRecords=2", text="ID,Name\n3,c\n", headers={"Sforce-Locator": "null"})
+        stream.RESULTS_MAX_RECORDS = 2
+
+        records = list(stream.download_data(url=job_url))
+
+    assert records == [(1, {"ID": "1", "Name": "a"}), (2, {"ID": "2", "Name": "b"}), (3, {"ID": "3", "Name": "c"})]
+    assert [r.qs.get("locator") for r in m.request_history] == [None, ["mtawmda"]]
+
+
+def test_bulk_download_decodes_chunks(stream_bulk_config, stream_bulk_api):
+    stream: BulkIncrementalSalesforceStream = _generate_stream("Account", stream_bulk_config, stream_bulk_api)
+    job_url = f"{stream.url_base}{stream.path()}/fake_job_1"
+    content = 'ID,Name\n1,"multi\nline"\n2,żółć\n'.encode("utf-8")
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", job_url + "/results", content=content)
+        # Chunks split lines and multi-byte characters
+        stream.DOWNLOAD_CHUNK_SIZE = 3
+
+        records = [record for _, record in stream.download_data(url=job_url)]
+
+    assert records == [{"ID": "1", "Name": "multi\nline"}, {"ID": "2", "Name": "żółć"}]
+
+
+@pytest.mark.parametrize(
+    "count_response,expected_slices",
+    [
+        ({"json": {"totalSize": 25}}, 3),
+        ({"json": {"totalSize": 10}}, 1),
+        ({"json": {"totalSize": 0}}, 1),
+        ({"status_code": 400, "json": [{"errorCode": "MALFORMED_QUERY", "message": "COUNT() not supported"}]}, 1),
+    ],
+)
+def test_bulk_incremental_stream_slices(count_response, expected_slices, stream_bulk_config, stream_bulk_api):
+    stream: BulkIncrementalSalesforceStream = _generate_stream("Account", stream_bulk_config, stream_bulk_api)
+    stream.RECORDS_PER_JOB = 10
+    start = pendulum.now(tz="UTC").subtract(days=65)
+    stream_state = {stream.cursor_field: start.strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", stream.url_base + "/services/data/v52.0/queryAll", **count_response)
+        slices = list(stream.stream_slices(sync_mode=SyncMode.incremental, stream_state=stream_state))
+
+    count_query = parse_qs(urlparse(m.last_request.url).query)["q"][0]
+    assert count_query == f"SELECT COUNT() FROM Account WHERE LastModifiedDate >= {stream_state[stream.cursor_field]}"
+    # the number of ranges follows the number of records to read
+    assert len(slices) == expected_slices
+    assert slices[-1]["end_date"] >= pendulum.now(tz="UTC").subtract(minutes=1).strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert slices[0]["start_date"] == stream_state[stream.cursor_field]
+    assert all(previous["end_date"] == following["start_date"] for previous, following in zip(slices, slices[1:]))
+    query = stream.request_params(stream_state=stream_state, stream_slice=slices[-1])["q"]
+    assert f"WHERE LastModifiedDate >= {slices[-1]['start_date']} AND LastModifiedDate < {slices[-1]['end_date']} " in query
+    assert "LIMIT" not in query
+
+
+def test_bulk_incremental_stream_without_start_date_reads_one_slice(stream_bulk_config_without_start_date, stream_bulk_api):
+    stream: BulkIncrementalSalesforceStream = _generate_stream("Account", stream_bulk_config_without_start_date, stream_bulk_api)
+    assert list(stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={})) == [{}]
+
+
+def test_bulk_incremental_jobs_run_concurrently(stream_bulk_config, stream_bulk_api):
+    stream: BulkIncrementalSalesforceStream = _generate_stream("Account", stream_bulk_config, stream_bulk_api)
+    stream.min_poll_interval_seconds = 0
+    start = pendulum.now(tz="UTC").subtract(days=65)
+    stream.RECORDS_PER_JOB = 1
+    state = {"Account": {stream.cursor_field: start.strftime("%Y-%m-%dT%H:%M:%SZ")}}
+    # one record per slice
+    cursor_values = [start.add(days=30 * i + 1).strftime("%Y-%m-%dT%H:%M:%SZ") for i in range(3)]
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="Account", json_schema={}, supported_sync_modes=[SyncMode.incremental]),
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    with requests_mock.Mocker() as m, patch.object(SourceSalesforce, "streams", return_value=[stream]):
+        m.register_uri("GET", stream.url_base + "/services/data/v52.0/queryAll", json={"totalSize": 3})
+        m.register_uri("POST", stream.path(), [{"json": {"id": f"job_{i}"}} for i in range(3)])
+        # the first job is the slowest
+        m.register_uri("GET", stream.path() + "/job_0", [{"json": {"state": "InProgress"}}] * 2 + [{"json": {"state": "JobComplete"}}])
+        for i in range(3):
+            if i:
+                m.register_uri("GET", stream.path() + f"/job_{i}", json={"state": "JobComplete"})
+            m.register_uri("GET", stream.path() + f"/job_{i}/results", text=f"Id,LastModifiedDate\n{i},{cursor_values[i]}")
+            m.register_uri("DELETE", stream.path() + f"/job_{i}")
+
+        messages = list(SourceSalesforce().read(AirbyteLogger(), stream_bulk_config, catalog, state=state))
+
+    requests = [(r.method, r.path.rsplit("/", 1)[-1]) for r in m.request_history]
+    # all jobs are created before the results of the first one are downloaded
+    post_indexes = [index for index, request in enumerate(requests) if request[0] == "POST"]
+    assert len(post_indexes) == 3
+    assert post_indexes[-1] < requests.index(("GET", "results"))
+    records = [message.record.data["Id"] for message in messages if message.type == Type.RECORD]
+    states = [message.state.data["Account"][stream.cursor_field] for message in messages if message.type == Type.STATE]
+    assert records == ["0", "1", "2"]
+    assert states == cursor_values
+
+
+@pytest.mark.parametrize("job_state,aborted", [("InProgress", True), ("JobComplete", False)])
+def test_bulk_incremental_cancel_job(job_state, aborted, stream_bulk_config, stream_bulk_api):
+    stream: BulkIncrementalSalesforceStream = _generate_stream("Account", stream_bulk_config, stream_bulk_api)
+    job_url = f"{stream.url_base}{stream.path()}/job_0"
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", job_url, json={"state": job_state})
+        m.register_uri("PATCH", job_url)
+        m.register_uri("DELETE", job_url)
+
+        stream.cancel_job(job_url)
+
+    methods = [request.method for request in m.request_history]
+    assert methods == (["GET", "PATCH", "DELETE"] if aborted else ["GET", "DELETE"])
+
+
 @pytest.mark.parametrize(
     "api_type,start_date_provided,stream_name,expected_start_date",
     [
@@ -8,6 +8,7 @@ from typing import Any, List, Mapping, Tuple
 import requests
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.http import RateLimiter
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
 
 from .streams import (
@@ -84,6 +85,8 @@ class SourceZendeskSupport(AbstractSource):
             "subdomain": config["subdomain"],
             "start_date": config["start_date"],
             "authenticator": cls.get_authenticator(config),
+            # the rate limit is shared by all requests of an account, the limit of the account plan is followed with the response headers
+            "rate_limiter": RateLimiter(calls=700, period=60, remaining_header="X-Rate-Limit-Remaining"),
         }
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
@@ -6,9 +6,9 @@
 import calendar
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import deque
 from datetime import datetime
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Deque, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import parse_qsl, urlparse
 
 import pytz
@@ -370,11 +370,14 @@ class TicketComments(IncrementalSortedPageStream):
     response_list_name = "comments"
     cursor_field = IncrementalSortedPageStream.created_at_field
 
+    # comments of several tickets are loaded at the same time, they are still emitted in the ticket order
+    max_concurrent_slices = 10
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # need to save a slice ticket state
+        # the last end time of the tickets page of every slice which was not emitted yet
         # because the function get_updated_state doesn't have a stream_slice as argument
-        self._ticket_last_end_time = None
+        self._ticket_end_times: Deque[Tuple[int, int]] = deque()
 
     def path(self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         ticket_id = stream_slice["id"]
@@ -383,7 +386,7 @@ class TicketComments(IncrementalSortedPageStream):
     def stream_slices(
         self, sync_mode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
-        """Loads all updated tickets after last stream state"""
+        """Loads updated tickets after last stream state page by page, only the current page of tickets is kept in memory"""
         stream_state = stream_state or {}
         # convert a comment state value to a ticket one
         # tickets and comments have different cursor formats. For example:
@@ -395,49 +398,54 @@ class TicketComments(IncrementalSortedPageStream):
             # for backward compatibility because not all relevant states can have some last ticket state
             ticket_stream_value = self.str2unixtime(stream_state.get(self.cursor_field))
 
-        tickets_stream = Tickets(start_date=self._start_date, subdomain=self._subdomain, authenticator=self.authenticator)
-        ticket_pages = defaultdict(list)
-        last_end_time = stream_state.get(LAST_END_TIME_KEY, 0)
+        tickets_stream = Tickets(
+            start_date=self._start_date, subdomain=self._subdomain, authenticator=self.authenticator, rate_limiter=self.rate_limiter
+        )
+        # tickets' loading is implemented per page but the stream 'tickets' has
+        # the addl stream state fields "_last_end_time" and its value is not compatible
+        # with comments' cursor fields. Thus we need to save it separately: the tickets of a page
+        # are saved with the last end time of the previous page, so a failed sync loads the whole page again
+        previous_end_time = stream_state.get(LAST_END_TIME_KEY, 0)
+        page_end_time, page = None, []
         ticket_count = 0
+        self._ticket_end_times.clear()
         for ticket in tickets_stream.read_records(
             sync_mode=sync_mode,
             cursor_field=cursor_field,
-            stream_state={Tickets.cursor_field: ticket_stream_value, LAST_END_TIME_KEY: last_end_time},
+            stream_state={Tickets.cursor_field: ticket_stream_value, LAST_END_TIME_KEY: previous_end_time},
         ):
             if not ticket["comment_count"]:
                 # skip tickets without comments
                 continue
             ticket_count += 1
-            ticket_pages[tickets_stream.last_end_time].append(
-                {
-                    "id": ticket["id"],
-                    Tickets.cursor_field: ticket[Tickets.cursor_field],
-                }
-            )
-
-        if ticket_pages:
-            last_times = sorted(ticket_pages.keys())
-            # tickets' loading is implemented per page but the stream 'tickets' has
-            # the addl stream state fields "_last_end_time" and its value is not compatible
-            # with comments' cursor fields. Thus we need to save it separately and add
-            # last_end_time info for every slice
-            last_page = {last_times[-1]: [ticket_pages[last_times[-1]].pop(-1)]}
-
-            new_last_times = [last_end_time] + last_times[:-1]
-            ticket_pages = {new_last_times[i]: ticket_pages[last_times[i]] for i in range(len(last_times))}
-            ticket_pages.update(last_page)
-
+            if page and tickets_stream.last_end_time != page_end_time:
+                yield from self._page_slices(page, previous_end_time)
+                previous_end_time, page = page_end_time, []
+            page_end_time = tickets_stream.last_end_time
+            page.append({"id": ticket["id"], Tickets.cursor_field: ticket[Tickets.cursor_field]})
+
+        if page:
+            # the last ticket completes the loading so its slice is saved with the last end time
+            last_ticket = page.pop(-1)
+            yield from self._page_slices(page, previous_end_time)
+            yield from self._page_slices([last_ticket], page_end_time)
         self.logger.info(f"Found {ticket_count} ticket(s) with comments")
-        for end_time, tickets in sorted(ticket_pages.items(), key=lambda t: t[0]):
-            self._ticket_last_end_time = end_time
-            yield from sorted(tickets, key=lambda ticket: ticket[Tickets.cursor_field])
 
-    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
-        """Adds a last cursor ticket updated time for a comment state"""
-        new_state = super().get_updated_state(current_stream_state=current_stream_state, latest_record=latest_record)
-        if self._ticket_last_end_time:
+    def _page_slices(self, tickets: List[Mapping[str, Any]], end_time: int) -> Iterable[Mapping[str, Any]]:
+        for ticket in sorted(tickets, key=lambda ticket: ticket[Tickets.cursor_field]):
+            self._ticket_end_times.append((ticket["id"], end_time))
+            yield ticket
 
-            new_state[LAST_END_TIME_KEY] = self._ticket_last_end_time
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Adds the last end time of the tickets page of the latest comment to the comment state.
+        Comments are loaded concurrently so the cursor is taken from the emitted comments only
+        """
+        new_state = IncrementalEntityStream.get_updated_state(self, current_stream_state=current_stream_state, latest_record=latest_record)
+        # slices are emitted in order: drop the tickets before the one of the latest comment
+        while self._ticket_end_times and self._ticket_end_times[0][0] != latest_record["ticket_id"]:
+            self._ticket_end_times.popleft()
+        if self._ticket_end_times and self._ticket_end_times[0][1]:
+            new_state[LAST_END_TIME_KEY] = self._ticket_end_times[0][1]
         return new_state
 
     def parse_response(
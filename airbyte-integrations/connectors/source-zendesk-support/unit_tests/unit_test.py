@@ -147,3 +147,57 @@ def test_transform_for_tickets_stream(config, input_data, expected_data):
         records = source.read(MagicMock(), config, test_catalog, None)
         for record in records:
             assert record.record.data == expected_data
+
+
+def test_comments_of_ticket_pages(config):
+    """Checks that comments are read concurrently but emitted in the ticket order with the end time of their tickets page"""
+    test_catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="ticket_comments", json_schema={}),
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    ticket_pages = {
+        # start_time -> tickets page
+        1600000000: {
+            "tickets": [
+                {"id": 2, "generated_timestamp": 1600000200, "comment_count": 1},
+                {"id": 1, "generated_timestamp": 1600000100, "comment_count": 1},
+                {"id": 3, "generated_timestamp": 1600000300, "comment_count": 0},
+            ],
+            "end_time": 1600000300,
+            "end_of_stream": False,
+        },
+        1600000300: {
+            "tickets": [
+                {"id": 4, "generated_timestamp": 1600000400, "comment_count": 1},
+                {"id": 5, "generated_timestamp": 1600000500, "comment_count": 1},
+            ],
+            "end_time": 1600000500,
+            "end_of_stream": True,
+        },
+    }
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            f"https://{config['subdomain']}.zendesk.com/api/v2/incremental/tickets.json",
+            json=lambda request, context: ticket_pages[int(request.qs["start_time"][0])],
+        )
+        for ticket_id in range(1, 6):
+            m.get(
+                f"https://{config['subdomain']}.zendesk.com/api/v2/tickets/{ticket_id}/comments.json",
+                json={"comments": [{"id": ticket_id * 10, "created_at": f"2020-09-1{ticket_id}T00:00:00Z"}]},
+            )
+
+        source = SourceZendeskSupport()
+        messages = list(source.read(MagicMock(), config, test_catalog, {"ticket_comments": {"_last_end_time": 1600000000}}))
+
+    records = [message.record.data for message in messages if message.record]
+    states = [message.state.data["ticket_comments"] for message in messages if message.state]
+    assert [record["ticket_id"] for record in records] == [1, 2, 4, 5]
+    # the tickets of a page are saved with the end time of the previous page, the last ticket with the last end time
+    assert [state["_last_end_time"] for state in states] == [1600000000, 1600000000, 1600000300, 1600000500]
+    assert states[-1]["created_at"] == "2020-09-15T00:00:00Z"